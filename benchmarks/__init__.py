@@ -0,0 +1 @@
+"""Offline benchmarks for the wake_up_alarm integration."""
@@ -0,0 +1,167 @@
+"""
+Run the wake_up_alarm benchmarks and write the results as JSON.
+
+Usage: scripts/benchmark [--sizes 10,1000] [--baseline old.json] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import __version__ as HA_VERSION  # noqa: N812
+
+from custom_components.wake_up_alarm.const import (
+    CONF_MAX_ALARM_ENTITIES,
+    CONF_STORAGE_BACKEND,
+    DEFAULT_STORAGE_BACKEND,
+    STORAGE_BACKENDS,
+)
+
+from .cases import async_run_cases
+from .harness import async_benchmark_instance
+
+DEFAULT_SIZES = "10,1000,10000,100000"
+DEFAULT_REPEAT = 100
+# Entities dominate everything else at 100k alarms, so only keep a window
+DEFAULT_MAX_ALARM_ENTITIES = 100
+DEFAULT_OUTPUT = "benchmark-results.json"
+DEFAULT_THRESHOLD = 1.25
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(prog="scripts/benchmark", description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="comma separated alarm counts to benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="operations per single-alarm case (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-alarm-entities",
+        type=int,
+        default=DEFAULT_MAX_ALARM_ENTITIES,
+        help="max_alarm_entities option, 0 for every alarm (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--storage-backend",
+        choices=STORAGE_BACKENDS,
+        default=DEFAULT_STORAGE_BACKEND,
+        help="storage_backend option (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(DEFAULT_OUTPUT),
+        help="where to write the JSON results (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="earlier results to compare against; exits with 1 on a regression",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown ratio that counts as a regression (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+async def _async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every case at every size, each size in a fresh instance."""
+    options = {
+        CONF_MAX_ALARM_ENTITIES: args.max_alarm_entities,
+        CONF_STORAGE_BACKEND: args.storage_backend,
+    }
+    results: list[dict[str, Any]] = []
+    stores: list[dict[str, Any]] = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        _write(f"Benchmarking {size} alarms\n")
+        async with async_benchmark_instance(options) as instance:
+            for result in await async_run_cases(instance, size, args.repeat):
+                results.append(result.as_dict())
+                _write(
+                    f"  {result.case:<26} {result.operations:>7} ops "
+                    f"{result.seconds:>10.4f} s "
+                    f"{result.seconds_per_operation * 1e6:>12.1f} us/op\n"
+                )
+            stores.append({"size": size, **instance.store_stats})
+    return {
+        "metadata": {
+            "created": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "platform": platform.platform(),
+        },
+        "options": {**options, "repeat": args.repeat},
+        "results": results,
+        "stores": stores,
+    }
+
+
+def _find_regressions(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a description of every case that got slower than the threshold."""
+    previous = {
+        (result["case"], result["size"]): result["seconds_per_operation"]
+        for result in baseline["results"]
+    }
+    regressions: list[str] = []
+    for result in report["results"]:
+        before = previous.get((result["case"], result["size"]))
+        if not before:
+            continue
+        ratio = result["seconds_per_operation"] / before
+        if ratio > threshold:
+            regressions.append(
+                f"{result['case']} at {result['size']} alarms is {ratio:.2f}x slower"
+            )
+    return regressions
+
+
+def _write(text: str) -> None:
+    """Write progress to stdout."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def main(argv: list[str]) -> int:
+    """Run the benchmarks."""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    report = asyncio.run(_async_run(args))
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    _write(f"Results written to {args.output}\n")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("options") != report["options"]:
+        _write("Warning: the baseline was run with different options\n")
+    regressions = _find_regressions(report, baseline, args.threshold)
+    for regression in regressions:
+        _write(f"Regression: {regression}\n")
+    if not regressions:
+        _write(f"No regressions against {args.baseline}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,271 @@
+"""Benchmark cases for the wake_up_alarm hot paths."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from freezegun import freeze_time
+from homeassistant.helpers import intent
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_ALARM_DATETIME,
+    ATTR_ALARM_DATETIMES,
+    ATTR_ALARM_NUMBER,
+    DOMAIN,
+    SERVICE_ADD_ALARM,
+    SERVICE_ADD_ALARMS,
+    SERVICE_DELETE_ALL_ALARMS,
+)
+
+from . import harness
+from .harness import Result, Timer
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime
+
+    from .harness import BenchmarkInstance
+
+# Alarms are spread out from an hour from now, so none of them fire on their own
+_FIRST_ALARM_OFFSET = timedelta(hours=1)
+_ALARM_SPACING = timedelta(minutes=1)
+
+
+def _alarm_times(start: datetime, count: int) -> list[datetime]:
+    """Return `count` evenly spaced alarm times from `start`."""
+    return [start + i * _ALARM_SPACING for i in range(count)]
+
+
+@dataclass(frozen=True)
+class _Plan:
+    """Alarm count, repetitions and alarm times shared by the cases of a run."""
+
+    size: int
+    repeat: int
+    start: datetime
+
+    @property
+    def alarm_times(self) -> list[datetime]:
+        """Return the times of the `size` alarms added in bulk."""
+        return _alarm_times(self.start, self.size)
+
+    @property
+    def extra_start(self) -> datetime:
+        """Return the time after the bulk alarms, where single alarms land."""
+        return self.start + self.size * _ALARM_SPACING
+
+
+async def _async_handle_intent(
+    instance: BenchmarkInstance,
+    intent_type: str,
+    slots: dict[str, object] | None = None,
+) -> intent.IntentResponse:
+    """Handle an intent the way Assist would."""
+    return await intent.async_handle(
+        instance.hass,
+        DOMAIN,
+        intent_type,
+        {name: {"value": value} for name, value in (slots or {}).items()},
+    )
+
+
+async def _async_add_many(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Bulk add through the add_alarms service."""
+    hass = instance.hass
+    with Timer() as timer:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_ADD_ALARMS,
+            {ATTR_ALARM_DATETIMES: plan.alarm_times},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+    return [Result("add_many", plan.size, plan.size, timer.seconds)]
+
+
+async def _async_add_one(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Single adds through the add_alarm service and the set alarm intent."""
+    hass = instance.hass
+    with Timer() as timer:
+        for when in _alarm_times(plan.extra_start, plan.repeat):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_ADD_ALARM,
+                {ATTR_ALARM_DATETIME: when},
+                blocking=True,
+            )
+        await hass.async_block_till_done()
+    results = [Result("add_one", plan.size, plan.repeat, timer.seconds)]
+
+    intent_start = plan.extra_start + plan.repeat * _ALARM_SPACING
+    with Timer() as timer:
+        for when in _alarm_times(intent_start, plan.repeat):
+            # The intent reads its slots in the system time zone
+            local = when.astimezone()
+            await _async_handle_intent(
+                instance,
+                "HassSetAlarm",
+                {
+                    "year": local.year,
+                    "month": local.month,
+                    "day": local.day,
+                    "hour": local.hour,
+                    "minute": local.minute,
+                    "seconds": local.second,
+                },
+            )
+        await hass.async_block_till_done()
+    results.append(Result("set_alarm_intent", plan.size, plan.repeat, timer.seconds))
+    return results
+
+
+async def _async_delete_one(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Remove the single alarms again with the delete alarm intent."""
+    extra_numbers = [
+        alarm["number"]
+        for alarm in instance.manager.get_all_alarms_data()
+        if alarm["datetime_obj"] >= plan.extra_start
+    ]
+    with Timer() as timer:
+        for alarm_number in extra_numbers:
+            await _async_handle_intent(
+                instance, "HassDeleteAlarm", {ATTR_ALARM_NUMBER: alarm_number}
+            )
+        await instance.hass.async_block_till_done()
+    return [Result("delete_alarm_intent", plan.size, len(extra_numbers), timer.seconds)]
+
+
+async def _async_sensor(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Summary sensor attributes, rebuilt after every change and written out."""
+    manager = instance.manager
+    sensor = instance.summary_sensor
+    build_timer = Timer()
+    write_timer = Timer()
+    for when in _alarm_times(plan.extra_start, plan.repeat):
+        created = manager.create_alarm(when)
+        with build_timer:
+            sensor.extra_state_attributes  # noqa: B018
+        with write_timer:
+            sensor.async_write_ha_state()
+        await manager.delete_alarm(created["number"])
+    with Timer() as cached_timer:
+        for _ in range(plan.repeat):
+            sensor.extra_state_attributes  # noqa: B018
+    await instance.hass.async_block_till_done()
+    return [
+        Result("sensor_attributes", plan.size, plan.repeat, build_timer.seconds),
+        Result(
+            "sensor_attributes_cached", plan.size, plan.repeat, cached_timer.seconds
+        ),
+        Result("sensor_write_state", plan.size, plan.repeat, write_timer.seconds),
+    ]
+
+
+async def _async_get_alarms(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """List every alarm, then an hour of alarms from the middle of the list."""
+    with Timer() as timer:
+        for _ in range(plan.repeat):
+            await _async_handle_intent(instance, "HassGetAlarms")
+    results = [Result("get_alarms_intent", plan.size, plan.repeat, timer.seconds)]
+
+    range_start = plan.start + (plan.size // 2) * _ALARM_SPACING
+    with Timer() as timer:
+        for _ in range(plan.repeat):
+            await _async_handle_intent(
+                instance,
+                "HassGetAlarms",
+                {"start": range_start, "end": range_start + timedelta(hours=1)},
+            )
+    results.append(
+        Result("get_alarms_intent_range", plan.size, plan.repeat, timer.seconds)
+    )
+    return results
+
+
+async def _async_load(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Parse the stored alarms, then a full reload of the entry."""
+    manager = instance.manager
+    await manager.async_save_alarms_to_store()
+    # The triggers of the alarms loaded over are set up again by the reload
+    manager.async_cancel_all_scheduled_triggers()
+    load_repeat = max(1, plan.repeat // 20)
+    with Timer() as timer:
+        for _ in range(load_repeat):
+            await manager.async_load_alarms()
+    results = [Result("load_store", plan.size, load_repeat, timer.seconds)]
+
+    with Timer() as timer:
+        await instance.async_reload()
+    results.append(Result("reload_entry", plan.size, 1, timer.seconds))
+    return results
+
+
+async def _async_delete_all(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Remove every alarm with the intent, then again with the service."""
+    hass = instance.hass
+    with Timer() as timer:
+        await _async_handle_intent(instance, "HassDeleteAllAlarms")
+        await hass.async_block_till_done()
+    results = [Result("delete_all_intent", plan.size, plan.size, timer.seconds)]
+
+    instance.manager.create_alarms(plan.alarm_times)
+    await hass.async_block_till_done()
+    with Timer() as timer:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DELETE_ALL_ALARMS, {}, blocking=True
+        )
+        await hass.async_block_till_done()
+    results.append(Result("delete_all", plan.size, plan.size, timer.seconds))
+    return results
+
+
+async def _async_fire(instance: BenchmarkInstance, plan: _Plan) -> list[Result]:
+    """Move the clock past every alarm, so the scheduler fires them all at once."""
+    hass = instance.hass
+    manager = instance.manager
+    manager.create_alarms(plan.alarm_times)
+    await hass.async_block_till_done()
+    alarm_count = len(manager.get_all_alarms_data())
+    due = plan.alarm_times[-1]
+    # The timers of the harness keep measuring real time
+    with freeze_time(due, ignore=[harness.__name__]), Timer() as timer:
+        async_fire_time_changed(hass, due)
+        await hass.async_block_till_done()
+    if left := len(manager.get_all_alarms_data()):
+        msg = f"{left} of {alarm_count} alarms did not fire"
+        raise RuntimeError(msg)
+    return [Result("fire", plan.size, alarm_count, timer.seconds)]
+
+
+# In the order they run; each leaves `size` alarms behind for the next one,
+# except the ones that measure removing all of them
+_CASES: tuple[Callable[[BenchmarkInstance, _Plan], Awaitable[list[Result]]], ...] = (
+    _async_add_many,
+    _async_add_one,
+    _async_delete_one,
+    _async_sensor,
+    _async_get_alarms,
+    _async_load,
+    _async_delete_all,
+    _async_fire,
+)
+
+
+async def async_run_cases(
+    instance: BenchmarkInstance, size: int, repeat: int
+) -> list[Result]:
+    """
+    Run every case against one instance, starting from no alarms.
+
+    Cases run in a fixed order and each leaves `size` alarms behind for the
+    next one, except the ones that measure removing all of them.
+    """
+    plan = _Plan(size, repeat, dt_util.utcnow() + _FIRST_ALARM_OFFSET)
+    results: list[Result] = []
+    for case in _CASES:
+        results.extend(await case(instance, plan))
+    return results
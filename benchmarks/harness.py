@@ -0,0 +1,151 @@
+"""Local Home Assistant instance the benchmarks run against."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self
+
+from homeassistant import loader
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers import entity_registry as er
+
+# Lets freezegun move dt_util.utcnow, as it does in the tests
+from pytest_homeassistant_custom_component import patch_time  # noqa: F401
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+    mock_storage,
+)
+
+from custom_components.wake_up_alarm.all_alarms_sensor import (
+    ALL_ALARMS_SUMMARY_SENSOR_DESCRIPTION,
+)
+from custom_components.wake_up_alarm.const import DOMAIN, HASS_DATA_ALARM_MANAGERS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.wake_up_alarm.alarm_manager import AlarmManager
+    from custom_components.wake_up_alarm.all_alarms_sensor import AllAlarmsSensor
+
+
+@dataclass
+class Result:
+    """Timing of one benchmark case at one alarm count."""
+
+    case: str
+    size: int
+    operations: int
+    seconds: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def seconds_per_operation(self) -> float:
+        """Return the mean time of a single operation."""
+        return self.seconds / self.operations if self.operations else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result in its machine-readable form."""
+        return {
+            "case": self.case,
+            "size": self.size,
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "seconds_per_operation": self.seconds_per_operation,
+            **self.extra,
+        }
+
+
+class Timer:
+    """Context manager measuring the wall time of its block."""
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.seconds = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> Self:
+        """Start timing."""
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Stop timing and add the elapsed time."""
+        self.seconds += time.perf_counter() - self._started
+
+
+@dataclass
+class BenchmarkInstance:
+    """A Home Assistant instance with the integration set up."""
+
+    hass: HomeAssistant
+    entry: MockConfigEntry
+
+    @property
+    def manager(self) -> AlarmManager:
+        """Return the alarm manager of the entry."""
+        return self.hass.data[HASS_DATA_ALARM_MANAGERS][self.entry.entry_id]
+
+    @property
+    def summary_sensor(self) -> AllAlarmsSensor:
+        """Return the next alarm sensor of the entry."""
+        unique_id = f"{self.entry.entry_id}_{ALL_ALARMS_SUMMARY_SENSOR_DESCRIPTION.key}"
+        entity_id = er.async_get(self.hass).async_get_entity_id(
+            SENSOR_DOMAIN, DOMAIN, unique_id
+        )
+        for platform in entity_platform.async_get_platforms(self.hass, DOMAIN):
+            if (
+                platform.domain == SENSOR_DOMAIN
+                and platform.config_entry is self.entry
+                and entity_id in platform.entities
+            ):
+                return platform.entities[entity_id]
+        msg = f"No next alarm sensor for {self.entry.entry_id}"
+        raise RuntimeError(msg)
+
+    @property
+    def store_stats(self) -> dict[str, int]:
+        """Return the write counters of the entry's alarm store."""
+        return self.manager.store_stats
+
+    async def async_reload(self) -> None:
+        """Unload and set up the entry again, reading alarms from the store."""
+        await self.hass.config_entries.async_reload(self.entry.entry_id)
+        await self.hass.async_block_till_done()
+
+
+@asynccontextmanager
+async def async_benchmark_instance(
+    options: dict[str, Any],
+) -> AsyncIterator[BenchmarkInstance]:
+    """
+    Set up the integration in a fresh local Home Assistant instance.
+
+    JSON stores are kept in memory, so storage cost is the serialization the
+    integration asks for and not the speed of the disk. The SQLite backend
+    writes to a temporary configuration directory.
+    """
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        mock_storage(),
+    ):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Test instances hide custom integrations until this is cleared
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            entry = MockConfigEntry(domain=DOMAIN, options=options)
+            entry.add_to_hass(hass)
+            if not await hass.config_entries.async_setup(entry.entry_id):
+                msg = f"Could not set up {DOMAIN}"
+                raise RuntimeError(msg)
+            await hass.async_block_till_done()
+            try:
+                yield BenchmarkInstance(hass, entry)
+            finally:
+                await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.util import dt as dt_util
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import WakeUpAlarmConfigEntry
+    from .recurrence import RecurrenceRule
 
 
 class AlarmEntity(WakeUpAlarmEntity, SensorEntity):
@@ -36,6 +38,7 @@ class AlarmEntity(WakeUpAlarmEntity, SensorEntity):
         entry: WakeUpAlarmConfigEntry,
         alarm_number: int,
         alarm_datetime_utc: datetime,
+        recurrence: RecurrenceRule | None = None,
     ) -> None:
         """Initialize the alarm entity."""
         super().__init__()
@@ -57,6 +60,7 @@ class AlarmEntity(WakeUpAlarmEntity, SensorEntity):
             self._alarm_at = alarm_datetime_utc
 
         self._alarm_number = alarm_number
+        self._recurrence = recurrence
         self._entry_id = entry.entry_id
 
         self._attr_name = f"Alarm {self._alarm_number}"
@@ -79,3 +83,17 @@ class AlarmEntity(WakeUpAlarmEntity, SensorEntity):
     def native_value(self) -> datetime:
         """Return the state of the sensor (the alarm time in ISO format)."""
         return self._alarm_at  # This is already UTC
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the recurrence rule of a repeating alarm."""
+        if self._recurrence is None:
+            return None
+        return {"recurrence": self._recurrence.as_dict()}
+
+    @callback
+    def async_set_alarm_time(self, alarm_datetime_utc: datetime) -> None:
+        """Move the alarm to a new (UTC) time and write the state in place."""
+        self._alarm_at = alarm_datetime_utc
+        if self.entity_id is not None:
+            self.async_write_ha_state()
@@ -0,0 +1,66 @@
+"""Event entity reporting alarm fires for wake_up_alarm."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.event import EventEntity, EventEntityDescription
+from homeassistant.core import callback
+
+from .const import DOMAIN, EVENT_TYPE_ALARM_FIRED, LOGGER
+from .entity import WakeUpAlarmEntity
+
+if TYPE_CHECKING:
+    from .alarm_manager import AlarmManager
+    from .data import WakeUpAlarmConfigEntry
+
+ALARM_FIRED_EVENT_DESCRIPTION = EventEntityDescription(
+    key=f"{DOMAIN}_alarm_fired",
+    name="Alarm Fired",
+    icon="mdi:alarm-bell",
+    event_types=[EVENT_TYPE_ALARM_FIRED],
+)
+
+
+class AlarmFiredEvent(WakeUpAlarmEntity, EventEntity):
+    """Event entity with one event, and one state write, per alarm fire."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: WakeUpAlarmConfigEntry,
+        alarm_manager: AlarmManager,
+    ) -> None:
+        """Initialize the event entity."""
+        super().__init__()
+        self.entity_description = ALARM_FIRED_EVENT_DESCRIPTION
+        self._alarm_manager = alarm_manager
+        self._attr_unique_id = f"{entry.entry_id}_{self.entity_description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Report an event whenever the alarm manager fires alarms."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._alarm_manager.async_add_fire_listener(self._async_alarms_fired)
+        )
+
+    @callback
+    def _async_alarms_fired(self, alarms: list[dict[str, Any]]) -> None:
+        """
+        Report alarms that fired together as a single event.
+
+        The event describes the earliest alarm and lists the numbers of all of
+        them, like the wake_up_alarm_alarm_triggered event.
+        """
+        LOGGER.debug("Reporting fired alarms on the alarm fired event entity")
+        first_alarm = alarms[0]
+        self._trigger_event(
+            EVENT_TYPE_ALARM_FIRED,
+            {
+                "alarm_number": first_alarm["number"],
+                "alarm_numbers": [alarm["number"] for alarm in alarms],
+                "alarm_datetime": first_alarm["datetime_obj"].isoformat(),
+            },
+        )
+        self.async_write_ha_state()
@@ -0,0 +1,136 @@
+"""Indexed in-memory alarm store for wake_up_alarm."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+
+class AlarmIndex:
+    """
+    Alarms indexed both by number and by time.
+
+    Alarms are the same {"number": int, "datetime_obj": datetime} dicts the
+    manager has always handed out. Lookups by number go through a dict, while
+    a list of (datetime, number) keys kept sorted with bisect gives the next
+    alarm in O(1). Inserts and deletes find their position in O(log n), then
+    shift the tail of the list in O(n); that shift is a single memmove, which
+    stays cheap for the alarm counts this integration sees.
+
+    The ISO formatted alarm times are kept in a list parallel to the time
+    ordered keys, and every mutation bumps `version`, so consumers can cache
+    anything derived from the index until the version changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._by_number: dict[int, dict[str, Any]] = {}
+        self._by_time: list[tuple[datetime, int]] = []
+        self._iso_by_time: list[str] = []
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Return the number of alarms in the index."""
+        return len(self._by_number)
+
+    def __bool__(self) -> bool:
+        """Return True if there is at least one alarm."""
+        return bool(self._by_number)
+
+    def __contains__(self, alarm_number: object) -> bool:
+        """Return True if an alarm with the given number exists."""
+        return alarm_number in self._by_number
+
+    def get(self, alarm_number: int) -> dict[str, Any] | None:
+        """Return the alarm with the given number, or None."""
+        return self._by_number.get(alarm_number)
+
+    def add(self, alarm: dict[str, Any]) -> bool:
+        """Add an alarm. Returns False if its number is already taken."""
+        alarm_number = alarm["number"]
+        if alarm_number in self._by_number:
+            return False
+        self._by_number[alarm_number] = alarm
+        key = (alarm["datetime_obj"], alarm_number)
+        pos = bisect_left(self._by_time, key)
+        self._by_time.insert(pos, key)
+        self._iso_by_time.insert(pos, alarm["datetime_obj"].isoformat())
+        self.version += 1
+        return True
+
+    def remove(self, alarm_number: int) -> dict[str, Any] | None:
+        """Remove an alarm by number and return it, or None if it did not exist."""
+        alarm = self._by_number.pop(alarm_number, None)
+        if alarm is None:
+            return None
+        key = (alarm["datetime_obj"], alarm_number)
+        pos = bisect_left(self._by_time, key)
+        del self._by_time[pos]
+        del self._iso_by_time[pos]
+        self.version += 1
+        return alarm
+
+    def clear(self) -> None:
+        """Remove all alarms."""
+        self._by_number = {}
+        self._by_time = []
+        self._iso_by_time = []
+        self.version += 1
+
+    def first(self) -> dict[str, Any] | None:
+        """Return the earliest alarm, or None if there are no alarms."""
+        if not self._by_time:
+            return None
+        return self._by_number[self._by_time[0][1]]
+
+    def iso_times(self) -> list[str]:
+        """Return a copy of the ISO formatted alarm times in time order."""
+        return list(self._iso_by_time)
+
+    def numbers(self) -> Iterator[int]:
+        """Iterate over alarm numbers in insertion order."""
+        return iter(self._by_number)
+
+    def by_time(self) -> Iterator[dict[str, Any]]:
+        """Iterate over alarms ordered by time (then number)."""
+        by_number = self._by_number
+        return (by_number[number] for _, number in self._by_time)
+
+    def _range_bounds(
+        self, start: datetime | None, end: datetime | None
+    ) -> tuple[int, int]:
+        """Return the positions of the time range [start, end) in the time keys."""
+        # (time,) sorts before every (time, number) key with the same time
+        low = bisect_left(self._by_time, (start,)) if start else 0
+        high = bisect_left(self._by_time, (end,)) if end else len(self._by_time)
+        return low, max(low, high)
+
+    def count_between(self, start: datetime | None, end: datetime | None) -> int:
+        """Return the number of alarms from start (inclusive) to end (exclusive)."""
+        low, high = self._range_bounds(start, end)
+        return high - low
+
+    def between(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        after: tuple[datetime, int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate in time order over alarms from start (inclusive) to end (exclusive).
+
+        Only alarms whose (time, number) key sorts after `after` are included,
+        so a page of results can continue where the previous one ended. Both
+        ends are found with a bisect, so this costs O(log n) plus the alarms
+        actually read.
+        """
+        low, high = self._range_bounds(start, end)
+        if after is not None:
+            low = max(low, bisect_right(self._by_time, after))
+        by_number = self._by_number
+        by_time = self._by_time
+        return (by_number[by_time[pos][1]] for pos in range(low, high))
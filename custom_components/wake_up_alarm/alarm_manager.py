@@ -2,47 +2,109 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
+from datetime import UTC, datetime, timedelta
+from itertools import chain, islice, takewhile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.event import async_track_point_in_time
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.util import dt as dt_util
 
 from .alarm_entity import AlarmEntity
+from .alarm_index import AlarmIndex
 from .alarm_sensor import IsAlarmSensor
+from .alarm_store import AlarmStore, alarm_metadata
 from .all_alarms_sensor import AllAlarmsSensor
 from .const import (
     ATTR_ALARM_DATETIME,
+    ATTR_ALARM_DATETIMES,
+    ATTR_ALARM_NUMBER,
+    ATTR_PRE_ALARM_OFFSETS,
+    ATTR_RECURRENCE,
+    CATCH_UP_FIRE_LATEST,
+    CATCH_UP_GRACE_PERIOD,
+    CONF_AREA_ID,
+    CONF_CATCH_UP_GRACE_PERIOD,
+    CONF_CATCH_UP_POLICY,
+    CONF_COALESCE_WINDOW,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_EARLY_ARM_MARGIN,
+    CONF_IS_ALARMING_SENSOR,
+    CONF_MAX_ALARM_ENTITIES,
+    CONF_PRE_ALARM_OFFSETS,
+    CONF_SNOOZE_WINDOW,
+    CONF_STORAGE_BACKEND,
+    DEFAULT_CATCH_UP_GRACE_PERIOD,
+    DEFAULT_CATCH_UP_POLICY,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_EARLY_ARM_MARGIN,
+    DEFAULT_IS_ALARMING_SENSOR,
+    DEFAULT_MAX_ALARM_ENTITIES,
+    DEFAULT_PRE_ALARM_OFFSETS,
+    DEFAULT_STORAGE_BACKEND,
     EVENT_ALARM_TRIGGERED,
-    HASS_DATA_ALARM_MANAGER,
+    EVENT_ALARMS_CAUGHT_UP,
+    EVENT_PRE_ALARM,
+    LEGACY_SNOOZE_WINDOW,
     LOGGER,
     SIGNAL_ADD_ALARM,
+    SIGNAL_ADD_ALARMS,
     SIGNAL_DELETE_ALARM,
+    STORAGE_BACKEND_SQLITE,
+    STORAGE_BACKENDS,
     STORAGE_KEY_ALARMS_FORMAT,
-    STORAGE_VERSION,
 )
 from .data import WakeUpAlarmConfigEntry
+from .diagnostic_sensor import DIAGNOSTIC_SENSOR_DESCRIPTIONS, AlarmDiagnosticSensor
+from .metrics import AlarmMetrics, timed_operation
+from .number_allocator import AlarmNumberAllocator
+from .recurrence import RecurrenceRule
+from .routing import async_get_alarm_manager, async_get_alarm_managers
+from .scheduler import JobTiming, async_get_scheduler
+from .sqlite_store import SqliteAlarmStore
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from datetime import datetime
+    from collections.abc import Callable, Hashable, Iterable
 
     from homeassistant.components.sensor import SensorEntity
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .alarm_store import AlarmStorageBackend
     from .data import WakeUpAlarmConfigEntry
 
+# Kinds of scheduler jobs, the first part of their keys:
+# (_ALARM_JOB, entry_id, number) fires an alarm,
+# (_PRE_ALARM_JOB, entry_id, number, offset) fires one of its pre-alarm events,
+# (_RINGING_JOB, entry_id, number) ends a fired alarm's snooze window
+_ALARM_JOB = "alarm"
+_PRE_ALARM_JOB = "pre_alarm"
+_RINGING_JOB = "ringing"
+
+
+def _parse_pre_alarm_offsets(values: Iterable[Any]) -> tuple[int, ...]:
+    """Return the valid lead times in minutes, largest first, without duplicates."""
+    offsets: set[int] = set()
+    for value in values:
+        try:
+            offset = int(value)
+        except (TypeError, ValueError):
+            LOGGER.warning("Ignoring invalid pre-alarm offset %s", value)
+            continue
+        if offset > 0:
+            offsets.add(offset)
+    return tuple(sorted(offsets, reverse=True))
+
 
 async def async_remove_entry(
     hass: HomeAssistant, entry: WakeUpAlarmConfigEntry
 ) -> None:
     """Handle removal of the entry."""
-    if HASS_DATA_ALARM_MANAGER in hass.data:
-        del hass.data[HASS_DATA_ALARM_MANAGER]
+    if async_get_alarm_managers(hass).pop(entry.entry_id, None) is not None:
         LOGGER.debug(
             "Removed alarm manager for %s.",
             entry.entry_id,
@@ -56,15 +118,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    if HASS_DATA_ALARM_MANAGER in hass.data:
+    if entry.entry_id in async_get_alarm_managers(hass):
         LOGGER.error(
             "AlarmManager already initialized for entry %s. Skipping setup.",
             entry.entry_id,
         )
         return
-    # Initialize AlarmManager with the full config entry
+    # Initialize AlarmManager with the full config entry; it registers itself
     alarm_manager = AlarmManager(hass, entry)
-    hass.data[HASS_DATA_ALARM_MANAGER] = alarm_manager
 
     await alarm_manager.async_load_alarms()
 
@@ -72,63 +133,79 @@ async def async_setup_entry(
 
     all_alarms_summary_sensor = AllAlarmsSensor(hass, entry, alarm_manager)
 
-    is_alarming_sensor = IsAlarmSensor(hass, entry, alarm_manager)
-
-    entities_to_add: list[SensorEntity] = [
-        all_alarms_summary_sensor,
-        is_alarming_sensor,
-    ]
-
-    loaded_alarm_entities = (
-        alarm_manager.create_entities_for_loaded_alarms_and_schedule()
-    )
-    for entity in loaded_alarm_entities:
-        entry.runtime_data.alarm_entities[entity.alarm_number] = entity
-    entities_to_add.extend(loaded_alarm_entities)
+    entities_to_add: list[SensorEntity] = [all_alarms_summary_sensor]
+    # Kept for compatibility; the event platform reports fires with one write
+    if entry.options.get(CONF_IS_ALARMING_SENSOR, DEFAULT_IS_ALARMING_SENSOR):
+        entities_to_add.append(IsAlarmSensor(hass, entry, alarm_manager))
+    if entry.options.get(CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS):
+        entities_to_add.extend(
+            AlarmDiagnosticSensor(entry, alarm_manager, description)
+            for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
+        )
 
     async_add_entities(entities_to_add)
 
+    # The manager adds and removes AlarmEntity sensors itself, so that only the
+    # configured window of upcoming alarms is materialized as entities.
+    alarm_manager.attach_entity_platform(async_add_entities)
+    alarm_manager.create_entities_for_loaded_alarms_and_schedule()
+
     @callback
     def _async_handle_new_alarm_signal(alarm_details: dict[str, Any]) -> None:
         """
         Handle the signal to add a new alarm from a service call.
 
-        This creates an individual AlarmEntity sensor, adds the alarm to the
-        AlarmManager (which handles persistence), and updates the summary sensor.
+        This adds the alarm to the AlarmManager (which handles persistence and
+        creates its AlarmEntity sensor), and updates the summary sensor.
         """
         alarm_datetime_utc: datetime = alarm_details[ATTR_ALARM_DATETIME]
 
-        new_alarm_entity = alarm_manager.create_alarm(alarm_datetime_utc)
+        new_alarm = alarm_manager.create_alarm(
+            alarm_datetime_utc,
+            alarm_details.get(ATTR_RECURRENCE),
+            pre_alarm_offsets=alarm_details.get(ATTR_PRE_ALARM_OFFSETS),
+        )
 
-        if new_alarm_entity is None:
+        if new_alarm is None:
             LOGGER.error(
-                "Failed to create alarm entity via AlarmManager for datetime %s",
+                "Failed to create alarm via AlarmManager for datetime %s",
                 alarm_datetime_utc.isoformat(),
             )
             return
 
         LOGGER.debug(
-            ("Sensor platform received new alarm entity: Number=%s, DateTime='%s'"),
-            new_alarm_entity.alarm_number,
-            new_alarm_entity.native_value.isoformat(),
-        )
-
-        # Add the entity to Home Assistant
-        async_add_entities([new_alarm_entity])
-        entry.runtime_data.alarm_entities[new_alarm_entity.alarm_number] = (
-            new_alarm_entity
+            ("Sensor platform received new alarm: Number=%s, DateTime='%s'"),
+            new_alarm["number"],
+            new_alarm["datetime_obj"].isoformat(),
         )
 
         # Update the summary sensor's state
-        all_alarms_summary_sensor.async_write_ha_state()
+        alarm_manager.refresh_sensor()
+
+    @callback
+    def _async_handle_new_alarms_signal(alarm_details: dict[str, Any]) -> None:
+        """
+        Handle the signal to add many alarms at once from a service call.
+
+        All alarms are created in one pass and their entities registered with a
+        single async_add_entities call, followed by a single summary sensor update.
+        """
+        alarm_datetimes_utc: list[datetime] = alarm_details[ATTR_ALARM_DATETIMES]
+
+        new_alarms = alarm_manager.create_alarms(alarm_datetimes_utc)
+        if not new_alarms:
+            LOGGER.error(
+                "Failed to create any of %s alarms via AlarmManager",
+                len(alarm_datetimes_utc),
+            )
+            return
+
+        alarm_manager.refresh_sensor()
 
     @callback
     async def _async_handle_delete_alarm_signal(alarm_details: dict[str, Any]) -> None:
         """Handle the signal to delete an alarm from a service call."""
-        del alarm_details  # Unused
-        await alarm_manager.delete_all_alarms()
-
-        all_alarms_summary_sensor.async_write_ha_state()
+        await alarm_manager.delete_alarm(alarm_details[ATTR_ALARM_NUMBER])
 
     # Listen for signals indicating a new alarm has been added via service.
     entry.async_on_unload(
@@ -136,6 +213,14 @@ async def async_setup_entry(
             hass, f"{SIGNAL_ADD_ALARM}_{entry.entry_id}", _async_handle_new_alarm_signal
         )
     )
+    # Listen for signals indicating many alarms have been added via service.
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            f"{SIGNAL_ADD_ALARMS}_{entry.entry_id}",
+            _async_handle_new_alarms_signal,
+        )
+    )
     # Listen for signals indicating an alarm should be deleted.
     entry.async_on_unload(
         async_dispatcher_connect(
@@ -146,26 +231,43 @@ async def async_setup_entry(
     )
     # Register AlarmManager's cleanup function for all scheduled triggers on unload
     entry.async_on_unload(alarm_manager.async_cancel_all_scheduled_triggers)
+    # Write any pending alarm changes and close the store on unload
+    entry.async_on_unload(alarm_manager.async_close_store)
+
+    @callback
+    def _async_release_alarm_manager() -> None:
+        """Allow a new AlarmManager to be created when the entry is reloaded."""
+        alarm_managers = async_get_alarm_managers(hass)
+        if alarm_managers.get(entry.entry_id) is alarm_manager:
+            del alarm_managers[entry.entry_id]
+
+    entry.async_on_unload(_async_release_alarm_manager)
 
 
 class AlarmManager:
     """Manages loading, saving, and accessing alarm data."""
 
     @classmethod
-    def get_instance(cls, hass: HomeAssistant) -> AlarmManager | None:
-        """Get the AlarmManager instance for the given Home Assistant instance."""
-        return hass.data.get(HASS_DATA_ALARM_MANAGER)
+    def get_instance(
+        cls, hass: HomeAssistant, entry_id: str | None = None
+    ) -> AlarmManager | None:
+        """
+        Get the AlarmManager instance of a config entry.
+
+        Without an entry_id, an instance is only returned if there is one entry.
+        """
+        return async_get_alarm_manager(hass, entry_id)
 
     @classmethod
     def execute_on_instance(
-        cls, hass: HomeAssistant, func: Callable
+        cls, hass: HomeAssistant, func: Callable, entry_id: str | None = None
     ) -> tuple[bool, Any]:
         """
         Execute a function on the AlarmManager instance if it exists.
 
         Returns a tuple (success: bool, result: Any).
         """
-        instance = cls.get_instance(hass)
+        instance = cls.get_instance(hass, entry_id)
         if instance is None:
             return False, None
         result = func(instance)
@@ -173,14 +275,17 @@ class AlarmManager:
 
     @classmethod
     async def execute_on_instance_async(
-        cls, hass: HomeAssistant, func: Callable[[AlarmManager], Any]
+        cls,
+        hass: HomeAssistant,
+        func: Callable[[AlarmManager], Any],
+        entry_id: str | None = None,
     ) -> tuple[bool, Any]:
         """
         Execute an async function on the AlarmManager instance if it exists.
 
         Returns a tuple (success: bool, result: Any).
         """
-        instance = cls.get_instance(hass)
+        instance = cls.get_instance(hass, entry_id)
         if instance is None:
             return False, None
         result = await func(instance)
@@ -188,145 +293,331 @@ class AlarmManager:
 
     def save_instance(self, hass: HomeAssistant) -> None:
         """Save the AlarmManager instance to the Home Assistant data."""
-        hass.data[HASS_DATA_ALARM_MANAGER] = self
+        async_get_alarm_managers(hass)[self._entry_id] = self
 
     def __init__(self, hass: HomeAssistant, entry: WakeUpAlarmConfigEntry) -> None:
         """Initialize the Alarm Manager."""
-        if HASS_DATA_ALARM_MANAGER in hass.data:
+        if entry.entry_id in async_get_alarm_managers(hass):
             msg = (
                 f"AlarmManager already initialized for entry {entry.entry_id}. "
                 "Only one instance can be created per config entry."
             )
             raise RuntimeError(msg)
-        self.save_instance(hass)
         self.hass = hass
         self._entry = entry
         self._entry_id = entry.entry_id
-        # _alarms stores {"number": int, "datetime_obj": datetime}
-        self._alarms: list[dict[str, Any]] = []
-        self._free_alarm_numbers: set[int] = set()
+        self.save_instance(hass)
+        # 0 means every alarm gets an entity
+        self._max_alarm_entities: int = entry.options.get(
+            CONF_MAX_ALARM_ENTITIES, DEFAULT_MAX_ALARM_ENTITIES
+        )
+        self._async_add_entities: AddEntitiesCallback | None = None
+        # Alarm numbers whose entity is being removed, and those of them that
+        # need a new entity once it is gone; the unique ID is taken until then
+        self._removing_entity_numbers: set[int] = set()
+        self._readd_entity_numbers: set[int] = set()
+        # Sensors register here instead of being looked up by entity id
+        self._update_listeners: list[CALLBACK_TYPE] = []
+        self._fire_listeners: list[Callable[[list[dict[str, Any]]], None]] = []
+        # Alarms fired while the entry is set up, e.g. while catching up, are
+        # replayed to the fire listeners added later in the setup
+        self._replay_fired_alarms = True
+        self._fired_alarms_to_replay: list[dict[str, Any]] = []
+        self._catch_up_policy: str = entry.options.get(
+            CONF_CATCH_UP_POLICY, DEFAULT_CATCH_UP_POLICY
+        )
+        self._catch_up_grace_period = timedelta(
+            minutes=entry.options.get(
+                CONF_CATCH_UP_GRACE_PERIOD, DEFAULT_CATCH_UP_GRACE_PERIOD
+            )
+        )
+        # _alarms indexes {"number": int, "datetime_obj": datetime} by number and time
+        self._alarms = AlarmIndex()
+        self._alarm_numbers = AlarmNumberAllocator()
 
-        storage_key = STORAGE_KEY_ALARMS_FORMAT.format(entry_id=self._entry_id)
-        self._store: Store[list[dict[str, Any]]] = Store(
-            hass, STORAGE_VERSION, storage_key
+        self._storage_key = STORAGE_KEY_ALARMS_FORMAT.format(entry_id=self._entry_id)
+        self._storage_backend: str = entry.options.get(
+            CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND
+        )
+        self._store = self._create_store(self._storage_backend)
+        self._coalesce_window = timedelta(
+            seconds=entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW)
+        )
+        # The scheduler wakes up early for the entry's alarms and pre-alarms,
+        # and only the entry's own alarms fire together
+        early_arm_margin = timedelta(
+            seconds=entry.options.get(CONF_EARLY_ARM_MARGIN, DEFAULT_EARLY_ARM_MARGIN)
         )
-        self._entry.runtime_data.scheduled_alarm_triggers = {}
+        self._alarm_timing = JobTiming(
+            early_margin=early_arm_margin,
+            coalesce_group=(_ALARM_JOB, self._entry_id),
+            coalesce_window=self._coalesce_window,
+        )
+        self._pre_alarm_timing = JobTiming(early_margin=early_arm_margin)
+        # Used for alarms that were not given their own offsets
+        self._pre_alarm_offsets = _parse_pre_alarm_offsets(
+            entry.options.get(CONF_PRE_ALARM_OFFSETS, DEFAULT_PRE_ALARM_OFFSETS)
+        )
+        # Fired alarms can be snoozed for this long; 0 deletes one-shot alarms
+        # as soon as they fire. New entries get a window, entries created
+        # before snoozing existed have no option and keep 0.
+        self._snooze_window = timedelta(
+            minutes=entry.options.get(CONF_SNOOZE_WINDOW, LEGACY_SNOOZE_WINDOW)
+        )
+        # Alarms that fired within the snooze window, by number. Ringing one-shot
+        # alarms are out of the index but keep their number, entity and record.
+        self._ringing: dict[int, dict[str, Any]] = {}
+        # Shared by all entries; this entry's jobs are keyed by (kind, entry_id, ...)
+        self._scheduler = async_get_scheduler(hass)
+        self.metrics = AlarmMetrics()
+
+    @property
+    def entry_id(self) -> str:
+        """Return the id of the config entry this manager belongs to."""
+        return self._entry_id
+
+    @property
+    def area_id(self) -> str | None:
+        """Return the area whose Assist satellites use this entry, if any."""
+        return self._entry.data.get(CONF_AREA_ID)
+
+    def _create_store(self, backend: str) -> AlarmStorageBackend:
+        """Create the storage backend with the given name for this entry."""
+        if backend == STORAGE_BACKEND_SQLITE:
+            return SqliteAlarmStore(
+                self.hass,
+                Path(self.hass.config.path(STORAGE_DIR, f"{self._storage_key}.db")),
+            )
+        return AlarmStore(self.hass, self._storage_key, self._alarms_to_store_data)
+
+    @callback
+    def attach_entity_platform(self, async_add_entities: AddEntitiesCallback) -> None:
+        """Set the callback used to add AlarmEntity sensors to Home Assistant."""
+        self._async_add_entities = async_add_entities
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call `update_callback` when the alarms change. Returns an unsubscriber."""
+        self._update_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._update_listeners.remove(update_callback)
+
+        return remove_listener
 
+    @callback
+    def async_add_fire_listener(
+        self, fire_callback: Callable[[list[dict[str, Any]]], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Call `fire_callback` with the alarms that fire together, each time.
+
+        Alarms that fired while the entry was being set up, e.g. while catching
+        up at startup, are reported to every listener added during the setup.
+        Returns an unsubscriber.
+        """
+        self._fire_listeners.append(fire_callback)
+        if self._fired_alarms_to_replay:
+            fire_callback(list(self._fired_alarms_to_replay))
+
+        @callback
+        def remove_listener() -> None:
+            self._fire_listeners.remove(fire_callback)
+
+        return remove_listener
+
+    @callback
     def refresh_sensor(self) -> None:
-        """Refresh the next alarm sensor."""
-        component = self.hass.data.get("sensor")
-        sensor = component.get_entity("sensor.next_alarm") if component else None
-        if sensor:
-            LOGGER.debug("Refreshing next alarm sensor")
-            sensor.async_write_ha_state()
-        else:
-            LOGGER.warning("Next alarm sensor not found in entity registry.")
-
-    def trigger_is_alarming_sensor(self) -> None:
-        """Trigger update of the is_alarming_now sensor."""
-        component = self.hass.data.get("sensor")
-        sensor = component.get_entity("sensor.is_alarming_now") if component else None
-        if sensor:
-            LOGGER.debug("Refreshing next alarm sensor")
-            sensor.trigger()
-        else:
-            LOGGER.warning("Next alarm sensor not found in entity registry.")
+        """Tell the listeners, like the next alarm sensor, that alarms changed."""
+        LOGGER.debug("Refreshing next alarm sensor")
+        for update_callback in list(self._update_listeners):
+            update_callback()
+
+    @callback
+    def notify_fire_listeners(self, alarms: list[dict[str, Any]]) -> None:
+        """Tell the fire listeners, like the alarm fired event, that alarms fired."""
+        if self._replay_fired_alarms:
+            # Copied, as recurring alarms move on once they have fired
+            self._fired_alarms_to_replay.extend(dict(alarm) for alarm in alarms)
+        LOGGER.debug(
+            "Notifying fire listeners of alarms %s", [a["number"] for a in alarms]
+        )
+        for fire_callback in list(self._fire_listeners):
+            fire_callback(alarms)
+
+    @callback
+    def async_stop_replaying_fired_alarms(self) -> None:
+        """Stop keeping fired alarms for listeners, once the entry is set up."""
+        self._replay_fired_alarms = False
+        self._fired_alarms_to_replay.clear()
 
     def recalculate_free_alarm_numbers(self) -> None:
-        """Recalculate the set of free alarm numbers based on current alarms."""
-        if not self._alarms:
-            self._free_alarm_numbers = set()
-        else:
-            used_numbers = {alarm["number"] for alarm in self._alarms}
-            self._free_alarm_numbers = {
-                num
-                for num in range(1, max(used_numbers) + 1)
-                if num not in used_numbers
-            }
+        """Rebuild the free alarm number heap based on current alarms."""
+        self._alarm_numbers.rebuild(self._alarms.numbers())
 
     def get_next_alarm_time(self) -> datetime | None:
         """Get the next alarm time, or None if no alarms are set."""
-        if not self._alarms:
+        next_alarm = self._alarms.first()
+        if next_alarm is None:
             return None
-        # Return the earliest alarm datetime
-        return min(alarm["datetime_obj"] for alarm in self._alarms)
+        return next_alarm["datetime_obj"]
 
+    @timed_operation("load_alarms")
     async def async_load_alarms(self) -> None:
         """Load alarms from the store."""
-        if not (stored_alarms_raw := await self._store.async_load()):
+        stored_alarms_raw = await self._store.async_load()
+        if stored_alarms_raw is None:
+            stored_alarms_raw = await self._async_migrate_from_other_backends()
+        if not stored_alarms_raw:
             LOGGER.debug("No persisted alarms found for %s", self._entry_id)
             return
 
-        loaded_alarms: list[dict[str, Any]] = []
-        for alarm_raw in stored_alarms_raw:
+        numbers: list[int] = stored_alarms_raw.get("numbers", [])
+        timestamps: list[int] = stored_alarms_raw.get("timestamps", [])
+        metadata: dict[str, dict[str, Any]] = stored_alarms_raw.get("metadata", {})
+        if len(numbers) != len(timestamps):
+            LOGGER.warning(
+                "Stored alarms for %s have %s numbers but %s timestamps, "
+                "ignoring the unmatched ones",
+                self._entry_id,
+                len(numbers),
+                len(timestamps),
+            )
+
+        loaded_alarms = AlarmIndex()
+        for alarm_number, timestamp in zip(numbers, timestamps, strict=False):
             try:
-                if not all(k in alarm_raw for k in ("number", "datetime")):
-                    LOGGER.warning("Skipping malformed alarm data: %s", alarm_raw)
-                    continue
-                if not isinstance(alarm_raw["number"], int) or not isinstance(
-                    alarm_raw["datetime"], str
-                ):
-                    LOGGER.warning(
-                        "Skipping alarm data with incorrect types: %s", alarm_raw
+                alarm: dict[str, Any] = {
+                    "number": alarm_number,
+                    "datetime_obj": datetime.fromtimestamp(timestamp, UTC),
+                }
+                alarm_metadata = metadata.get(str(alarm_number), {})
+                if alarm_metadata.get("recurrence"):
+                    alarm["recurrence"] = RecurrenceRule.from_dict(
+                        alarm_metadata["recurrence"]
                     )
-                    continue
-
-                parsed_datetime_raw = dt_util.parse_datetime(alarm_raw["datetime"])
-                if parsed_datetime_raw is None:
-                    LOGGER.warning(
-                        "Could not parse datetime string for alarm: %s", alarm_raw
+                if "pre_alarm_offsets" in alarm_metadata:
+                    alarm["pre_alarm_offsets"] = _parse_pre_alarm_offsets(
+                        alarm_metadata["pre_alarm_offsets"]
                     )
-                    continue
-
-                if parsed_datetime_raw.tzinfo is None:
-                    LOGGER.warning(
-                        "Alarm datetime '%s' for number %s is no tz, assuming UTC.",
-                        alarm_raw["datetime"],
-                        alarm_raw["number"],
+                if "resume_at" in alarm_metadata:
+                    alarm["resume_at"] = datetime.fromtimestamp(
+                        alarm_metadata["resume_at"], UTC
                     )
-                    parsed_datetime = parsed_datetime_raw.replace(tzinfo=dt_util.UTC)
-                else:
-                    parsed_datetime = dt_util.as_utc(parsed_datetime_raw)
 
-                loaded_alarms.append(
-                    {"number": alarm_raw["number"], "datetime_obj": parsed_datetime}
+                if not loaded_alarms.add(alarm):
+                    LOGGER.warning("Skipping duplicate alarm number: %s", alarm_number)
+            except (KeyError, OverflowError, TypeError, ValueError) as ex:
+                LOGGER.warning(
+                    "Could not parse stored alarm %s at %s: %s",
+                    alarm_number,
+                    timestamp,
+                    ex,
                 )
-            except (TypeError, ValueError) as ex:
-                LOGGER.warning("Could not parse stored alarm %s: %s", alarm_raw, ex)
 
-        self._alarms = sorted(loaded_alarms, key=lambda x: x["number"])
+        # Keep the version moving forward so cached views are invalidated
+        loaded_alarms.version = self._alarms.version + 1
+        self._alarms = loaded_alarms
         self.recalculate_free_alarm_numbers()
         LOGGER.debug(
             "Loaded %s alarms for %s from store", len(self._alarms), self._entry_id
         )
 
+    async def _async_migrate_from_other_backends(self) -> dict[str, Any] | None:
+        """
+        Move alarms left in another storage backend to the current one.
+
+        Used when the configured backend has never stored anything, e.g. right
+        after the storage backend option was changed. Returns the moved data.
+        """
+        for backend in STORAGE_BACKENDS:
+            if backend == self._storage_backend:
+                continue
+            other_store = self._create_store(backend)
+            if (data := await other_store.async_load()) is None:
+                continue
+            LOGGER.info(
+                "Migrating alarms for %s from %s storage to %s storage",
+                self._entry_id,
+                backend,
+                self._storage_backend,
+            )
+            await self._store.async_import(data)
+            await other_store.async_remove()
+            return data
+        return None
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the set of alarms changes."""
+        return self._alarms.version
+
+    def get_alarm_times_iso(self) -> list[str]:
+        """Return the ISO formatted times of all alarms, in time order."""
+        return self._alarms.iso_times()
+
     def get_all_alarms_data(self) -> list[dict[str, Any]]:
-        """Return a copy of all current alarm data (number, datetime_obj)."""
-        return list(self._alarms)  # Return a copy
+        """Return a copy of all current alarm data (number, datetime_obj) by time."""
+        return list(self._alarms.by_time())
+
+    @timed_operation("list_alarms")
+    def list_alarms(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Return a page of alarms from start (inclusive) to end (exclusive).
+
+        At most `limit` alarms are returned in time order, starting after the
+        (datetime, number) key `after`, along with the number of alarms in the
+        whole range. Only the returned alarms are read from the index.
+        """
+        alarms = list(islice(self._alarms.between(start, end, after), limit))
+        return alarms, self._alarms.count_between(start, end)
+
+    @property
+    def pending_timer_count(self) -> int:
+        """Return the number of alarm and pre-alarm triggers waiting to fire."""
+        return self._scheduler.pending_count(self._async_on_due_jobs)
+
+    @property
+    def store_stats(self) -> dict[str, int]:
+        """Return the write counters of the alarm store."""
+        return self._store.stats
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return operation metrics and the size of the manager's state."""
+        armed_at = self._scheduler.armed_at
+        return {
+            "alarms": len(self._alarms),
+            "alarm_entities": len(self._entry.runtime_data.alarm_entities),
+            "ringing_alarms": sorted(self._ringing),
+            "pending_timers": self.pending_timer_count,
+            "timer_armed_at": armed_at.isoformat() if armed_at else None,
+            "storage_backend": self._storage_backend,
+            "store": self._store.stats,
+            **self.metrics.as_dict(),
+        }
 
     def get_next_alarm_number(self) -> int:
         """Determine the next available alarm number."""
-        if not self._free_alarm_numbers:
-            # If no free numbers, return the next number after the highest existing one
-            return self._get_next_alarm_number_after_highest()
-        return min(self._free_alarm_numbers)
-
-    def _get_next_alarm_number_after_highest(self) -> int:
-        """Determine the next available alarm number after the highest existing one."""
-        if not self._alarms:
-            return 1
-        return max(alarm["number"] for alarm in self._alarms) + 1
+        return self._alarm_numbers.peek()
 
     def get_alarm(self, alarm_number: int) -> dict[str, Any] | None:
-        """Get an alarm by its number."""
-        for alarm in self._alarms:
-            if alarm["number"] == alarm_number:
-                return alarm
-        return None
+        """Get an alarm by its number, including a ringing one-shot alarm."""
+        return self._alarms.get(alarm_number) or self._ringing.get(alarm_number)
 
     @callback
     def _create_alarm_data_and_persist(
-        self, alarm_datetime: datetime
+        self,
+        alarm_datetime: datetime,
+        recurrence: RecurrenceRule | None = None,
+        pre_alarm_offsets: Iterable[int] | None = None,
     ) -> dict[str, Any] | None:
         """
         Create data for a new alarm, add it to internal list, and schedule a save.
@@ -336,143 +627,649 @@ class AlarmManager:
         """
         alarm_number = self.get_next_alarm_number()
 
-        if self.add_alarm_data(alarm_number, alarm_datetime):
+        if self.add_alarm_data(
+            alarm_number, alarm_datetime, recurrence, pre_alarm_offsets
+        ):
             LOGGER.debug(
                 "Alarm %s created in manager with datetime %s.",
                 alarm_number,
                 alarm_datetime.isoformat(),  # Log the input datetime for clarity
             )
-            return {
-                "number": alarm_number,
-                "datetime_obj": alarm_datetime,
-            }
+            return self._alarms.get(alarm_number)
         return None
 
     @callback
-    def create_alarm(self, alarm_datetime_utc: datetime) -> AlarmEntity | None:
-        """Create alarm e2e."""
-        created_alarm_data = self._create_alarm_data_and_persist(alarm_datetime_utc)
+    @timed_operation("create_alarm")
+    def create_alarm(
+        self,
+        alarm_datetime_utc: datetime,
+        recurrence: RecurrenceRule | None = None,
+        *,
+        pre_alarm_offsets: Iterable[int] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Create alarm e2e, optionally repeating according to `recurrence`.
+
+        `pre_alarm_offsets` (minutes) replace the configured pre-alarm offsets
+        for this alarm; an empty list disables its pre-alarms.
+        Returns the created alarm data, or None if creation failed.
+        """
+        created_alarm_data = self._create_alarm_data_and_persist(
+            alarm_datetime_utc, recurrence, pre_alarm_offsets
+        )
 
         if created_alarm_data:
-            alarm_number = created_alarm_data["number"]
-            actual_alarm_datetime_utc = created_alarm_data["datetime_obj"]
-            alarm_entity = AlarmEntity(
-                self.hass, self._entry, alarm_number, actual_alarm_datetime_utc
-            )
             self._async_schedule_alarm_event_trigger(
-                alarm_number, actual_alarm_datetime_utc
+                created_alarm_data["number"], created_alarm_data["datetime_obj"]
             )
-            return alarm_entity
-        return None
+            self._async_update_alarm_entities_later(added=[created_alarm_data])
+        return created_alarm_data
+
+    def _create_alarm_entity(self, alarm_data: dict[str, Any]) -> AlarmEntity:
+        """Create the AlarmEntity for an alarm in the index."""
+        return AlarmEntity(
+            self.hass,
+            self._entry,
+            alarm_data["number"],
+            alarm_data["datetime_obj"],
+            recurrence=alarm_data.get("recurrence"),
+        )
 
-    def create_entities_for_loaded_alarms_and_schedule(self) -> list[AlarmEntity]:
+    @callback
+    @timed_operation("create_alarms")
+    def create_alarms(
+        self, alarm_datetimes_utc: list[datetime]
+    ) -> list[dict[str, Any]]:
         """
-        Create AlarmEntity instances for all loaded alarms and schedules triggers.
+        Create many alarms e2e, scheduling a single save for the whole batch.
 
-        Returns a list of created AlarmEntity instances.
+        Returns the data of the alarms that were created.
         """
-        created_entities: list[AlarmEntity] = []
-        for alarm_data in self.get_all_alarms_data():
-            alarm_entity = AlarmEntity(
-                self.hass,
-                self._entry,
-                alarm_data["number"],
-                alarm_data["datetime_obj"],
+        created_alarms: list[dict[str, Any]] = []
+        alarm_numbers = self._alarm_numbers.allocate_many(len(alarm_datetimes_utc))
+        for alarm_number, alarm_datetime in zip(
+            alarm_numbers, alarm_datetimes_utc, strict=True
+        ):
+            if not self._add_alarm_data_to_index(alarm_number, alarm_datetime):
+                self._alarm_numbers.release(alarm_number)
+                continue
+            alarm_data = self._alarms.get(alarm_number)
+            created_alarms.append(alarm_data)
+            self._async_schedule_alarm_event_trigger(
+                alarm_number, alarm_data["datetime_obj"]
             )
-            created_entities.append(alarm_entity)
+
+        if created_alarms:
+            self._store.async_alarms_saved(created_alarms)
+            self._async_update_alarm_entities_later(added=created_alarms)
+        LOGGER.debug(
+            "Created %s of %s requested alarms. Total alarms: %s.",
+            len(created_alarms),
+            len(alarm_datetimes_utc),
+            len(self._alarms),
+        )
+        return created_alarms
+
+    @callback
+    def create_entities_for_loaded_alarms_and_schedule(self) -> None:
+        """Create AlarmEntity instances for the loaded alarms and schedule triggers."""
+        self._async_catch_up_past_due_alarms()
+        loaded_alarms = self.get_all_alarms_data()
+        for alarm_data in loaded_alarms:
             self._async_schedule_alarm_event_trigger(
                 alarm_data["number"], alarm_data["datetime_obj"]
             )
-        return created_entities
+        self._async_update_alarm_entities_later(added=loaded_alarms)
+
+    @callback
+    def _async_update_alarm_entities(
+        self,
+        added: Iterable[dict[str, Any]] = (),
+        removed: Iterable[int] = (),
+    ) -> list[AlarmEntity]:
+        """
+        Bring the AlarmEntity sensors in line with the alarms.
+
+        Without an entity limit, entities are created for `added` alarms and
+        dropped for `removed` numbers. With a limit of K, only the K nearest
+        alarms keep an entity: later alarms are plain records that get promoted
+        as earlier ones fire or are deleted.
+
+        New entities are added right away, unless the old entity of the same
+        alarm number is still being removed; those are added once it is gone.
+        The entities that must go are returned so the caller can await their
+        removal.
+        """
+        alarm_entities = self._entry.runtime_data.alarm_entities
+        if self._max_alarm_entities:
+            window = list(islice(self._alarms.by_time(), self._max_alarm_entities))
+            window_numbers = {alarm["number"] for alarm in window}
+            # Ringing alarms keep their entity so they can be snoozed in place
+            window_numbers.update(self._ringing)
+            to_add = [a for a in window if a["number"] not in alarm_entities]
+            to_remove = [n for n in alarm_entities if n not in window_numbers]
+        else:
+            to_add = [a for a in added if a["number"] not in alarm_entities]
+            to_remove = [n for n in removed if n in alarm_entities]
+
+        entities_to_remove = [alarm_entities.pop(n) for n in to_remove]
+        self._removing_entity_numbers.update(to_remove)
+        if self._removing_entity_numbers:
+            readd = [a for a in to_add if a["number"] in self._removing_entity_numbers]
+            self._readd_entity_numbers.update(alarm["number"] for alarm in readd)
+            to_add = [
+                a for a in to_add if a["number"] not in self._removing_entity_numbers
+            ]
+        new_entities = [self._create_alarm_entity(alarm) for alarm in to_add]
+        for entity in new_entities:
+            alarm_entities[entity.alarm_number] = entity
+        if new_entities:
+            if self._async_add_entities is None:
+                LOGGER.warning("Alarm entities created before the platform was set up")
+            else:
+                self._async_add_entities(new_entities)
+        return entities_to_remove
+
+    @callback
+    def _async_update_alarm_entities_later(
+        self,
+        added: Iterable[dict[str, Any]] = (),
+        removed: Iterable[int] = (),
+    ) -> None:
+        """Update the AlarmEntity sensors, removing stale ones in the background."""
+        if entities_to_remove := self._async_update_alarm_entities(added, removed):
+            self.hass.async_create_task(
+                self._async_remove_alarm_entities(entities_to_remove)
+            )
 
     @callback
     def _async_schedule_alarm_event_trigger(
         self, alarm_number: int, alarm_datetime_utc: datetime
     ) -> None:
         """Schedule an event to be fired when the alarm time is reached."""
-
-        @callback
-        async def _fire_alarm_event_callback(_now: datetime) -> None:
-            """Execute callback when alarm time is reached."""
-            LOGGER.info(
-                "Alarm %s for entry %s triggered (scheduled for %s)",
+        if alarm_datetime_utc <= dt_util.utcnow():
+            LOGGER.debug(
+                "Alarm %s for entry %s is in the past (%s). Firing NOW.",
                 alarm_number,
                 self._entry_id,
                 alarm_datetime_utc.isoformat(),
             )
-            self.hass.bus.async_fire(
-                EVENT_ALARM_TRIGGERED,
-                {
-                    "config_entry_id": self._entry_id,
-                    "alarm_number": alarm_number,
-                    "alarm_datetime": alarm_datetime_utc.isoformat(),
-                },
-            )
-            self.trigger_is_alarming_sensor()
-            await self.delete_alarm(alarm_number)  # Remove alarm after firing
-            if alarm_number in self._entry.runtime_data.scheduled_alarm_triggers:
-                del self._entry.runtime_data.scheduled_alarm_triggers[alarm_number]
-
-        if alarm_datetime_utc <= dt_util.utcnow():
+        else:
             LOGGER.debug(
-                "Alarm %s for entry %s is in the past (%s). Firing NOW.",
+                "Scheduling event for alarm %s at %s (UTC)",
                 alarm_number,
-                self._entry_id,
                 alarm_datetime_utc.isoformat(),
             )
-            # If the alarm time is in the past, fire immediately
-            self.hass.async_create_task(_fire_alarm_event_callback(dt_util.utcnow()))
-            return
+        # Past alarms are picked up by the scheduler on the next loop iteration
+        self._scheduler.async_schedule(
+            (_ALARM_JOB, self._entry_id, alarm_number),
+            alarm_datetime_utc,
+            self._async_on_due_jobs,
+            self._alarm_timing,
+        )
+        if (alarm := self._alarms.get(alarm_number)) is not None:
+            self._async_schedule_pre_alarm_triggers(alarm, alarm_datetime_utc)
 
+    def _get_pre_alarm_offsets(self, alarm: dict[str, Any]) -> tuple[int, ...]:
+        """Return the pre-alarm lead times of an alarm in minutes."""
+        return alarm.get("pre_alarm_offsets", self._pre_alarm_offsets)
+
+    @callback
+    def _async_schedule_pre_alarm_triggers(
+        self, alarm: dict[str, Any], alarm_datetime_utc: datetime
+    ) -> None:
+        """
+        Schedule the pre-alarm events of an alarm on the shared scheduler.
+
+        Their keys add the offset to the alarm's own. Lead times that have
+        already passed are skipped, and their jobs left from an earlier time
+        are cancelled.
+        """
+        now = dt_util.utcnow()
+        for offset in self._get_pre_alarm_offsets(alarm):
+            key = (_PRE_ALARM_JOB, self._entry_id, alarm["number"], offset)
+            pre_alarm_datetime = alarm_datetime_utc - timedelta(minutes=offset)
+            if pre_alarm_datetime > now:
+                self._scheduler.async_schedule(
+                    key,
+                    pre_alarm_datetime,
+                    self._async_on_due_jobs,
+                    self._pre_alarm_timing,
+                )
+            else:
+                self._scheduler.async_cancel(key)
+
+    @callback
+    def _async_on_due_jobs(self, keys: list[Hashable]) -> None:
+        """Fire the alarms and pre-alarms the shared scheduler found due."""
+        alarm_numbers: list[int] = []
+        stopped_numbers: list[int] = []
+        for kind, _, alarm_number, *offset in keys:
+            if kind == _ALARM_JOB:
+                alarm_numbers.append(alarm_number)
+            elif kind == _RINGING_JOB:
+                stopped_numbers.append(alarm_number)
+            else:  # _PRE_ALARM_JOB
+                self._async_fire_pre_alarm_event(alarm_number, offset[0])
+        if alarm_numbers:
+            self._async_fire_due_alarms(alarm_numbers)
+        if stopped_numbers:
+            self._async_stop_ringing(stopped_numbers)
+
+    @callback
+    def _async_fire_pre_alarm_event(self, alarm_number: int, offset: int) -> None:
+        """Fire the pre-alarm event of an alarm `offset` minutes before it."""
+        alarm = self._alarms.get(alarm_number)
+        if alarm is None:
+            return
         LOGGER.debug(
-            "Scheduling event for alarm %s at %s (UTC)",
+            "Pre-alarm %s minutes before alarm %s for entry %s",
+            offset,
             alarm_number,
+            self._entry_id,
+        )
+        self.hass.bus.async_fire(
+            EVENT_PRE_ALARM,
+            {
+                "config_entry_id": self._entry_id,
+                "alarm_number": alarm_number,
+                "alarm_datetime": alarm["datetime_obj"].isoformat(),
+                "offset": offset,
+                "fired_at": dt_util.utcnow().isoformat(),
+            },
+        )
+
+    @callback
+    def _async_fire_due_alarms(self, alarm_numbers: list[int]) -> None:
+        """
+        Fire all alarms that became due in one scheduler wake-up.
+
+        With a coalescing window they share a single triggered event, otherwise
+        each fires its own. Either way the fire listeners are told once,
+        one-shot alarms are deleted in one batch and recurring alarms move on
+        to their next occurrence with a single sensor refresh. With a snooze
+        window, the fired alarms ring until it ends, and one-shot alarms are
+        only deleted then.
+        """
+        due_alarms = sorted(
+            (
+                alarm
+                for alarm_number in alarm_numbers
+                if (alarm := self._alarms.get(alarm_number)) is not None
+            ),
+            key=lambda alarm: (alarm["datetime_obj"], alarm["number"]),
+        )
+        if not due_alarms:
+            return
+
+        fired_at = dt_util.utcnow()
+        if self._coalesce_window:
+            self._async_fire_alarm_event(due_alarms, fired_at)
+        else:
+            for alarm in due_alarms:
+                self._async_fire_alarm_event([alarm], fired_at)
+        for alarm in due_alarms:
+            lateness = fired_at - alarm["datetime_obj"]
+            self.metrics.fire_lateness.record(lateness.total_seconds() * 1000)
+        self.notify_fire_listeners(due_alarms)
+
+        one_shot_numbers: list[int] = []
+        moved = False
+        for alarm in due_alarms:
+            recurrence: RecurrenceRule | None = alarm.get("recurrence")
+            if recurrence is None:
+                one_shot_numbers.append(alarm["number"])
+                continue
+            # Recurring alarms move on to their next occurrence in place, or
+            # back to the one they were snoozed from
+            resume_at: datetime | None = alarm.pop("resume_at", None)
+            if resume_at is None or resume_at <= fired_at:
+                resume_at = recurrence.next_occurrence(
+                    resume_at or alarm["datetime_obj"], fired_at
+                )
+            self._async_move_alarm(alarm["number"], resume_at)
+            moved = True
+        if self._snooze_window:
+            self._async_start_ringing(due_alarms, fired_at)
+        elif one_shot_numbers:
+            # Remove alarms after firing; this also refreshes the sensor
+            self.hass.async_create_task(self.delete_alarms(one_shot_numbers))
+            return
+        if one_shot_numbers or moved:
+            self.refresh_sensor()
+
+    @callback
+    def _async_start_ringing(
+        self, alarms: list[dict[str, Any]], fired_at: datetime
+    ) -> None:
+        """
+        Keep fired alarms ringing, so they can be snoozed, until the window ends.
+
+        One-shot alarms leave the index, so they are no longer the next alarm,
+        but keep their number, entity and stored record until they are snoozed
+        or stop ringing.
+        """
+        ringing_until = fired_at + self._snooze_window
+        for alarm in alarms:
+            alarm_number = alarm["number"]
+            if alarm.get("recurrence") is None:
+                self._alarms.remove(alarm_number)
+            self._ringing[alarm_number] = alarm
+            self._scheduler.async_schedule(
+                (_RINGING_JOB, self._entry_id, alarm_number),
+                ringing_until,
+                self._async_on_due_jobs,
+            )
+        if self._max_alarm_entities:
+            # The next alarm may move into the entity window
+            self._async_update_alarm_entities_later()
+
+    @callback
+    def _async_stop_ringing(self, alarm_numbers: list[int]) -> None:
+        """End the snooze window of alarms, deleting the one-shot ones."""
+        one_shot_numbers: list[int] = []
+        for alarm_number in alarm_numbers:
+            alarm = self._ringing.get(alarm_number)
+            if alarm is None:
+                continue
+            if alarm_number in self._alarms:
+                # A recurring alarm has already moved on to its next occurrence
+                del self._ringing[alarm_number]
+            else:
+                one_shot_numbers.append(alarm_number)
+        if one_shot_numbers:
+            self.hass.async_create_task(self.delete_alarms(one_shot_numbers))
+
+    @callback
+    @timed_operation("update_alarm")
+    def update_alarm(
+        self, alarm_number: int, alarm_datetime_utc: datetime
+    ) -> dict[str, Any] | None:
+        """
+        Move an alarm to a new time in place.
+
+        The alarm keeps its number, entity and recurrence: only its trigger is
+        re-armed, its entity state is written once and its record is saved.
+        Returns the moved alarm, or None if there is no such alarm.
+        """
+        alarm_datetime_utc = dt_util.as_utc(alarm_datetime_utc)
+        if not self._async_move_alarm(alarm_number, alarm_datetime_utc):
+            LOGGER.warning(
+                "Attempted to update non-existent alarm number %s.", alarm_number
+            )
+            return None
+        self.refresh_sensor()
+        return self._alarms.get(alarm_number)
+
+    @callback
+    @timed_operation("snooze_alarms")
+    def snooze_alarms(
+        self, minutes: float, alarm_number: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Snooze ringing alarms for `minutes` from now.
+
+        Without a number, every ringing alarm of the entry is snoozed. Alarms
+        move in place, keeping their number and entity. A recurring alarm has
+        already moved on to its next occurrence; it remembers it in
+        "resume_at" and goes back to it once the snooze has fired.
+        Returns the snoozed alarms.
+        """
+        if alarm_number is None:
+            alarm_numbers = list(self._ringing)
+        elif alarm_number in self._ringing:
+            alarm_numbers = [alarm_number]
+        else:
+            return []
+        snooze_until = dt_util.utcnow() + timedelta(minutes=minutes)
+        snoozed_alarms: list[dict[str, Any]] = []
+        for number in alarm_numbers:
+            alarm = self._ringing[number]
+            if alarm.get("recurrence") is not None:
+                # Still in the index, at its next occurrence
+                del self._ringing[number]
+                self._scheduler.async_cancel((_RINGING_JOB, self._entry_id, number))
+                alarm["resume_at"] = alarm["datetime_obj"]
+            self._async_move_alarm(number, snooze_until)
+            snoozed_alarms.append(alarm)
+        if snoozed_alarms:
+            LOGGER.debug(
+                "Snoozed alarms %s until %s",
+                [alarm["number"] for alarm in snoozed_alarms],
+                snooze_until.isoformat(),
+            )
+            self.refresh_sensor()
+        return snoozed_alarms
+
+    @callback
+    def _async_fire_alarm_event(
+        self, alarms: list[dict[str, Any]], fired_at: datetime
+    ) -> None:
+        """
+        Fire one triggered event for alarms that fire together.
+
+        The event describes the earliest alarm and lists the numbers of all of
+        them in `alarm_numbers`.
+        """
+        first_alarm = alarms[0]
+        alarm_datetime_utc: datetime = first_alarm["datetime_obj"]
+        lateness = fired_at - alarm_datetime_utc
+        alarm_numbers = [alarm["number"] for alarm in alarms]
+        LOGGER.info(
+            "Alarms %s for entry %s triggered (scheduled for %s, %.3fs late)",
+            alarm_numbers,
+            self._entry_id,
             alarm_datetime_utc.isoformat(),
+            lateness.total_seconds(),
         )
-        unregister_listener = async_track_point_in_time(
-            self.hass, _fire_alarm_event_callback, alarm_datetime_utc
+        self.hass.bus.async_fire(
+            EVENT_ALARM_TRIGGERED,
+            {
+                "config_entry_id": self._entry_id,
+                "alarm_number": first_alarm["number"],
+                "alarm_numbers": alarm_numbers,
+                "alarm_datetime": alarm_datetime_utc.isoformat(),
+                "fired_at": fired_at.isoformat(),
+                "lateness": lateness.total_seconds(),
+            },
         )
-        self._entry.runtime_data.scheduled_alarm_triggers[alarm_number] = (
-            unregister_listener
+
+    @callback
+    def _async_catch_up_past_due_alarms(self) -> None:
+        """
+        Handle loaded alarms that became due while Home Assistant was down.
+
+        Depending on the catch-up policy, all of them fire, only the latest one
+        fires, or only those within the grace period fire; the rest are dropped.
+        One-shot alarms are removed and recurring ones move to their next
+        occurrence, all in one batch with a single save and a summary event.
+        This runs before the alarm entities are created, so no entities churn.
+        """
+        now = dt_util.utcnow()
+        past_due = list(
+            takewhile(lambda a: a["datetime_obj"] <= now, self._alarms.by_time())
         )
+        if not past_due:
+            return
+
+        if self._catch_up_policy == CATCH_UP_FIRE_LATEST:
+            to_fire, to_drop = past_due[-1:], past_due[:-1]
+        elif self._catch_up_policy == CATCH_UP_GRACE_PERIOD:
+            oldest_to_fire = now - self._catch_up_grace_period
+            to_fire = [a for a in past_due if a["datetime_obj"] >= oldest_to_fire]
+            to_drop = [a for a in past_due if a["datetime_obj"] < oldest_to_fire]
+        else:
+            to_fire, to_drop = past_due, []
+
+        for alarm in to_fire:
+            self._async_fire_alarm_event([alarm], now)
+        if to_fire:
+            # Replayed to the fire listeners as they are added
+            self.notify_fire_listeners(to_fire)
+
+        one_shot_numbers: list[int] = []
+        moved_alarms: list[dict[str, Any]] = []
+        for alarm in past_due:
+            recurrence: RecurrenceRule | None = alarm.get("recurrence")
+            if recurrence is None:
+                one_shot_numbers.append(alarm["number"])
+            else:
+                self._move_alarm_in_index(
+                    alarm, recurrence.next_occurrence(alarm["datetime_obj"], now)
+                )
+                moved_alarms.append(alarm)
+        # The summary sensor picks up the result when it is first written
+        self._store.async_alarms_removed(
+            self._remove_alarms_from_index(one_shot_numbers)
+        )
+        self._store.async_alarms_saved(moved_alarms)
+
+        fired_numbers = [alarm["number"] for alarm in to_fire]
+        dropped_numbers = [alarm["number"] for alarm in to_drop]
+        LOGGER.info(
+            "Caught up on %s past-due alarms for entry %s (policy %s): "
+            "fired %s, dropped %s",
+            len(past_due),
+            self._entry_id,
+            self._catch_up_policy,
+            fired_numbers,
+            dropped_numbers,
+        )
+        self.hass.bus.async_fire(
+            EVENT_ALARMS_CAUGHT_UP,
+            {
+                "config_entry_id": self._entry_id,
+                "policy": self._catch_up_policy,
+                "fired_alarm_numbers": fired_numbers,
+                "dropped_alarm_numbers": dropped_numbers,
+            },
+        )
+
+    def _move_alarm_in_index(
+        self, alarm: dict[str, Any], alarm_datetime_utc: datetime
+    ) -> None:
+        """Re-index an alarm under a new time."""
+        self._alarms.remove(alarm["number"])
+        alarm["datetime_obj"] = alarm_datetime_utc
+        self._alarms.add(alarm)
+
+    @callback
+    def _remove_alarms_from_index(self, alarm_numbers: Iterable[int]) -> list[int]:
+        """
+        Remove alarms and their triggers, without touching entities or saving.
+
+        Returns the numbers that were actually removed.
+        """
+        removed_numbers: list[int] = []
+        for alarm_number in alarm_numbers:
+            alarm = self._alarms.remove(alarm_number)
+            if (ringing_alarm := self._ringing.pop(alarm_number, None)) is not None:
+                self._scheduler.async_cancel(
+                    (_RINGING_JOB, self._entry_id, alarm_number)
+                )
+                alarm = alarm or ringing_alarm
+            if alarm is None:
+                continue
+            self._alarm_numbers.release(alarm_number)
+            self._scheduler.async_cancel((_ALARM_JOB, self._entry_id, alarm_number))
+            for offset in self._get_pre_alarm_offsets(alarm):
+                self._scheduler.async_cancel(
+                    (_PRE_ALARM_JOB, self._entry_id, alarm_number, offset)
+                )
+            removed_numbers.append(alarm_number)
+        return removed_numbers
+
+    @callback
+    def _async_move_alarm(
+        self, alarm_number: int, alarm_datetime_utc: datetime
+    ) -> bool:
+        """
+        Move an existing alarm to a new time, keeping its number and entity.
+
+        Re-arms only this alarm's trigger, updates its entity state in place and
+        schedules a save. A ringing one-shot alarm goes back into the index.
+        Returns True if the alarm exists.
+        """
+        alarm = self._alarms.get(alarm_number)
+        if alarm is None:
+            alarm = self._ringing.pop(alarm_number, None)
+            if alarm is None:
+                return False
+            self._scheduler.async_cancel((_RINGING_JOB, self._entry_id, alarm_number))
+        self._move_alarm_in_index(alarm, alarm_datetime_utc)
+        self._async_schedule_alarm_event_trigger(alarm_number, alarm_datetime_utc)
+        alarm_entity = self._entry.runtime_data.alarm_entities.get(alarm_number)
+        if alarm_entity is not None:
+            alarm_entity.async_set_alarm_time(alarm_datetime_utc)
+        if self._max_alarm_entities:
+            # Moving may push the alarm out of (or pull it into) the window
+            self._async_update_alarm_entities_later()
+        self._store.async_alarms_saved([alarm])
+        LOGGER.debug(
+            "Alarm %s moved to %s", alarm_number, alarm_datetime_utc.isoformat()
+        )
+        return True
 
     @callback
-    def add_alarm_data(self, alarm_number: int, alarm_datetime: datetime) -> bool:
+    def add_alarm_data(
+        self,
+        alarm_number: int,
+        alarm_datetime: datetime,
+        recurrence: RecurrenceRule | None = None,
+        pre_alarm_offsets: Iterable[int] | None = None,
+    ) -> bool:
         """Add an alarm and update internal list. Returns True if successful."""
-        alarm_datetime_utc = alarm_datetime.astimezone(UTC)
+        if not self._add_alarm_data_to_index(
+            alarm_number, alarm_datetime, recurrence, pre_alarm_offsets
+        ):
+            return False
+        self._store.async_alarms_saved([self._alarms.get(alarm_number)])
+        return True
 
-        if any(alarm["number"] == alarm_number for alarm in self._alarms):
+    @callback
+    def _add_alarm_data_to_index(
+        self,
+        alarm_number: int,
+        alarm_datetime: datetime,
+        recurrence: RecurrenceRule | None = None,
+        pre_alarm_offsets: Iterable[int] | None = None,
+    ) -> bool:
+        """Add an alarm to the index without saving. Returns True if successful."""
+        alarm_datetime_utc = alarm_datetime.astimezone(UTC)
+        alarm: dict[str, Any] = {
+            "number": alarm_number,
+            "datetime_obj": alarm_datetime_utc,
+        }
+        if recurrence is not None:
+            alarm["recurrence"] = recurrence
+        if pre_alarm_offsets is not None:
+            alarm["pre_alarm_offsets"] = _parse_pre_alarm_offsets(pre_alarm_offsets)
+
+        if not self._alarms.add(alarm):
             LOGGER.warning(
                 "Attempted to add alarm with duplicate number %s. Skipping.",
                 alarm_number,
             )
             return False
 
-        self._alarms.append(
-            {"number": alarm_number, "datetime_obj": alarm_datetime_utc}
-        )
-        if alarm_number in self._free_alarm_numbers:
-            self._free_alarm_numbers.remove(alarm_number)
+        self._alarm_numbers.reserve(alarm_number)
         LOGGER.debug(
-            "Alarm %s (datetime: %s) added. Total alarms: %s. Scheduling save.",
+            "Alarm %s (datetime: %s) added. Total alarms: %s.",
             alarm_number,
             alarm_datetime_utc.isoformat(),
             len(self._alarms),
         )
-        self.hass.async_create_task(self._async_save_alarms_to_store())
         return True
 
     @callback
     def _async_cancel_scheduled_alarm_trigger(self, alarm_number: int) -> None:
         """Cancel a scheduled alarm event trigger."""
-        if alarm_number in self._entry.runtime_data.scheduled_alarm_triggers:
+        if self._scheduler.async_cancel((_ALARM_JOB, self._entry_id, alarm_number)):
             LOGGER.debug(
-                "Cancelling scheduled event for alarm %s for entry %s",
+                "Cancelled scheduled event for alarm %s for entry %s",
                 alarm_number,
                 self._entry_id,
             )
-            # Call the unregister callback and remove from dict
-            self._entry.runtime_data.scheduled_alarm_triggers.pop(alarm_number)()
         else:
             LOGGER.debug(
                 "No scheduled event found for alarm %s (entry %s) to cancel.",
@@ -481,75 +1278,139 @@ class AlarmManager:
             )
 
     @callback
+    @timed_operation("delete_all_alarms")
     async def delete_all_alarms(self) -> int:
-        """Delete all alarms, update internal list, and schedule save."""
-        deleted_count = 0
-        # Iterate over a copy of the list because delete_alarm modifies self._alarms
-        # and removes items from self._entry.runtime_data.alarm_entities
-        for alarm_data in list(self._alarms):
-            if await self.delete_alarm(alarm_data["number"]):
-                deleted_count += 1
+        """
+        Delete all alarms in one step.
+
+        The in-memory state is dropped and all triggers are cancelled at once,
+        entities are removed concurrently, and a single save and sensor refresh
+        are done for the whole batch.
+        """
+        deleted_count = len(self._alarms) + sum(
+            alarm_number not in self._alarms for alarm_number in self._ringing
+        )
+        if deleted_count:
+            self._alarms.clear()
+            self._ringing.clear()
+            self._alarm_numbers.reset()
+            self._scheduler.async_cancel_action(self._async_on_due_jobs)
+            self._store.async_alarms_cleared()
+
+            entities_to_remove = list(self._entry.runtime_data.alarm_entities.values())
+            self._entry.runtime_data.alarm_entities = {}
+            await self._async_remove_alarm_entities(entities_to_remove)
 
         LOGGER.debug("Deleted %s alarms.", deleted_count)
         self.refresh_sensor()
         return deleted_count
 
+    async def _async_remove_alarm_entities(self, entities: list[AlarmEntity]) -> None:
+        """Remove alarm entities concurrently, then drop them from the registry."""
+        if not entities:
+            return
+        alarm_numbers = {entity.alarm_number for entity in entities}
+        self._removing_entity_numbers.update(alarm_numbers)
+        LOGGER.debug("Removing %s alarm entities", len(entities))
+        try:
+            await asyncio.gather(*(entity.async_remove() for entity in entities))
+            er = entity_registry.async_get(self.hass)
+            for entity in entities:
+                er.async_remove(entity.entity_id)
+        finally:
+            self._removing_entity_numbers -= alarm_numbers
+        # Alarms that got their entity back while the old one was removed
+        if readd := alarm_numbers & self._readd_entity_numbers:
+            self._readd_entity_numbers -= readd
+            self._async_update_alarm_entities_later(
+                added=[a for n in sorted(readd) if (a := self.get_alarm(n)) is not None]
+            )
+
     @callback
+    @timed_operation("delete_alarm")
     async def delete_alarm(self, alarm_number: int) -> bool:
         """Delete an alarm by its number, update internal list, and schedule save."""
-        initial_alarm_count = len(self._alarms)
-        self._alarms = [
-            alarm for alarm in self._alarms if alarm["number"] != alarm_number
-        ]
-
-        if len(self._alarms) < initial_alarm_count:
-            LOGGER.debug(
-                "Alarm %s removed from manager. Total alarms: %s. Scheduling save.",
-                alarm_number,
-                len(self._alarms),
-            )
-            self._free_alarm_numbers.add(alarm_number)
-            self._async_cancel_scheduled_alarm_trigger(
-                alarm_number
-            )  # Cancel scheduled event
-            self.hass.async_create_task(self._async_save_alarms_to_store())
-            entity_to_remove = self._entry.runtime_data.alarm_entities.pop(
-                alarm_number, None
+        if alarm_number not in self._alarms and alarm_number not in self._ringing:
+            LOGGER.warning(
+                "Attempted to delete non-existent alarm number %s.", alarm_number
             )
-            if entity_to_remove:
-                LOGGER.debug("Removing alarm entity: %s", entity_to_remove.entity_id)
-                await entity_to_remove.async_remove()
-                er = entity_registry.async_get(self.hass)
-                er.async_remove(entity_to_remove.entity_id)
-            else:
-                LOGGER.warning(
-                    "Alarm entity for number %s not found in runtime data for removal.",
-                    alarm_number,
-                )
-            self.refresh_sensor()
-            return True
-        LOGGER.warning(
-            "Attempted to delete non-existent alarm number %s.", alarm_number
-        )
+            return False
+        await self.delete_alarms([alarm_number])
+        return True
+
+    @callback
+    @timed_operation("delete_alarms")
+    async def delete_alarms(self, alarm_numbers: Iterable[int]) -> list[int]:
+        """
+        Delete many alarms in one batch.
 
-        return False
+        Their entities are removed concurrently with a single registry pass,
+        and the store and the sensors are updated once. Unknown numbers are
+        skipped. Returns the numbers that were deleted.
+        """
+        removed_numbers = self._remove_alarms_from_index(alarm_numbers)
+        if not removed_numbers:
+            return []
+        LOGGER.debug(
+            "Alarms %s removed from manager. Total alarms: %s.",
+            removed_numbers,
+            len(self._alarms),
+        )
+        self._store.async_alarms_removed(removed_numbers)
+        await self._async_remove_alarm_entities(
+            self._async_update_alarm_entities(removed=removed_numbers)
+        )
+        self.refresh_sensor()
+        return removed_numbers
 
     @callback
     def async_cancel_all_scheduled_triggers(self) -> None:
-        """Cancel all scheduled alarm triggers for this manager's entry."""
+        """Cancel this entry's alarm triggers and leave the shared scheduler."""
         LOGGER.debug(
             "Cancelling all scheduled alarm triggers for entry %s", self._entry_id
         )
-        for alarm_num in list(self._entry.runtime_data.scheduled_alarm_triggers.keys()):
-            self._async_cancel_scheduled_alarm_trigger(alarm_num)
+        self._scheduler.async_cancel_action(self._async_on_due_jobs)
+
+    @timed_operation("save_alarms")
+    async def async_save_alarms_to_store(self) -> None:
+        """Write pending alarm changes to the store now."""
+        await self._store.async_flush()
+
+    async def async_close_store(self) -> None:
+        """Write pending alarm changes and release the store."""
+        # Ringing one-shot alarms have fired, they must not be caught up again
+        if ringing_numbers := [n for n in self._ringing if n not in self._alarms]:
+            self._store.async_alarms_removed(ringing_numbers)
+        await self._store.async_close()
 
-    async def _async_save_alarms_to_store(self) -> None:
-        """Save the current list of alarms to the store."""
+    def _alarms_to_store_data(self) -> dict[str, Any]:
+        """
+        Serialize the current alarms for the store.
+
+        Alarms are stored as parallel arrays of numbers and UTC epoch seconds in
+        time order, with optional per-alarm metadata keyed by alarm number.
+        Ringing one-shot alarms have fired, so they come first, and are kept
+        until they stop ringing or the store is closed, like the SQLite store.
+        """
+        ringing_alarms = sorted(
+            (
+                alarm
+                for alarm_number, alarm in self._ringing.items()
+                if alarm_number not in self._alarms
+            ),
+            key=lambda alarm: alarm["datetime_obj"],
+        )
         LOGGER.debug(
-            "Saving %s alarms to store for %s", len(self._alarms), self._entry_id
+            "Saving %s alarms to store for %s",
+            len(self._alarms) + len(ringing_alarms),
+            self._entry_id,
         )
-        data_to_save = [
-            {"number": alarm["number"], "datetime": alarm["datetime_obj"].isoformat()}
-            for alarm in self._alarms
-        ]
-        await self._store.async_save(data_to_save)
+        numbers: list[int] = []
+        timestamps: list[int] = []
+        metadata: dict[str, dict[str, Any]] = {}
+        for alarm in chain(ringing_alarms, self._alarms.by_time()):
+            numbers.append(alarm["number"])
+            timestamps.append(int(alarm["datetime_obj"].timestamp()))
+            if stored_metadata := alarm_metadata(alarm):
+                metadata[str(alarm["number"])] = stored_metadata
+        return {"numbers": numbers, "timestamps": timestamps, "metadata": metadata}
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import (
     DOMAIN,
@@ -53,8 +54,15 @@ class IsAlarmSensor(WakeUpAlarmEntity, SensorEntity):
         self._attr_options = ["NO", "YES"]
         self.is_alarming = False
 
-    def trigger(self) -> None:
-        """Trigger a refresh of the sensor state."""
+    async def async_added_to_hass(self) -> None:
+        """Pulse the state whenever the alarm manager fires an alarm."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._alarm_manager.async_add_fire_listener(self.trigger))
+
+    @callback
+    def trigger(self, alarms: list[dict[str, Any]]) -> None:
+        """Pulse the sensor state for fired alarms."""
+        del alarms  # Unused, the sensor only pulses
         LOGGER.debug("Refreshing is alarming sensor")
         self.is_alarming = True
         self.async_write_ha_state()
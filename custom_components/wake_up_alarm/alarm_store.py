@@ -0,0 +1,292 @@
+"""Persistence of alarms for wake_up_alarm."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import datetime
+
+
+def _migrate_v1_alarms(alarms_raw: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Convert version 1 alarms to the version 2 layout.
+
+    Version 1 stored a list of {"number", "datetime": isoformat} objects.
+    Version 2 stores parallel arrays of numbers and UTC epoch seconds, plus
+    per-alarm metadata keyed by the alarm number.
+    """
+    numbers: list[int] = []
+    timestamps: list[int] = []
+    metadata: dict[str, dict[str, Any]] = {}
+    for alarm_raw in alarms_raw:
+        try:
+            if not all(k in alarm_raw for k in ("number", "datetime")):
+                LOGGER.warning("Skipping malformed alarm data: %s", alarm_raw)
+                continue
+            if not isinstance(alarm_raw["number"], int) or not isinstance(
+                alarm_raw["datetime"], str
+            ):
+                LOGGER.warning(
+                    "Skipping alarm data with incorrect types: %s", alarm_raw
+                )
+                continue
+
+            parsed_datetime_raw = dt_util.parse_datetime(alarm_raw["datetime"])
+            if parsed_datetime_raw is None:
+                LOGGER.warning(
+                    "Could not parse datetime string for alarm: %s", alarm_raw
+                )
+                continue
+
+            if parsed_datetime_raw.tzinfo is None:
+                LOGGER.warning(
+                    "Alarm datetime '%s' for number %s is no tz, assuming UTC.",
+                    alarm_raw["datetime"],
+                    alarm_raw["number"],
+                )
+                parsed_datetime = parsed_datetime_raw.replace(tzinfo=dt_util.UTC)
+            else:
+                parsed_datetime = dt_util.as_utc(parsed_datetime_raw)
+
+            numbers.append(alarm_raw["number"])
+            timestamps.append(int(parsed_datetime.timestamp()))
+            if alarm_raw.get("recurrence"):
+                metadata[str(alarm_raw["number"])] = {
+                    "recurrence": alarm_raw["recurrence"]
+                }
+        except (TypeError, ValueError) as ex:
+            LOGGER.warning("Could not parse stored alarm %s: %s", alarm_raw, ex)
+
+    return {"numbers": numbers, "timestamps": timestamps, "metadata": metadata}
+
+
+class _AlarmStorage(Store[dict[str, Any]]):
+    """Store that migrates older alarm storage formats when loading."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: Any,
+    ) -> dict[str, Any]:
+        """Migrate stored alarms to the current version."""
+        del old_minor_version  # Unused
+        if old_major_version == 1:
+            LOGGER.info("Migrating %s to storage version 2", self.key)
+            return _migrate_v1_alarms(old_data)
+        return old_data
+
+
+def alarm_metadata(alarm: dict[str, Any]) -> dict[str, Any]:
+    """Return the stored metadata of an alarm, empty if it has none."""
+    metadata: dict[str, Any] = {}
+    if "recurrence" in alarm:
+        metadata["recurrence"] = alarm["recurrence"].as_dict()
+    if "pre_alarm_offsets" in alarm:
+        metadata["pre_alarm_offsets"] = list(alarm["pre_alarm_offsets"])
+    if "resume_at" in alarm:
+        metadata["resume_at"] = int(alarm["resume_at"].timestamp())
+    return metadata
+
+
+class AlarmStorageBackend(ABC):
+    """
+    Interface the AlarmManager persists its alarms through.
+
+    Data is exchanged in the storage version 2 layout: parallel "numbers" and
+    "timestamps" (UTC epoch seconds) arrays in time order, plus "metadata"
+    keyed by the alarm number as a string. The manager reports each change as
+    it happens, so backends can write just the affected alarms.
+    """
+
+    @property
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """Return write counters for this backend."""
+
+    @abstractmethod
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored alarms, or return None if nothing was ever stored."""
+
+    @abstractmethod
+    async def async_import(self, data: dict[str, Any]) -> None:
+        """Replace the stored alarms with data loaded from another backend."""
+
+    @abstractmethod
+    async def async_remove(self) -> None:
+        """Remove everything this backend stored."""
+
+    @callback
+    @abstractmethod
+    def async_alarms_saved(self, alarms: Iterable[dict[str, Any]]) -> None:
+        """Persist alarms that were added or changed."""
+
+    @callback
+    @abstractmethod
+    def async_alarms_removed(self, alarm_numbers: Iterable[int]) -> None:
+        """Persist the removal of alarms."""
+
+    @callback
+    @abstractmethod
+    def async_alarms_cleared(self) -> None:
+        """Persist the removal of every alarm."""
+
+    @abstractmethod
+    async def async_flush(self) -> None:
+        """Write every pending change now."""
+
+    async def async_close(self) -> None:
+        """Write every pending change and release the backend's resources."""
+        await self.async_flush()
+
+
+class AlarmStore(AlarmStorageBackend):
+    """
+    JSON backend that wraps a Store so that bursts of mutations become one write.
+
+    Mutations only mark the store dirty; the data is serialized and written
+    STORAGE_SAVE_DELAY seconds after the first one. Writes whose content
+    matches what is already on disk are skipped, and pending data is flushed
+    on Home Assistant's final write and when the owner flushes explicitly.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        data_func: Callable[[], Any],
+    ) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._store = _AlarmStorage(hass, STORAGE_VERSION, key)
+        self._data_func = data_func
+        self._dirty = False
+        self._last_saved: Any = None
+        self._unsub_delay: CALLBACK_TYPE | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+        self.writes = 0
+        self.coalesced = 0
+        self.skipped = 0
+        # Size of the serialized alarm data in the last and in all writes
+        self.last_write_bytes = 0
+        self.bytes_written = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return write counters for this store."""
+        return {
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "last_write_bytes": self.last_write_bytes,
+            "bytes_written": self.bytes_written,
+        }
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored data."""
+        data = await self._store.async_load()
+        self._last_saved = data
+        return data
+
+    async def async_import(self, data: dict[str, Any]) -> None:
+        """Replace the stored data with data loaded from another backend."""
+        await self._store.async_save(data)
+        self._last_saved = data
+        self.writes += 1
+
+    async def async_remove(self) -> None:
+        """Drop any pending write and remove the stored file."""
+        self._async_cancel_listeners()
+        self._dirty = False
+        self._last_saved = None
+        await self._store.async_remove()
+
+    @callback
+    def async_alarms_saved(self, alarms: Iterable[dict[str, Any]]) -> None:
+        """Schedule a write of the whole alarm list."""
+        del alarms  # The whole list is written
+        self.async_schedule_save()
+
+    @callback
+    def async_alarms_removed(self, alarm_numbers: Iterable[int]) -> None:
+        """Schedule a write of the whole alarm list."""
+        del alarm_numbers  # The whole list is written
+        self.async_schedule_save()
+
+    @callback
+    def async_alarms_cleared(self) -> None:
+        """Schedule a write of the whole alarm list."""
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Mark the data dirty and make sure a delayed write is pending."""
+        if self._dirty:
+            # Merged into the write that is already pending
+            self.coalesced += 1
+        self._dirty = True
+        if self._unsub_delay is None:
+            self._unsub_delay = async_call_later(
+                self.hass, STORAGE_SAVE_DELAY, self._async_handle_delay
+            )
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+            )
+
+    @callback
+    def _async_handle_delay(self, _now: datetime) -> None:
+        """Write the pending data once the delay has passed."""
+        self._unsub_delay = None
+        self.hass.async_create_task(self.async_flush())
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Write the pending data before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    @callback
+    def _async_cancel_listeners(self) -> None:
+        """Cancel the pending delayed write and shutdown listener."""
+        if self._unsub_delay is not None:
+            self._unsub_delay()
+            self._unsub_delay = None
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+
+    async def async_flush(self) -> None:
+        """Write the data now if it changed since the last write."""
+        self._async_cancel_listeners()
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = self._data_func()
+        if data == self._last_saved:
+            self.skipped += 1
+            LOGGER.debug("Alarm data for %s unchanged, skipping write", self._store.key)
+            return
+        self._last_saved = data
+        await self._store.async_save(data)
+        self.writes += 1
+        self.last_write_bytes = len(json_bytes(data))
+        self.bytes_written += self.last_write_bytes
+        LOGGER.debug(
+            "Wrote alarm data for %s (writes: %s, coalesced: %s, skipped: %s)",
+            self._store.key,
+            self.writes,
+            self.coalesced,
+            self.skipped,
+        )
@@ -50,6 +50,15 @@ class AllAlarmsSensor(WakeUpAlarmEntity, SensorEntity):
         self._alarm_manager = alarm_manager
         self._attr_unique_id = f"{self._entry_id}_{self.entity_description.key}"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._cached_attributes_version: int | None = None
+        self._cached_attributes: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the alarm manager's alarms change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._alarm_manager.async_add_listener(self.async_write_ha_state)
+        )
 
     @property
     def native_value(self) -> datetime | None:
@@ -59,13 +68,14 @@ class AllAlarmsSensor(WakeUpAlarmEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes, including the list of alarm times."""
-        alarms_data = self._alarm_manager.get_all_alarms_data()
-        if not alarms_data:
-            return {"alarm_times": [], "alarms_count": 0}
-
-        # Sort by datetime for display purposes in attributes
-        sorted_alarm_times = sorted(alarm["datetime_obj"] for alarm in alarms_data)
-        return {
-            "alarm_times": [dt.isoformat() for dt in sorted_alarm_times],
-            "alarms_count": len(sorted_alarm_times),
-        }
+        # The manager keeps the times sorted and formatted; only rebuild the
+        # attributes when its version says the alarms changed.
+        version = self._alarm_manager.version
+        if version != self._cached_attributes_version:
+            alarm_times = self._alarm_manager.get_alarm_times_iso()
+            self._cached_attributes = {
+                "alarm_times": alarm_times,
+                "alarms_count": len(alarm_times),
+            }
+            self._cached_attributes_version = version
+        return self._cached_attributes
@@ -4,8 +4,38 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers import selector
 
-from .const import DOMAIN
+from .const import (
+    CATCH_UP_POLICIES,
+    CONF_AREA_ID,
+    CONF_CATCH_UP_GRACE_PERIOD,
+    CONF_CATCH_UP_POLICY,
+    CONF_COALESCE_WINDOW,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_EARLY_ARM_MARGIN,
+    CONF_IS_ALARMING_SENSOR,
+    CONF_MAX_ALARM_ENTITIES,
+    CONF_PRE_ALARM_OFFSETS,
+    CONF_SNOOZE_WINDOW,
+    CONF_STORAGE_BACKEND,
+    DEFAULT_CATCH_UP_GRACE_PERIOD,
+    DEFAULT_CATCH_UP_POLICY,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_EARLY_ARM_MARGIN,
+    DEFAULT_IS_ALARMING_SENSOR,
+    DEFAULT_MAX_ALARM_ENTITIES,
+    DEFAULT_NAME,
+    DEFAULT_PRE_ALARM_OFFSETS,
+    DEFAULT_SNOOZE_WINDOW,
+    DEFAULT_STORAGE_BACKEND,
+    DOMAIN,
+    LEGACY_SNOOZE_WINDOW,
+    STORAGE_BACKENDS,
+)
 
 
 class IntegrationFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -13,21 +43,128 @@ class IntegrationFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> IntegrationOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        del config_entry  # Unused, available as self.config_entry in the flow
+        return IntegrationOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
     ) -> config_entries.ConfigFlowResult:
-        """Handle a flow initialized by the user."""
+        """
+        Handle a flow initialized by the user.
+
+        Each entry is a separate set of alarms, e.g. for a bedroom. Assist
+        satellites in the entry's area set and read that entry's alarms.
+        """
         _errors = {}
         if user_input is not None:
-            await self.async_set_unique_id(unique_id="the-one-and-only-config")
-            self._abort_if_unique_id_configured()
-            return self.async_create_entry(title="Alarm Integration", data={})
+            area_id = user_input.get(CONF_AREA_ID)
+            if area_id:
+                self._async_abort_entries_match({CONF_AREA_ID: area_id})
+            return self.async_create_entry(
+                title=user_input[CONF_NAME],
+                data={CONF_AREA_ID: area_id},
+                options={CONF_SNOOZE_WINDOW: DEFAULT_SNOOZE_WINDOW},
+            )
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
-                {},
+                {
+                    vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
+                    vol.Optional(CONF_AREA_ID): selector.AreaSelector(),
+                },
             ),
             errors=_errors,
         )
+
+
+class IntegrationOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for the integration."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_ALARM_ENTITIES,
+                        default=options.get(
+                            CONF_MAX_ALARM_ENTITIES, DEFAULT_MAX_ALARM_ENTITIES
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_CATCH_UP_POLICY,
+                        default=options.get(
+                            CONF_CATCH_UP_POLICY, DEFAULT_CATCH_UP_POLICY
+                        ),
+                    ): vol.In(CATCH_UP_POLICIES),
+                    vol.Required(
+                        CONF_CATCH_UP_GRACE_PERIOD,
+                        default=options.get(
+                            CONF_CATCH_UP_GRACE_PERIOD, DEFAULT_CATCH_UP_GRACE_PERIOD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_EARLY_ARM_MARGIN,
+                        default=options.get(
+                            CONF_EARLY_ARM_MARGIN, DEFAULT_EARLY_ARM_MARGIN
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Required(
+                        CONF_COALESCE_WINDOW,
+                        default=options.get(
+                            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                    vol.Required(
+                        CONF_PRE_ALARM_OFFSETS,
+                        default=options.get(
+                            CONF_PRE_ALARM_OFFSETS, DEFAULT_PRE_ALARM_OFFSETS
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=["5", "10", "15", "30", "60"],
+                            multiple=True,
+                            custom_value=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_SNOOZE_WINDOW,
+                        default=options.get(CONF_SNOOZE_WINDOW, LEGACY_SNOOZE_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                    vol.Required(
+                        CONF_STORAGE_BACKEND,
+                        default=options.get(
+                            CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND
+                        ),
+                    ): vol.In(STORAGE_BACKENDS),
+                    vol.Required(
+                        CONF_DIAGNOSTIC_SENSORS,
+                        default=options.get(
+                            CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_IS_ALARMING_SENSOR,
+                        default=options.get(
+                            CONF_IS_ALARMING_SENSOR, DEFAULT_IS_ALARMING_SENSOR
+                        ),
+                    ): bool,
+                },
+            ),
+        )
@@ -2,6 +2,8 @@
 
 from logging import Logger, getLogger
 
+import voluptuous as vol
+
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "wake_up_alarm"
@@ -10,21 +12,90 @@ SERVICE_TOOL_NAME = "HassAlarmTool"
 
 # Signals
 SIGNAL_ADD_ALARM = f"{DOMAIN}_add_alarm"
+SIGNAL_ADD_ALARMS = f"{DOMAIN}_add_alarms"
 SIGNAL_DELETE_ALARM = f"{DOMAIN}_delete_alarm"
 
 # Services
 SERVICE_ADD_ALARM = "add_alarm"
+SERVICE_ADD_ALARMS = "add_alarms"
 SERVICE_DELETE_ALARM = "delete_alarm"
 SERVICE_DELETE_ALARM_BY_NUMBER = "delete_alarm_by_number"
 SERVICE_DELETE_ALL_ALARMS = "delete_all_alarms"
+SERVICE_LIST_ALARMS = "list_alarms"
+SERVICE_SNOOZE = "snooze"
+SERVICE_UPDATE_ALARM = "update_alarm"
 ATTR_ALARM_DATETIME = "datetime"
+ATTR_ALARM_DATETIMES = "datetimes"
 ATTR_ALARM_NUMBER = "alarm_number"  # Used in signal payload
+ATTR_REPEAT = "repeat"
+ATTR_WEEKDAYS = "weekdays"
+ATTR_INTERVAL_DAYS = "interval_days"
+ATTR_RECURRENCE = "recurrence"  # Used in signal payload
+ATTR_PRE_ALARM_OFFSETS = "pre_alarm_offsets"  # Minutes, used in signal payload
+ATTR_MINUTES = "minutes"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_CURSOR = "cursor"
+DEFAULT_LIST_LIMIT = 100
+MAX_LIST_LIMIT = 1000
 EVENT_ALARM_TRIGGERED = f"{DOMAIN}_alarm_triggered"
+EVENT_ALARMS_CAUGHT_UP = f"{DOMAIN}_alarms_caught_up"
+EVENT_PRE_ALARM = f"{DOMAIN}_pre_alarm"
+EVENT_TYPE_ALARM_FIRED = "alarm_fired"  # Event type of the alarm fired entity
+
+# Config entry data
+CONF_AREA_ID = "area_id"  # Assist satellites in this area use the entry
+DEFAULT_NAME = "Alarms"
+
+# Options
+CONF_MAX_ALARM_ENTITIES = "max_alarm_entities"
+DEFAULT_MAX_ALARM_ENTITIES = 0  # Every alarm gets an entity
+CONF_CATCH_UP_POLICY = "catch_up_policy"
+CONF_CATCH_UP_GRACE_PERIOD = "catch_up_grace_period"  # Minutes
+CATCH_UP_FIRE_ALL = "fire_all"
+CATCH_UP_FIRE_LATEST = "fire_latest"
+CATCH_UP_GRACE_PERIOD = "grace_period"
+CATCH_UP_POLICIES = [CATCH_UP_FIRE_ALL, CATCH_UP_FIRE_LATEST, CATCH_UP_GRACE_PERIOD]
+DEFAULT_CATCH_UP_POLICY = CATCH_UP_FIRE_ALL
+DEFAULT_CATCH_UP_GRACE_PERIOD = 15
+CONF_STORAGE_BACKEND = "storage_backend"
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+STORAGE_BACKENDS = [STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE]
+DEFAULT_STORAGE_BACKEND = STORAGE_BACKEND_JSON
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+DEFAULT_DIAGNOSTIC_SENSORS = False
+CONF_IS_ALARMING_SENSOR = "is_alarming_sensor"  # Legacy YES/NO pulse sensor
+DEFAULT_IS_ALARMING_SENSOR = True
+CONF_EARLY_ARM_MARGIN = "early_arm_margin"  # Seconds
+DEFAULT_EARLY_ARM_MARGIN = 0  # Arm the timer for the alarm time itself
+CONF_COALESCE_WINDOW = "coalesce_window"  # Seconds
+DEFAULT_COALESCE_WINDOW = 0  # Every alarm fires its own event
+CONF_PRE_ALARM_OFFSETS = "pre_alarm_offsets"  # Minutes before every alarm
+DEFAULT_PRE_ALARM_OFFSETS: list[str] = []
+CONF_SNOOZE_WINDOW = "snooze_window"  # Minutes a fired alarm can be snoozed for
+DEFAULT_SNOOZE_WINDOW = 10  # Set on entries when they are created
+LEGACY_SNOOZE_WINDOW = 0  # Older entries delete alarms as soon as they fire
+DEFAULT_SNOOZE_MINUTES = 9
+# Snooze length accepted by the snooze service and intent
+SNOOZE_MINUTES = vol.All(vol.Coerce(float), vol.Range(min=1, max=720))
+
+# Recurrence
+REPEAT_DAILY = "daily"
+REPEAT_WEEKDAYS = "weekdays"
+REPEAT_WEEKLY = "weekly"
+REPEAT_EVERY_N_DAYS = "every_n_days"
+REPEAT_OPTIONS = [REPEAT_DAILY, REPEAT_WEEKDAYS, REPEAT_WEEKLY, REPEAT_EVERY_N_DAYS]
 
 # Storage
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+# Seconds to wait after a change before writing, so bursts become one write
+STORAGE_SAVE_DELAY = 1
 STORAGE_KEY_ALARMS_FORMAT = (
     f"{DOMAIN}_alarms_{{entry_id}}"  # To be formatted with entry.entry_id
 )
 
-HASS_DATA_ALARM_MANAGER = f"{DOMAIN}_alarm_manager"
+HASS_DATA_ALARM_MANAGERS = f"{DOMAIN}_alarm_managers"  # Keyed by entry_id
+HASS_DATA_ALARM_SCHEDULER = f"{DOMAIN}_alarm_scheduler"
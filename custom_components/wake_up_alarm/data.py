@@ -6,8 +6,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
@@ -23,6 +21,3 @@ class WakeUpAlarmData:
 
     integration: Integration
     alarm_entities: dict[int, AlarmEntity] = field(default_factory=dict)
-    scheduled_alarm_triggers: dict[int, Callable[[], None]] = field(
-        default_factory=dict
-    )
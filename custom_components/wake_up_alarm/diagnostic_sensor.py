@@ -0,0 +1,99 @@
+"""Diagnostic sensors for wake_up_alarm."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+
+from .const import DOMAIN
+from .entity import WakeUpAlarmEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.helpers.typing import StateType
+
+    from .alarm_manager import AlarmManager
+    from .data import WakeUpAlarmConfigEntry
+
+
+@dataclass(frozen=True, kw_only=True)
+class AlarmDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor that reports one of the AlarmManager's metrics."""
+
+    value_fn: Callable[[AlarmManager], StateType]
+
+
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[AlarmDiagnosticSensorEntityDescription, ...] = (
+    AlarmDiagnosticSensorEntityDescription(
+        key=f"{DOMAIN}_pending_timers",
+        name="Pending alarm timers",
+        icon="mdi:timer-sand",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda manager: manager.pending_timer_count,
+    ),
+    AlarmDiagnosticSensorEntityDescription(
+        key=f"{DOMAIN}_store_writes",
+        name="Alarm store writes",
+        icon="mdi:content-save",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.store_stats["writes"],
+    ),
+    AlarmDiagnosticSensorEntityDescription(
+        key=f"{DOMAIN}_create_alarm_latency_p95",
+        name="Create alarm latency (p95)",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda manager: manager.metrics.percentile("create_alarm", 0.95),
+    ),
+    AlarmDiagnosticSensorEntityDescription(
+        key=f"{DOMAIN}_delete_alarm_latency_p95",
+        name="Delete alarm latency (p95)",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda manager: manager.metrics.percentile("delete_alarm", 0.95),
+    ),
+    AlarmDiagnosticSensorEntityDescription(
+        key=f"{DOMAIN}_fire_lateness_p95",
+        name="Alarm fire lateness (p95)",
+        icon="mdi:alarm-check",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda manager: manager.metrics.fire_lateness.percentile(0.95),
+    ),
+)
+
+
+class AlarmDiagnosticSensor(WakeUpAlarmEntity, SensorEntity):
+    """Sensor reporting one of the AlarmManager's metrics."""
+
+    # Polled, so reporting metrics adds nothing to the alarm hot paths
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: AlarmDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        entry: WakeUpAlarmConfigEntry,
+        alarm_manager: AlarmManager,
+        description: AlarmDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__()
+        self.entity_description = description
+        self._alarm_manager = alarm_manager
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._alarm_manager)
@@ -0,0 +1,24 @@
+"""Diagnostics support for wake_up_alarm."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .alarm_manager import AlarmManager
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import WakeUpAlarmConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: WakeUpAlarmConfigEntry,
+) -> dict[str, Any]:
+    """Return operation metrics and state sizes for a config entry."""
+    alarm_manager = AlarmManager.get_instance(hass, entry.entry_id)
+    return {
+        "options": dict(entry.options),
+        "alarm_manager": alarm_manager.get_diagnostics() if alarm_manager else None,
+    }
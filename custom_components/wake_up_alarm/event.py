@@ -0,0 +1,31 @@
+"""Event platform for wake_up_alarm."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .alarm_fired_event import AlarmFiredEvent
+from .alarm_manager import AlarmManager
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data import WakeUpAlarmConfigEntry
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: WakeUpAlarmConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event platform for wake_up_alarm."""
+    # Created by the sensor platform, which is set up first
+    alarm_manager = AlarmManager.get_instance(hass, entry.entry_id)
+    if alarm_manager is None:
+        LOGGER.error(
+            "No AlarmManager for entry %s. Skipping event setup.", entry.entry_id
+        )
+        return
+    async_add_entities([AlarmFiredEvent(entry, alarm_manager)])
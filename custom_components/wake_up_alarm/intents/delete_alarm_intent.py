@@ -1,5 +1,7 @@
 """Intent handler for deleting an alarm."""
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import voluptuous as vol
@@ -10,10 +12,8 @@ from homeassistant.helpers import (
     intent,
 )
 
-from custom_components.wake_up_alarm.const import (
-    ATTR_ALARM_NUMBER,
-    HASS_DATA_ALARM_MANAGER,
-)
+from custom_components.wake_up_alarm.const import ATTR_ALARM_NUMBER
+from custom_components.wake_up_alarm.metrics import timed_intent
 
 if TYPE_CHECKING:
     from custom_components.wake_up_alarm.alarm_manager import AlarmManager
@@ -29,9 +29,11 @@ class DeleteAlarmIntent(intent.IntentHandler):
         vol.Required(ATTR_ALARM_NUMBER): cv.positive_int,
     }
 
-    async def async_handle(self, intent_obj: intent.Intent) -> intent.IntentResponse:
+    @timed_intent
+    async def async_handle(
+        self, intent_obj: intent.Intent, alarm_manager: AlarmManager | None
+    ) -> intent.IntentResponse:
         """Handle the intent."""
-        hass = intent_obj.hass
         slots = self.async_validate_slots(intent_obj.slots)
         if not slots:
             msg = "Invalid slots provided for DeleteAlarmIntent."
@@ -39,11 +41,9 @@ class DeleteAlarmIntent(intent.IntentHandler):
 
         alarm_number = slots[ATTR_ALARM_NUMBER]["value"]
 
-        alarm_manager: AlarmManager | None = hass.data.get(HASS_DATA_ALARM_MANAGER)
-
         if not alarm_manager:
             msg = (
-                "No alarm manager found."
+                "No alarm manager found for this request. "
                 "Please ensure the integration is set up correctly."
             )
             raise intent.IntentError(msg)
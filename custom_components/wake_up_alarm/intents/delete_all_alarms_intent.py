@@ -1,15 +1,18 @@
 """Intent handler for deleting all alarms."""
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Any, ClassVar
 
-import voluptuous as vol
 from homeassistant.helpers import (
     intent,
 )
 
-from custom_components.wake_up_alarm.const import HASS_DATA_ALARM_MANAGER
+from custom_components.wake_up_alarm.metrics import timed_intent
 
 if TYPE_CHECKING:
+    import voluptuous as vol
+
     from custom_components.wake_up_alarm.alarm_manager import AlarmManager
 
 
@@ -23,16 +26,15 @@ class DeleteAllAlarmsIntent(intent.IntentHandler):
         dict[vol.Marker, Any]
     ] = {}  # No slots needed for deleting all
 
-    async def async_handle(self, intent_obj: intent.Intent) -> intent.IntentResponse:
+    @timed_intent
+    async def async_handle(
+        self, intent_obj: intent.Intent, alarm_manager: AlarmManager | None
+    ) -> intent.IntentResponse:
         """Handle the intent."""
-        hass = intent_obj.hass
-
-        alarm_manager: AlarmManager | None = hass.data.get(HASS_DATA_ALARM_MANAGER)
-
         if not alarm_manager:
             msg = (
-                "No alarm manager found. Please ensure the integration is"
-                "set up correctly."
+                "No alarm manager found for this request. Please ensure the "
+                "integration is set up correctly."
             )
             raise intent.IntentError(msg)
 
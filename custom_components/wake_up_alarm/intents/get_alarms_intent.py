@@ -1,63 +1,119 @@
 """Intent handler for setting an alarm."""
 
-from typing import TYPE_CHECKING, ClassVar
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import voluptuous as vol
+from homeassistant.helpers import (
+    config_validation as cv,
+)
 from homeassistant.helpers import (
     intent,
 )
 from homeassistant.util import dt as dt_util
 
-from custom_components.wake_up_alarm.const import HASS_DATA_ALARM_MANAGER
+from custom_components.wake_up_alarm.const import ATTR_END, ATTR_START
+from custom_components.wake_up_alarm.metrics import timed_intent
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from custom_components.wake_up_alarm.alarm_manager import AlarmManager
 
+# Alarms read out in one response; the rest are only counted
+MAX_SPOKEN_ALARMS = 5
+# Rendered responses kept per alarm version, one for each queried time range
+_MAX_CACHED_SPEECHES = 32
+
 
 class GetAlarmsIntent(intent.IntentHandler):
     """Intent handler for getting a list of alarms."""
 
     intent_type = "HassGetAlarms"
     description = (
-        "Gets a list of all alarms as a mapping between alarm numbers "
-        "and their dates and times. "
+        "Gets a list of alarms as a mapping between alarm numbers "
+        "and their dates and times, optionally only those from start "
+        "(inclusive) to end (exclusive). "
+        f"At most {MAX_SPOKEN_ALARMS} alarms are listed, with a count of the rest. "
         "This does not mutate state, it is safe to call."
     )
 
-    # No slots required for getting all alarms
-    slot_schema: ClassVar[dict] = {}
+    slot_schema: ClassVar[dict[vol.Marker, Any]] = {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+
+    def __init__(self) -> None:
+        """Initialize the handler with an empty speech cache."""
+        super().__init__()
+        # (entry_id, start, end) -> (alarm manager, alarm version, speech); the
+        # manager is compared too, as a reloaded entry starts a new version count
+        self._speech_cache: dict[
+            tuple[str, datetime | None, datetime | None],
+            tuple[AlarmManager, int, str],
+        ] = {}
 
-    async def async_handle(self, intent_obj: intent.Intent) -> intent.IntentResponse:
+    @timed_intent
+    async def async_handle(
+        self, intent_obj: intent.Intent, alarm_manager: AlarmManager | None
+    ) -> intent.IntentResponse:
         """Handle the intent."""
-        hass = intent_obj.hass
+        slots = self.async_validate_slots(intent_obj.slots)
         response = intent_obj.create_response()
 
-        # Assuming there's only one instance of the integration/config entry
-        # If multiple, we might need to iterate or specify which entry.
-        # For simplicity, let's get the first/only manager instance.
-        alarm_manager: AlarmManager | None = hass.data.get(HASS_DATA_ALARM_MANAGER)
-
         if not alarm_manager:
-            msg = "No alarm manager. Please check the integration is set up correctly."
+            msg = (
+                "No alarm manager for this request. Please check the integration "
+                "is set up, with an area for each entry if there are several."
+            )
             raise intent.IntentError(msg)
-        alarms = alarm_manager.get_all_alarms_data()
 
-        if not alarms:
-            response.async_set_speech("You have no active alarms.")
+        start: datetime | None = slots.get(ATTR_START, {}).get("value")
+        end: datetime | None = slots.get(ATTR_END, {}).get("value")
+        start = dt_util.as_utc(start) if start else None
+        end = dt_util.as_utc(end) if end else None
+
+        # Only rendered again once the alarms have changed
+        cache_key = (alarm_manager.entry_id, start, end)
+        version = alarm_manager.version
+        cached = self._speech_cache.get(cache_key)
+        if cached is not None and cached[0] is alarm_manager and cached[1] == version:
+            speech = cached[2]
         else:
-            # Format the alarm times for speech
-            alarm_list_str = ", ".join(
-                [
-                    (
-                        f"Alarm {a['number']} at "
-                        + dt_util.as_local(a["datetime_obj"]).strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-                    )
-                    for a in sorted(alarms, key=lambda x: x["datetime_obj"])
-                ]
-            )
-            response.async_set_speech(
-                f"You have {len(alarms)} active alarms: {alarm_list_str}."
-            )
+            speech = self._render_speech(alarm_manager, start, end)
+            if len(self._speech_cache) >= _MAX_CACHED_SPEECHES:
+                self._speech_cache.clear()
+            self._speech_cache[cache_key] = (alarm_manager, version, speech)
 
+        response.async_set_speech(speech)
         return response
+
+    @staticmethod
+    def _render_speech(
+        alarm_manager: AlarmManager, start: datetime | None, end: datetime | None
+    ) -> str:
+        """Describe the first few alarms in the time range and count the rest."""
+        alarms, count = alarm_manager.list_alarms(start, end, limit=MAX_SPOKEN_ALARMS)
+        if not alarms:
+            if start or end:
+                return "You have no alarms in that time range."
+            return "You have no active alarms."
+
+        # Format the alarm times for speech
+        alarm_list_str = ", ".join(
+            [
+                (
+                    f"Alarm {a['number']} at "
+                    + dt_util.as_local(a["datetime_obj"]).strftime("%Y-%m-%d %H:%M:%S")
+                )
+                for a in alarms
+            ]
+        )
+        remaining = count - len(alarms)
+        if remaining:
+            return (
+                f"You have {count} active alarms. The first {len(alarms)} are: "
+                f"{alarm_list_str}, and there are {remaining} more."
+            )
+        return f"You have {count} active alarms: {alarm_list_str}."
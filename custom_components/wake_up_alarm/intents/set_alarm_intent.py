@@ -1,7 +1,9 @@
 """Intent handler for setting an alarm."""
 
+from __future__ import annotations
+
 import datetime
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import voluptuous as vol
 from homeassistant.helpers import (
@@ -13,9 +15,14 @@ from homeassistant.helpers import (
 
 from custom_components.wake_up_alarm.const import (
     ATTR_ALARM_DATETIME,
+    ATTR_CONFIG_ENTRY_ID,
     DOMAIN,
     SERVICE_ADD_ALARM,
 )
+from custom_components.wake_up_alarm.metrics import timed_intent
+
+if TYPE_CHECKING:
+    from custom_components.wake_up_alarm.alarm_manager import AlarmManager
 
 
 class SetAlarmIntent(intent.IntentHandler):
@@ -41,7 +48,10 @@ class SetAlarmIntent(intent.IntentHandler):
         """Get the local timezone."""
         return datetime.datetime.now(datetime.UTC).astimezone().tzinfo or datetime.UTC
 
-    async def async_handle(self, intent_obj: intent.Intent) -> intent.IntentResponse:
+    @timed_intent
+    async def async_handle(
+        self, intent_obj: intent.Intent, alarm_manager: AlarmManager | None
+    ) -> intent.IntentResponse:
         """Handle the intent."""
         hass = intent_obj.hass
         slots = self.async_validate_slots(intent_obj.slots)
@@ -62,11 +72,18 @@ class SetAlarmIntent(intent.IntentHandler):
         ):
             msg = "Alarm time must be in the future."
             raise intent.IntentError(msg)
+        if not alarm_manager:
+            msg = (
+                "No alarm manager found for this request. Please ensure the "
+                "integration is set up correctly."
+            )
+            raise intent.IntentError(msg)
         await hass.services.async_call(
             DOMAIN,
             SERVICE_ADD_ALARM,
             {
                 ATTR_ALARM_DATETIME: time_for_alarm.isoformat(),
+                ATTR_CONFIG_ENTRY_ID: alarm_manager.entry_id,
             },
             blocking=True,  # Wait for the service call to complete
         )
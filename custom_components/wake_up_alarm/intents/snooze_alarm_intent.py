@@ -0,0 +1,74 @@
+"""Intent handler for snoozing a ringing alarm."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import voluptuous as vol
+from homeassistant.helpers import (
+    config_validation as cv,
+)
+from homeassistant.helpers import (
+    intent,
+)
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_ALARM_NUMBER,
+    ATTR_MINUTES,
+    DEFAULT_SNOOZE_MINUTES,
+    SNOOZE_MINUTES,
+)
+from custom_components.wake_up_alarm.metrics import timed_intent
+
+if TYPE_CHECKING:
+    from custom_components.wake_up_alarm.alarm_manager import AlarmManager
+
+
+class SnoozeAlarmIntent(intent.IntentHandler):
+    """Intent handler for snoozing a ringing alarm."""
+
+    intent_type = "HassSnoozeAlarm"
+    description = (
+        "Snoozes the alarm that is ringing (or the given alarm number) for a "
+        f"number of minutes, {DEFAULT_SNOOZE_MINUTES} if not given."
+    )
+
+    slot_schema: ClassVar[dict[vol.Marker, Any]] = {
+        vol.Optional(ATTR_ALARM_NUMBER): cv.positive_int,
+        vol.Optional(ATTR_MINUTES): SNOOZE_MINUTES,
+    }
+
+    @timed_intent
+    async def async_handle(
+        self, intent_obj: intent.Intent, alarm_manager: AlarmManager | None
+    ) -> intent.IntentResponse:
+        """Handle the intent."""
+        slots = self.async_validate_slots(intent_obj.slots)
+        alarm_number: int | None = slots.get(ATTR_ALARM_NUMBER, {}).get("value")
+        minutes: float = slots.get(ATTR_MINUTES, {}).get(
+            "value", DEFAULT_SNOOZE_MINUTES
+        )
+
+        if not alarm_manager:
+            msg = (
+                "No alarm manager found for this request. "
+                "Please ensure the integration is set up correctly."
+            )
+            raise intent.IntentError(msg)
+
+        snoozed_alarms = alarm_manager.snooze_alarms(minutes, alarm_number)
+        if not snoozed_alarms:
+            msg = (
+                "No alarm is ringing."
+                if alarm_number is None
+                else f"Alarm {alarm_number} is not ringing."
+            )
+            raise intent.IntentError(msg)
+
+        snooze_until = dt_util.as_local(snoozed_alarms[0]["datetime_obj"])
+        response = intent_obj.create_response()
+        response.async_set_speech(
+            f"Snoozed for {minutes:g} minutes, until {snooze_until.strftime('%H:%M')}."
+        )
+        return response
@@ -0,0 +1,220 @@
+"""Operation metrics for wake_up_alarm."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import TYPE_CHECKING, Any
+
+from .routing import async_get_alarm_manager_for_intent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from homeassistant.helpers import intent
+
+# Upper bounds of the latency buckets in milliseconds; slower samples go into
+# an overflow bucket.
+_BUCKET_BOUNDS_MS = (
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+# Number of recent samples kept by RollingPercentiles
+_ROLLING_WINDOW = 1000
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of operation latencies.
+
+    Recording a sample is a bisect over a handful of bounds and a counter
+    increment, so it is cheap enough to stay enabled in production.
+    Percentiles are reported as the upper bound of the bucket they fall in.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one sample."""
+        milliseconds = seconds * 1000
+        self.buckets[bisect_left(_BUCKET_BOUNDS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency in milliseconds below which `fraction` of samples are."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(_BUCKET_BOUNDS_MS, self.buckets, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the histogram."""
+        bounds = zip(_BUCKET_BOUNDS_MS, self.buckets, strict=False)
+        buckets = {f"<={bound}ms": bucket_count for bound, bucket_count in bounds}
+        buckets[f">{_BUCKET_BOUNDS_MS[-1]}ms"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class RollingPercentiles:
+    """Exact percentiles over the most recent samples."""
+
+    def __init__(self, window: int = _ROLLING_WINDOW) -> None:
+        """Initialize with no samples."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, value: float) -> None:
+        """Record one sample, dropping the oldest one if the window is full."""
+        self._samples.append(value)
+        self.count += 1
+
+    @staticmethod
+    def _percentile(ordered: list[float], fraction: float) -> float | None:
+        """Return a percentile of already sorted samples."""
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the value below which `fraction` of the recent samples are."""
+        return self._percentile(sorted(self._samples), fraction)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the recent samples."""
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "window": len(ordered),
+            "p50": self._percentile(ordered, 0.5),
+            "p95": self._percentile(ordered, 0.95),
+            "p99": self._percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else None,
+        }
+
+
+class AlarmMetrics:
+    """Counters and latency histograms of an AlarmManager's operations."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.counters: dict[str, int] = {}
+        self.latencies: dict[str, LatencyHistogram] = {}
+        # How late alarms fired compared to their time, in milliseconds
+        self.fire_lateness = RollingPercentiles()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_latency(self, name: str, seconds: float) -> None:
+        """Count an operation and record how long it took."""
+        self.increment(name)
+        if (histogram := self.latencies.get(name)) is None:
+            histogram = self.latencies[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def percentile(self, name: str, fraction: float) -> float | None:
+        """Return a latency percentile of an operation in milliseconds."""
+        histogram = self.latencies.get(name)
+        return histogram.percentile(fraction) if histogram else None
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record the latency of the wrapped block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency(name, time.perf_counter() - started)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every counter and histogram summary."""
+        return {
+            "counters": dict(self.counters),
+            "latencies": {
+                name: histogram.as_dict() for name, histogram in self.latencies.items()
+            },
+            "fire_lateness_ms": self.fire_lateness.as_dict(),
+        }
+
+
+def timed_operation(name: str) -> Callable[[Callable], Callable]:
+    """Decorate an AlarmManager method to record its latency under `name`."""
+
+    def decorator(func: Callable) -> Callable:
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                with self.metrics.timed(name):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with self.metrics.timed(name):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_intent(func: Callable) -> Callable:
+    """
+    Decorate an intent handler's async_handle to record its latency.
+
+    The intent is routed once, here, and the handler is called with the alarm
+    manager it is meant for, or None, so it does not route it again.
+    """
+
+    @wraps(func)
+    async def wrapper(
+        self: intent.IntentHandler, intent_obj: intent.Intent
+    ) -> intent.IntentResponse:
+        alarm_manager = async_get_alarm_manager_for_intent(intent_obj)
+        if alarm_manager is None:
+            return await func(self, intent_obj, None)
+        with alarm_manager.metrics.timed(f"intent_{self.intent_type}"):
+            return await func(self, intent_obj, alarm_manager)
+
+    return wrapper
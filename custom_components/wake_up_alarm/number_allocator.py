@@ -0,0 +1,85 @@
+"""Alarm number allocation for wake_up_alarm."""
+
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class AlarmNumberAllocator:
+    """
+    Hands out the lowest free alarm number.
+
+    Numbers above the high-water mark have never been used. Numbers at or
+    below it that are free sit in a min-heap, so allocating and releasing a
+    number are O(log n). Entries that get reserved while in the heap are only
+    dropped from the membership set and skipped lazily when they surface.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an allocator with no numbers in use."""
+        self._released: list[int] = []
+        self._released_set: set[int] = set()
+        self._high_water = 0
+
+    def rebuild(self, used_numbers: Iterable[int]) -> None:
+        """Rebuild the allocator from the set of numbers currently in use."""
+        used = set(used_numbers)
+        self._high_water = max(used, default=0)
+        # An ascending list is already a valid heap
+        self._released = [n for n in range(1, self._high_water + 1) if n not in used]
+        self._released_set = set(self._released)
+
+    def reset(self) -> None:
+        """Mark every number as free."""
+        self._released = []
+        self._released_set = set()
+        self._high_water = 0
+
+    def peek(self) -> int:
+        """Return the number the next allocation would hand out."""
+        released = self._released
+        while released and released[0] not in self._released_set:
+            heappop(released)
+        if released:
+            return released[0]
+        return self._high_water + 1
+
+    def allocate(self) -> int:
+        """Allocate and return the lowest free number."""
+        number = self.peek()
+        self.reserve(number)
+        return number
+
+    def allocate_many(self, count: int) -> list[int]:
+        """Allocate and return the `count` lowest free numbers."""
+        return [self.allocate() for _ in range(count)]
+
+    def reserve(self, number: int) -> None:
+        """Mark a specific number as in use."""
+        if number in self._released_set:
+            self._released_set.discard(number)
+            return
+        if number <= self._high_water:
+            return
+        for gap in range(self._high_water + 1, number):
+            heappush(self._released, gap)
+            self._released_set.add(gap)
+        self._high_water = number
+
+    def release(self, number: int) -> None:
+        """Return a number to the pool of free numbers."""
+        if number > self._high_water or number in self._released_set:
+            return
+        if number == self._high_water:
+            # Lower the high-water mark instead of growing the heap
+            self._high_water -= 1
+            while self._high_water in self._released_set:
+                self._released_set.discard(self._high_water)
+                self._high_water -= 1
+            return
+        heappush(self._released, number)
+        self._released_set.add(number)
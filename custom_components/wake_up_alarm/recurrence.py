@@ -0,0 +1,104 @@
+"""Recurrence rules for wake_up_alarm."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import WEEKDAYS
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    REPEAT_DAILY,
+    REPEAT_EVERY_N_DAYS,
+    REPEAT_WEEKDAYS,
+    REPEAT_WEEKLY,
+)
+
+_ALL_DAYS_MASK = 0b1111111
+_WORKDAYS_MASK = 0b0011111
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    Compact description of a repeating alarm.
+
+    Only the next occurrence of a recurring alarm is ever stored and
+    scheduled; the one after it is derived from the rule when it fires.
+    Occurrences keep the local wall-clock time of the previous one, so a
+    06:30 alarm stays at 06:30 across DST changes.
+    """
+
+    repeat: str
+    # Bit 0 is Monday, bit 6 is Sunday. Used by the weekday based rules.
+    weekday_mask: int = _ALL_DAYS_MASK
+    interval_days: int = 1
+
+    @classmethod
+    def from_service_data(
+        cls,
+        repeat: str,
+        weekdays: list[str] | None = None,
+        interval_days: int | None = None,
+    ) -> RecurrenceRule:
+        """Build a rule from the add_alarm service fields."""
+        if repeat == REPEAT_WEEKDAYS:
+            return cls(repeat, weekday_mask=_WORKDAYS_MASK)
+        if repeat == REPEAT_WEEKLY:
+            mask = 0
+            for weekday in weekdays or []:
+                mask |= 1 << WEEKDAYS.index(weekday)
+            return cls(repeat, weekday_mask=mask)
+        if repeat == REPEAT_EVERY_N_DAYS:
+            return cls(repeat, interval_days=interval_days or 1)
+        return cls(REPEAT_DAILY)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RecurrenceRule:
+        """Build a rule from its stored representation."""
+        repeat = data["repeat"]
+        default_mask = _WORKDAYS_MASK if repeat == REPEAT_WEEKDAYS else _ALL_DAYS_MASK
+        return cls(
+            repeat,
+            weekday_mask=data.get("weekday_mask", default_mask),
+            interval_days=data.get("interval_days", 1),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored representation of the rule."""
+        if self.repeat == REPEAT_EVERY_N_DAYS:
+            return {"repeat": self.repeat, "interval_days": self.interval_days}
+        if self.repeat == REPEAT_WEEKLY:
+            return {"repeat": self.repeat, "weekday_mask": self.weekday_mask}
+        return {"repeat": self.repeat}
+
+    def next_occurrence(self, previous_utc: datetime, after_utc: datetime) -> datetime:
+        """Return the first occurrence after `after_utc`, following `previous_utc`."""
+        local_previous = dt_util.as_local(previous_utc)
+        wall_time = local_previous.time()
+        time_zone = local_previous.tzinfo
+        previous_date = local_previous.date()
+        after_date = dt_util.as_local(after_utc).date()
+        weekday_mask = self.weekday_mask or _ALL_DAYS_MASK
+
+        if self.repeat == REPEAT_EVERY_N_DAYS:
+            step = timedelta(days=self.interval_days)
+            # Jump straight to the period containing `after_utc`
+            periods = max(1, (after_date - previous_date) // step)
+            candidate_date = previous_date + periods * step
+        else:
+            step = timedelta(days=1)
+            candidate_date = max(previous_date + step, after_date)
+
+        while True:
+            if self.repeat == REPEAT_EVERY_N_DAYS or (
+                weekday_mask >> candidate_date.weekday() & 1
+            ):
+                candidate = dt_util.as_utc(
+                    datetime.combine(candidate_date, wall_time, tzinfo=time_zone)
+                )
+                if candidate > after_utc:
+                    return candidate
+            candidate_date += step
@@ -0,0 +1,69 @@
+"""Find the alarm manager of the config entry a request is meant for."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import HASS_DATA_ALARM_MANAGERS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import intent
+
+    from .alarm_manager import AlarmManager
+
+
+@callback
+def async_get_alarm_managers(hass: HomeAssistant) -> dict[str, AlarmManager]:
+    """Return the alarm managers of all loaded entries, keyed by entry_id."""
+    return hass.data.setdefault(HASS_DATA_ALARM_MANAGERS, {})
+
+
+@callback
+def async_get_alarm_manager(
+    hass: HomeAssistant, entry_id: str | None = None
+) -> AlarmManager | None:
+    """
+    Return the alarm manager of an entry.
+
+    Without an entry_id, the manager is only found if there is a single one.
+    """
+    managers = async_get_alarm_managers(hass)
+    if entry_id is not None:
+        return managers.get(entry_id)
+    if len(managers) == 1:
+        return next(iter(managers.values()))
+    return None
+
+
+@callback
+def async_get_alarm_manager_for_intent(
+    intent_obj: intent.Intent,
+) -> AlarmManager | None:
+    """
+    Return the alarm manager an intent is meant for.
+
+    With several entries, the entry for the area of the satellite that heard
+    the request is used, falling back to the only entry without an area.
+    """
+    hass = intent_obj.hass
+    managers = async_get_alarm_managers(hass)
+    if len(managers) == 1:
+        return next(iter(managers.values()))
+
+    if intent_obj.device_id and (
+        device := dr.async_get(hass).async_get(intent_obj.device_id)
+    ):
+        for alarm_manager in managers.values():
+            if device.area_id and alarm_manager.area_id == device.area_id:
+                return alarm_manager
+
+    without_area = [
+        alarm_manager
+        for alarm_manager in managers.values()
+        if alarm_manager.area_id is None
+    ]
+    return without_area[0] if len(without_area) == 1 else None
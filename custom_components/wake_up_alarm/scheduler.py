@@ -0,0 +1,281 @@
+"""Single-timer scheduler for wake_up_alarm."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import HASS_DATA_ALARM_SCHEDULER, LOGGER
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Hashable
+    from datetime import datetime
+
+# Rebuild the heap once cancelled entries outnumber live ones by this factor.
+_COMPACT_FACTOR = 2
+_NO_DELAY = timedelta(0)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> AlarmScheduler:
+    """Return the scheduler shared by every config entry, creating it if needed."""
+    scheduler: AlarmScheduler | None = hass.data.get(HASS_DATA_ALARM_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[HASS_DATA_ALARM_SCHEDULER] = AlarmScheduler(hass)
+    return scheduler
+
+
+@dataclass(frozen=True, kw_only=True)
+class JobTiming:
+    """
+    Timing options of a scheduled job.
+
+    With an early margin, the timer is armed that much before the job is due.
+    Jobs due within the coalescing window of an earlier job of the same
+    coalescing group run in the same batch as it.
+    """
+
+    early_margin: timedelta = _NO_DELAY
+    coalesce_group: Hashable | None = None
+    coalesce_window: timedelta = _NO_DELAY
+
+
+_DEFAULT_TIMING = JobTiming()
+
+
+@dataclass(slots=True)
+class _Job:
+    """A pending job and the timing options it was scheduled with."""
+
+    when: datetime
+    sequence: int
+    action: Callable[[list[Hashable]], None]
+    timing: JobTiming
+
+
+class AlarmScheduler:
+    """
+    Runs any number of timed jobs off a single armed timer.
+
+    Jobs are identified by a hashable key and carry the callback that should
+    handle them. Only the earliest pending job has a timer registered with
+    Home Assistant; every job that is due when it fires is handed to its
+    callback in one batch, and the timer is then re-armed for the next job.
+    One scheduler is shared by all config entries, so more entries do not
+    mean more timers.
+
+    A job can be scheduled with an early margin: the timer is then armed that
+    much before the job is due and the rest of the time is waited out with a
+    plain event loop timer, so a busy loop delays the wake-up less. The margin
+    of the earliest pending job is used. A job can also be put in a coalescing
+    group with a window: when it is due, the later jobs of the same group due
+    within its window are run in the same batch instead of arming the timer
+    again for each of them. Jobs of other groups wait for their own time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # The heap may hold stale entries for keys that were cancelled or
+        # rescheduled, they are skipped lazily.
+        self._jobs: dict[Hashable, _Job] = {}
+        # action -> number of its pending jobs
+        self._pending_counts: dict[Callable, int] = {}
+        self._heap: list[tuple[datetime, int, Hashable]] = []
+        self._sequence = count()
+        self._armed_at: datetime | None = None
+        self._armed_margin = _NO_DELAY
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._precise_timer: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending jobs."""
+        return len(self._jobs)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a job with the given key is pending."""
+        return key in self._jobs
+
+    @property
+    def armed_at(self) -> datetime | None:
+        """Return the time the timer is currently armed for, if any."""
+        return self._armed_at
+
+    def pending_count(self, action: Callable) -> int:
+        """Return the number of pending jobs of an action."""
+        return self._pending_counts.get(action, 0)
+
+    @callback
+    def async_schedule(
+        self,
+        key: Hashable,
+        when: datetime,
+        action: Callable[[list[Hashable]], None],
+        timing: JobTiming = _DEFAULT_TIMING,
+    ) -> None:
+        """
+        Schedule (or reschedule) a job.
+
+        The action is a callback that receives the list of its keys that are
+        due. Jobs scheduled in the past fire on the next loop iteration.
+        """
+        sequence = next(self._sequence)
+        self._forget(key)
+        self._jobs[key] = _Job(when, sequence, action, timing)
+        self._pending_counts[action] = self._pending_counts.get(action, 0) + 1
+        heappush(self._heap, (when, sequence, key))
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, key: Hashable) -> bool:
+        """Cancel a pending job. Returns True if a job was cancelled."""
+        if self._forget(key) is None:
+            return False
+        if len(self._heap) > _COMPACT_FACTOR * len(self._jobs) + 1:
+            self._compact()
+        self._async_arm()
+        return True
+
+    @callback
+    def async_cancel_action(self, action: Callable) -> None:
+        """Cancel every pending job of an action."""
+        if not self._pending_counts.pop(action, 0):
+            return
+        self._jobs = {
+            key: job for key, job in self._jobs.items() if job.action != action
+        }
+        self._compact()
+        self._async_arm()
+
+    def _forget(self, key: Hashable) -> _Job | None:
+        """Drop a pending job, leaving its heap entry to be skipped lazily."""
+        job = self._jobs.pop(key, None)
+        if job is not None:
+            self._pending_counts[job.action] -= 1
+        return job
+
+    def _compact(self) -> None:
+        """Drop stale heap entries left behind by cancelled jobs."""
+        self._heap = [(job.when, job.sequence, key) for key, job in self._jobs.items()]
+        heapify(self._heap)
+
+    def _is_live(self, entry: tuple[datetime, int, Hashable]) -> bool:
+        """Return True if a heap entry still matches its pending job."""
+        job = self._jobs.get(entry[2])
+        return job is not None and job.sequence == entry[1]
+
+    def _peek(self) -> _Job | None:
+        """Return the earliest pending job, dropping stale heap entries."""
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heappop(heap)
+        return self._jobs[heap[0][2]] if heap else None
+
+    @callback
+    def _async_disarm(self) -> None:
+        """Cancel the armed timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._precise_timer is not None:
+            self._precise_timer.cancel()
+            self._precise_timer = None
+        self._armed_at = None
+        self._armed_margin = _NO_DELAY
+
+    @callback
+    def _async_arm(self) -> None:
+        """Make sure the timer is armed for the earliest pending job."""
+        earliest = self._peek()
+        if earliest is None:
+            self._async_disarm()
+            return
+        early_margin = earliest.timing.early_margin
+        if (earliest.when, early_margin) == (self._armed_at, self._armed_margin):
+            return
+        self._async_disarm()
+        LOGGER.debug("Arming alarm scheduler for %s", earliest.when.isoformat())
+        self._armed_at = earliest.when
+        self._armed_margin = early_margin
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_on_timer, earliest.when - early_margin
+        )
+
+    @callback
+    def _async_on_timer(self, _now: datetime) -> None:
+        """Wait out the early margin, if any, then run the due jobs."""
+        self._unsub_timer = None
+        self._async_run_when_due()
+
+    @callback
+    def _async_on_precise_timer(self) -> None:
+        """Run the due jobs once the early margin has been waited out."""
+        self._precise_timer = None
+        self._async_run_when_due()
+
+    @callback
+    def _async_run_when_due(self) -> None:
+        """Run the due jobs, or wait on the loop clock if it is still early."""
+        now = dt_util.utcnow()
+        if self._armed_at is not None and self._armed_at > now:
+            remaining = (self._armed_at - now).total_seconds()
+            loop = self.hass.loop
+            self._precise_timer = loop.call_at(
+                loop.time() + remaining, self._async_on_precise_timer
+            )
+            return
+        self._async_run_due_jobs()
+
+    @callback
+    def _async_run_due_jobs(self) -> None:
+        """Hand every due job to its action and re-arm for the next one."""
+        self._armed_at = None
+        self._armed_margin = _NO_DELAY
+
+        now = dt_util.utcnow()
+        # coalescing group -> end of the window opened by its first due job
+        horizons: dict[Hashable, datetime] = {}
+        latest_horizon = now
+        due: dict[Callable, list[Hashable]] = {}
+        not_yet_due: list[tuple[datetime, int, Hashable]] = []
+        heap = self._heap
+        # Due jobs come off the heap first, so every window is open before
+        # the jobs that are not due yet are looked at
+        while heap and heap[0][0] <= latest_horizon:
+            entry = heappop(heap)
+            if not self._is_live(entry):
+                continue
+            job = self._jobs[entry[2]]
+            group = job.timing.coalesce_group
+            if job.when > now:
+                horizon = horizons.get(group) if group is not None else None
+                if horizon is None or job.when > horizon:
+                    # Within another group's window, but not within its own
+                    not_yet_due.append(entry)
+                    continue
+            elif group is not None and job.timing.coalesce_window:
+                horizon = horizons.setdefault(
+                    group, job.when + job.timing.coalesce_window
+                )
+                latest_horizon = max(latest_horizon, horizon)
+            self._forget(entry[2])
+            due.setdefault(job.action, []).append(entry[2])
+        for entry in not_yet_due:
+            heappush(heap, entry)
+
+        self._async_arm()
+
+        for action, keys in due.items():
+            LOGGER.debug("Alarm scheduler firing %s due job(s)", len(keys))
+            try:
+                action(keys)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Error handling due alarm jobs %s", keys)
@@ -0,0 +1,482 @@
+"""Services of the wake_up_alarm domain."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import WEEKDAYS
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.helpers import (
+    config_validation as cv,
+)
+from homeassistant.helpers import (
+    entity_registry as er,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import dt as dt_util
+
+from .alarm_manager import AlarmManager
+from .alarm_store import alarm_metadata
+from .const import (
+    ATTR_ALARM_DATETIME,
+    ATTR_ALARM_DATETIMES,
+    ATTR_ALARM_NUMBER,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CURSOR,
+    ATTR_END,
+    ATTR_INTERVAL_DAYS,
+    ATTR_LIMIT,
+    ATTR_MINUTES,
+    ATTR_PRE_ALARM_OFFSETS,
+    ATTR_RECURRENCE,
+    ATTR_REPEAT,
+    ATTR_START,
+    ATTR_WEEKDAYS,
+    DEFAULT_LIST_LIMIT,
+    DEFAULT_SNOOZE_MINUTES,
+    DOMAIN,
+    LOGGER,
+    MAX_LIST_LIMIT,
+    REPEAT_OPTIONS,
+    REPEAT_WEEKLY,
+    SERVICE_ADD_ALARM,
+    SERVICE_ADD_ALARMS,
+    SERVICE_DELETE_ALARM,
+    SERVICE_DELETE_ALARM_BY_NUMBER,
+    SERVICE_DELETE_ALL_ALARMS,
+    SERVICE_LIST_ALARMS,
+    SERVICE_SNOOZE,
+    SERVICE_UPDATE_ALARM,
+    SIGNAL_ADD_ALARM,
+    SIGNAL_ADD_ALARMS,
+    SIGNAL_DELETE_ALARM,
+    SNOOZE_MINUTES,
+)
+from .recurrence import RecurrenceRule
+from .routing import async_get_alarm_managers
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+DELETE_ALARM_SERVICE_SCHEMA = cv.make_entity_service_schema({})
+
+DELETE_ALARM_BY_NUMBER_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ALARM_NUMBER): cv.positive_int,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+DELETE_ALL_ALARMS_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _validate_weekly_has_weekdays(data: dict[str, Any]) -> dict[str, Any]:
+    """Make sure a weekly repeat says on which weekdays to ring."""
+    if data.get(ATTR_REPEAT) == REPEAT_WEEKLY and not data.get(ATTR_WEEKDAYS):
+        msg = f"'{ATTR_WEEKDAYS}' is required when repeating {REPEAT_WEEKLY}"
+        raise vol.Invalid(msg)
+    return data
+
+
+ADD_ALARM_SERVICE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ALARM_DATETIME): cv.datetime,
+            vol.Optional(ATTR_REPEAT): vol.In(REPEAT_OPTIONS),
+            vol.Optional(ATTR_WEEKDAYS): vol.All(cv.ensure_list, [vol.In(WEEKDAYS)]),
+            vol.Optional(ATTR_INTERVAL_DAYS): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(ATTR_PRE_ALARM_OFFSETS): vol.All(
+                cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))]
+            ),
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        }
+    ),
+    _validate_weekly_has_weekdays,
+)
+
+ADD_ALARMS_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ALARM_DATETIMES): vol.All(
+            cv.ensure_list, vol.Length(min=1), [cv.datetime]
+        ),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _cursor_key(value: Any) -> tuple[datetime, int]:
+    """Parse a list_alarms cursor into the (datetime, number) key it follows."""
+    number, _, alarm_datetime = cv.string(value).partition("@")
+    alarm_datetime_utc = dt_util.parse_datetime(alarm_datetime)
+    if not number.isdigit() or alarm_datetime_utc is None:
+        msg = f"Invalid {ATTR_CURSOR}: {value}"
+        raise vol.Invalid(msg)
+    return dt_util.as_utc(alarm_datetime_utc), int(number)
+
+
+def _cursor(alarm: dict[str, Any]) -> str:
+    """Return the list_alarms cursor pointing just after an alarm."""
+    return f"{alarm['number']}@{alarm['datetime_obj'].isoformat()}"
+
+
+LIST_ALARMS_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_LIST_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_LIST_LIMIT)
+        ),
+        vol.Optional(ATTR_CURSOR): _cursor_key,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+UPDATE_ALARM_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ALARM_NUMBER): cv.positive_int,
+        vol.Required(ATTR_ALARM_DATETIME): cv.datetime,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+SNOOZE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ALARM_NUMBER): cv.positive_int,
+        vol.Optional(ATTR_MINUTES, default=DEFAULT_SNOOZE_MINUTES): SNOOZE_MINUTES,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _get_service_manager(service_call: ServiceCall) -> AlarmManager | None:
+    """
+    Return the alarm manager of the entry a service call is meant for.
+
+    The config_entry_id field may only be left out if there is a single entry.
+    """
+    entry_id = service_call.data.get(ATTR_CONFIG_ENTRY_ID)
+    alarm_manager = AlarmManager.get_instance(service_call.hass, entry_id)
+    if alarm_manager is not None:
+        return alarm_manager
+    if entry_id:
+        LOGGER.warning(
+            "Cannot handle %s: entry %s is not loaded.", service_call.service, entry_id
+        )
+    else:
+        LOGGER.warning(
+            "Cannot handle %s: %s is required unless there is exactly one entry.",
+            service_call.service,
+            ATTR_CONFIG_ENTRY_ID,
+        )
+    return None
+
+
+def _alarm_number_from_entity(
+    entity_entry: er.RegistryEntry | None, entity_id: str, *, warn: bool
+) -> tuple[str, int] | None:
+    """
+    Return the config entry id and alarm number of an alarm entity.
+
+    Returns None if the entity is not an alarm entity.
+    """
+    log = LOGGER.warning if warn else LOGGER.debug
+    if not entity_entry:
+        log("Cannot delete alarm: Entity ID %s not found.", entity_id)
+        return None
+
+    if entity_entry.platform != DOMAIN:
+        log(
+            "Cannot delete alarm: Entity %s is not part of the %s domain.",
+            entity_id,
+            DOMAIN,
+        )
+        return None
+
+    if not entity_entry.config_entry_id:
+        log(
+            "Cannot delete alarm: Entity %s is not associated with a config.",
+            entity_id,
+        )
+        return None
+
+    # Unique ID format: f"{config_entry_id}_alarm_{alarm_number}"
+    prefix = f"{entity_entry.config_entry_id}_alarm_"
+    if not entity_entry.unique_id or not entity_entry.unique_id.startswith(prefix):
+        log(
+            "Unique ID %s for entity %s does not match expected alarm format.",
+            entity_entry.unique_id,
+            entity_id,
+        )
+        return None
+    try:
+        return entity_entry.config_entry_id, int(entity_entry.unique_id[len(prefix) :])
+    except ValueError:
+        log(
+            "Could not parse alarm_number from unique_id %s for entity %s",
+            entity_entry.unique_id,
+            entity_id,
+        )
+        return None
+
+
+async def _async_handle_delete_alarm_service(service_call: ServiceCall) -> None:
+    """Handle the service call to delete the targeted alarms in one batch."""
+    hass = service_call.hass
+    selected = async_extract_referenced_entity_ids(hass, service_call)
+    entity_registry = er.async_get(hass)
+
+    # Resolve every target first, so each entry deletes its alarms at once
+    alarm_numbers: dict[str, list[int]] = {}
+    for entity_id_str in selected.referenced | selected.indirectly_referenced:
+        alarm = _alarm_number_from_entity(
+            entity_registry.async_get(entity_id_str),
+            entity_id_str,
+            warn=entity_id_str in selected.referenced,
+        )
+        if alarm is not None:
+            config_entry_id, alarm_number = alarm
+            alarm_numbers.setdefault(config_entry_id, []).append(alarm_number)
+
+    if not alarm_numbers:
+        LOGGER.warning("Cannot delete alarms: no alarm entities were targeted.")
+        return
+    for config_entry_id, entry_alarm_numbers in alarm_numbers.items():
+        alarm_manager = AlarmManager.get_instance(hass, config_entry_id)
+        if alarm_manager is None:
+            LOGGER.warning(
+                "Cannot delete alarms %s: entry %s is not loaded.",
+                entry_alarm_numbers,
+                config_entry_id,
+            )
+            continue
+        await alarm_manager.delete_alarms(entry_alarm_numbers)
+
+
+async def _async_handle_delete_alarm_by_number_service(
+    service_call: ServiceCall,
+) -> None:
+    """Handle the service call to delete an alarm by its number."""
+    alarm_number_to_delete = service_call.data[ATTR_ALARM_NUMBER]
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return
+    config_entry_id = alarm_manager.entry_id
+
+    alarm_details = {ATTR_ALARM_NUMBER: alarm_number_to_delete}
+    delete_signal = f"{SIGNAL_DELETE_ALARM}_{config_entry_id}"
+    LOGGER.debug(
+        "Dispatching delete signal %s for alarm number %s (config_entry: %s)",
+        delete_signal,
+        alarm_number_to_delete,
+        config_entry_id,
+    )
+    async_dispatcher_send(service_call.hass, delete_signal, alarm_details)
+
+
+async def _async_handle_add_alarm_service(service_call: ServiceCall) -> None:
+    """Handle the service call to add a new alarm."""
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return
+    config_entry_id = alarm_manager.entry_id
+    # cv.datetime ensures alarm_datetime_obj is a datetime object
+    local_alarm_datetime_obj = service_call.data[ATTR_ALARM_DATETIME]
+    utc_alarm_datetime_obj = dt_util.as_utc(local_alarm_datetime_obj)
+
+    LOGGER.info(
+        "Service call to add alarm: DateTime='%s' (UTC %s) for entry %s",
+        local_alarm_datetime_obj.isoformat(),
+        utc_alarm_datetime_obj.isoformat(),
+        config_entry_id,
+    )
+
+    alarm_details = {
+        ATTR_ALARM_DATETIME: utc_alarm_datetime_obj,
+    }
+    if repeat := service_call.data.get(ATTR_REPEAT):
+        alarm_details[ATTR_RECURRENCE] = RecurrenceRule.from_service_data(
+            repeat,
+            service_call.data.get(ATTR_WEEKDAYS),
+            service_call.data.get(ATTR_INTERVAL_DAYS),
+        )
+    if ATTR_PRE_ALARM_OFFSETS in service_call.data:
+        alarm_details[ATTR_PRE_ALARM_OFFSETS] = service_call.data[
+            ATTR_PRE_ALARM_OFFSETS
+        ]
+
+    # Dispatch a signal specific to this config entry
+    # The sensor platform for this entry will listen for this signal
+    entry_specific_signal = f"{SIGNAL_ADD_ALARM}_{config_entry_id}"
+    async_dispatcher_send(service_call.hass, entry_specific_signal, alarm_details)
+
+
+async def _async_handle_add_alarms_service(service_call: ServiceCall) -> None:
+    """Handle the service call to add many alarms at once."""
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return
+    config_entry_id = alarm_manager.entry_id
+    utc_alarm_datetime_objs = [
+        dt_util.as_utc(local_alarm_datetime_obj)
+        for local_alarm_datetime_obj in service_call.data[ATTR_ALARM_DATETIMES]
+    ]
+
+    LOGGER.info(
+        "Service call to add %s alarms for entry %s",
+        len(utc_alarm_datetime_objs),
+        config_entry_id,
+    )
+
+    alarm_details = {
+        ATTR_ALARM_DATETIMES: utc_alarm_datetime_objs,
+    }
+
+    entry_specific_signal = f"{SIGNAL_ADD_ALARMS}_{config_entry_id}"
+    async_dispatcher_send(service_call.hass, entry_specific_signal, alarm_details)
+
+
+async def _async_handle_delete_all_alarms_service(service_call: ServiceCall) -> None:
+    """Handle the service call to delete all alarms of one or every entry."""
+    hass = service_call.hass
+    if config_entry_id := service_call.data.get(ATTR_CONFIG_ENTRY_ID):
+        alarm_manager = AlarmManager.get_instance(hass, config_entry_id)
+        alarm_managers = [alarm_manager] if alarm_manager else []
+    else:
+        alarm_managers = list(async_get_alarm_managers(hass).values())
+    if not alarm_managers:
+        LOGGER.warning("Cannot delete all alarms: No instance of %s found.", DOMAIN)
+        return
+    for alarm_manager in alarm_managers:
+        await alarm_manager.delete_all_alarms()
+
+
+async def _async_handle_list_alarms_service(
+    service_call: ServiceCall,
+) -> ServiceResponse:
+    """
+    Handle the service call to list a page of alarms in a time range.
+
+    The response holds at most `limit` alarms, the number of alarms in the
+    whole range, and a cursor to pass to get the next page, if any.
+    """
+    response: dict[str, Any] = {"alarms": [], "count": 0, "next_cursor": None}
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return response
+
+    start = service_call.data.get(ATTR_START)
+    end = service_call.data.get(ATTR_END)
+    limit = service_call.data[ATTR_LIMIT]
+    # One extra alarm tells whether there is a next page
+    alarms, response["count"] = alarm_manager.list_alarms(
+        dt_util.as_utc(start) if start else None,
+        dt_util.as_utc(end) if end else None,
+        limit=limit + 1,
+        after=service_call.data.get(ATTR_CURSOR),
+    )
+    if len(alarms) > limit:
+        del alarms[limit:]
+        response["next_cursor"] = _cursor(alarms[-1])
+    response["alarms"] = [
+        {
+            "number": alarm["number"],
+            "datetime": alarm["datetime_obj"].isoformat(),
+            **alarm_metadata(alarm),
+        }
+        for alarm in alarms
+    ]
+    return response
+
+
+async def _async_handle_update_alarm_service(service_call: ServiceCall) -> None:
+    """Handle the service call to move an existing alarm in place."""
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return
+    alarm_manager.update_alarm(
+        service_call.data[ATTR_ALARM_NUMBER],
+        dt_util.as_utc(service_call.data[ATTR_ALARM_DATETIME]),
+    )
+
+
+async def _async_handle_snooze_service(service_call: ServiceCall) -> None:
+    """Handle the service call to snooze ringing alarms in place."""
+    alarm_manager = _get_service_manager(service_call)
+    if alarm_manager is None:
+        return
+    alarm_number = service_call.data.get(ATTR_ALARM_NUMBER)
+    if not alarm_manager.snooze_alarms(service_call.data[ATTR_MINUTES], alarm_number):
+        not_ringing = (
+            "no alarm is ringing"
+            if alarm_number is None
+            else f"alarm {alarm_number} is not ringing"
+        )
+        msg = f"Cannot snooze for entry {alarm_manager.entry_id}: {not_ringing}."
+        LOGGER.warning(msg)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the wake_up_alarm domain."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_ALARM,
+        _async_handle_delete_alarm_service,
+        schema=DELETE_ALARM_SERVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_ALARM_BY_NUMBER,
+        _async_handle_delete_alarm_by_number_service,
+        schema=DELETE_ALARM_BY_NUMBER_SERVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_ALARM,
+        _async_handle_add_alarm_service,
+        schema=ADD_ALARM_SERVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_ALARMS,
+        _async_handle_add_alarms_service,
+        schema=ADD_ALARMS_SERVICE_SCHEMA,
+    )
+    LOGGER.info(
+        "Registering service %s for deleting all alarms.", SERVICE_DELETE_ALL_ALARMS
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_ALL_ALARMS,
+        _async_handle_delete_all_alarms_service,
+        schema=DELETE_ALL_ALARMS_SERVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_ALARMS,
+        _async_handle_list_alarms_service,
+        schema=LIST_ALARMS_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPDATE_ALARM,
+        _async_handle_update_alarm_service,
+        schema=UPDATE_ALARM_SERVICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNOOZE,
+        _async_handle_snooze_service,
+        schema=SNOOZE_SERVICE_SCHEMA,
+    )
@@ -0,0 +1,226 @@
+"""SQLite persistence of alarms for wake_up_alarm."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .alarm_store import AlarmStorageBackend, alarm_metadata
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Iterable
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS alarms ("
+    "number INTEGER PRIMARY KEY, "
+    "timestamp INTEGER NOT NULL, "
+    "metadata TEXT)"
+)
+_CREATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS alarms_by_time ON alarms (timestamp, number)"
+)
+_SELECT_ALARMS = (
+    "SELECT number, timestamp, metadata FROM alarms ORDER BY timestamp, number"
+)
+_UPSERT_ALARM = (
+    "INSERT OR REPLACE INTO alarms (number, timestamp, metadata) VALUES (?, ?, ?)"
+)
+_DELETE_ALARM = "DELETE FROM alarms WHERE number = ?"
+_DELETE_ALL_ALARMS = "DELETE FROM alarms"
+
+type _Statement = tuple[str, tuple[Any, ...]]
+
+
+def _upsert(number: int, timestamp: int, metadata: dict[str, Any] | None) -> _Statement:
+    """Return the statement that writes a single alarm row."""
+    metadata_json = json.dumps(metadata) if metadata else None
+    return (_UPSERT_ALARM, (number, timestamp, metadata_json))
+
+
+class SqliteAlarmStore(AlarmStorageBackend):
+    """
+    Keeps alarms in an SQLite table indexed by number and by time.
+
+    Every change becomes a single-row statement. Statements are queued in the
+    order the changes happened and applied in the executor by one drain task
+    at a time, each batch in its own transaction, so a single add or delete
+    never rewrites the other alarms.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize the store. The database is opened on first use."""
+        self.hass = hass
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+        self._pending: list[_Statement] = []
+        self._drain_task: asyncio.Task[None] | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+        self.writes = 0
+        self.rows = 0
+        self.last_write_rows = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return write counters for this store."""
+        return {
+            "writes": self.writes,
+            "rows": self.rows,
+            "last_write_rows": self.last_write_rows,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Only ever used by one executor job at a time
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_CREATE_TABLE)
+            connection.execute(_CREATE_INDEX)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _load(self) -> dict[str, Any] | None:
+        """Read every alarm in time order. Runs in the executor."""
+        if self._connection is None and not self._path.exists():
+            return None
+        numbers: list[int] = []
+        timestamps: list[int] = []
+        metadata: dict[str, dict[str, Any]] = {}
+        for number, timestamp, metadata_json in self._connect().execute(_SELECT_ALARMS):
+            numbers.append(number)
+            timestamps.append(timestamp)
+            if metadata_json:
+                metadata[str(number)] = json.loads(metadata_json)
+        return {"numbers": numbers, "timestamps": timestamps, "metadata": metadata}
+
+    def _execute(self, statements: list[_Statement]) -> None:
+        """Apply statements in one transaction. Runs in the executor."""
+        connection = self._connect()
+        with connection:
+            for sql, parameters in statements:
+                connection.execute(sql, parameters)
+
+    def _close(self) -> None:
+        """Close the database. Runs in the executor."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remove(self) -> None:
+        """Close and delete the database files. Runs in the executor."""
+        self._close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self._path}{suffix}").unlink(missing_ok=True)
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored alarms, or None if the database does not exist yet."""
+        await self.async_flush()
+        return await self.hass.async_add_executor_job(self._load)
+
+    async def async_import(self, data: dict[str, Any]) -> None:
+        """Replace the stored alarms with data loaded from another backend."""
+        metadata: dict[str, dict[str, Any]] = data.get("metadata", {})
+        self._async_queue([(_DELETE_ALL_ALARMS, ())])
+        self._async_queue(
+            _upsert(number, timestamp, metadata.get(str(number)))
+            for number, timestamp in zip(
+                data.get("numbers", []), data.get("timestamps", []), strict=False
+            )
+        )
+        await self.async_flush()
+
+    async def async_remove(self) -> None:
+        """Drop pending changes and delete the database."""
+        await self.async_flush()
+        self._pending = []
+        await self.hass.async_add_executor_job(self._remove)
+
+    @callback
+    def async_alarms_saved(self, alarms: Iterable[dict[str, Any]]) -> None:
+        """Queue a row write for each added or changed alarm."""
+        self._async_queue(
+            _upsert(
+                alarm["number"],
+                int(alarm["datetime_obj"].timestamp()),
+                alarm_metadata(alarm),
+            )
+            for alarm in alarms
+        )
+
+    @callback
+    def async_alarms_removed(self, alarm_numbers: Iterable[int]) -> None:
+        """Queue a row delete for each removed alarm."""
+        self._async_queue((_DELETE_ALARM, (number,)) for number in alarm_numbers)
+
+    @callback
+    def async_alarms_cleared(self) -> None:
+        """Queue the removal of every alarm."""
+        self._async_queue([(_DELETE_ALL_ALARMS, ())])
+
+    @callback
+    def _async_queue(self, statements: Iterable[_Statement]) -> None:
+        """Queue statements and make sure a drain task is running."""
+        self._pending.extend(statements)
+        if not self._pending or self._drain_task is not None:
+            return
+        self._drain_task = self.hass.async_create_task(self._async_drain())
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+            )
+
+    async def _async_drain(self) -> None:
+        """Apply queued statements in order until the queue is empty."""
+        try:
+            while self._pending:
+                statements, self._pending = self._pending, []
+                try:
+                    await self.hass.async_add_executor_job(self._execute, statements)
+                except sqlite3.Error:
+                    LOGGER.exception(
+                        "Error writing %s alarm rows to %s",
+                        len(statements),
+                        self._path.name,
+                    )
+                    continue
+                self.writes += 1
+                self.rows += len(statements)
+                self.last_write_rows = len(statements)
+                LOGGER.debug(
+                    "Wrote %s alarm rows to %s (writes: %s, rows: %s)",
+                    len(statements),
+                    self._path.name,
+                    self.writes,
+                    self.rows,
+                )
+        finally:
+            self._drain_task = None
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Write the pending changes before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_close()
+
+    async def async_flush(self) -> None:
+        """Wait until every queued change has been written."""
+        if self._drain_task is not None:
+            # The drain task runs until the queue is empty
+            await self._drain_task
+
+    async def async_close(self) -> None:
+        """Write every queued change and close the database."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_flush()
+        await self.hass.async_add_executor_job(self._close)
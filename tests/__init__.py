@@ -0,0 +1,50 @@
+"""Tests for the wake_up_alarm integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.wake_up_alarm.const import DOMAIN, HASS_DATA_ALARM_MANAGERS
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.wake_up_alarm.alarm_manager import AlarmManager
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    options: dict[str, Any] | None = None,
+    data: dict[str, Any] | None = None,
+    entry_id: str | None = None,
+) -> MockConfigEntry:
+    """Add and set up a config entry of the integration."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=data or {}, options=options or {}, entry_id=entry_id
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def get_manager(hass: HomeAssistant, entry: MockConfigEntry) -> AlarmManager:
+    """Return the alarm manager of an entry."""
+    return hass.data[HASS_DATA_ALARM_MANAGERS][entry.entry_id]
+
+
+async def async_advance_to(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, when: datetime
+) -> None:
+    """Move the clock to `when` and run the timers that became due."""
+    freezer.move_to(when)
+    async_fire_time_changed(hass, when)
+    await hass.async_block_till_done()
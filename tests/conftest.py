@@ -0,0 +1,11 @@
+"""Fixtures for the wake_up_alarm tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components in every test."""
+    del enable_custom_integrations  # Only needed for its side effect
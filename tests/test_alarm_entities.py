@@ -0,0 +1,112 @@
+"""Tests for the window of alarm entities kept with max_alarm_entities."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_ALARM_DATETIME,
+    ATTR_ALARM_NUMBER,
+    CONF_MAX_ALARM_ENTITIES,
+    DOMAIN,
+    SERVICE_ADD_ALARM,
+    SERVICE_DELETE_ALARM_BY_NUMBER,
+)
+
+from . import async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def _alarm_entity_ids(hass: HomeAssistant) -> set[str]:
+    """Return the alarm sensors in the state machine and the registry."""
+    registry = er.async_get(hass)
+    in_states = {
+        state.entity_id
+        for state in hass.states.async_all("sensor")
+        if state.entity_id.startswith("sensor.alarm_")
+    }
+    in_registry = {
+        entry.entity_id
+        for entry in registry.entities.values()
+        if entry.entity_id.startswith("sensor.alarm_")
+    }
+    assert in_states == in_registry
+    return in_states
+
+
+async def _async_add_alarm(hass: HomeAssistant, delay: timedelta) -> None:
+    """Add an alarm `delay` from now through the service."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_ADD_ALARM,
+        {ATTR_ALARM_DATETIME: dt_util.utcnow() + delay},
+        blocking=True,
+    )
+
+
+async def _async_delete_alarm(hass: HomeAssistant, alarm_number: int) -> None:
+    """Delete an alarm by its number through the service."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_DELETE_ALARM_BY_NUMBER,
+        {ATTR_ALARM_NUMBER: alarm_number},
+        blocking=True,
+    )
+
+
+async def test_every_alarm_gets_an_entity(hass: HomeAssistant) -> None:
+    """Without a limit, each alarm has an entity until it is deleted."""
+    await async_setup_entry(hass)
+    for hours in (3, 2, 1):
+        await _async_add_alarm(hass, timedelta(hours=hours))
+    await hass.async_block_till_done()
+    assert _alarm_entity_ids(hass) == {
+        "sensor.alarm_1",
+        "sensor.alarm_2",
+        "sensor.alarm_3",
+    }
+
+    await _async_delete_alarm(hass, 2)
+    await hass.async_block_till_done()
+    assert _alarm_entity_ids(hass) == {"sensor.alarm_1", "sensor.alarm_3"}
+
+
+async def test_earlier_alarm_evicts_the_latest_entity(hass: HomeAssistant) -> None:
+    """An alarm added before the shown ones takes the entity of the latest."""
+    entry = await async_setup_entry(hass, {CONF_MAX_ALARM_ENTITIES: 2})
+    for hours in (3, 2, 1):
+        await _async_add_alarm(hass, timedelta(hours=hours))
+        await hass.async_block_till_done()
+
+    assert _alarm_entity_ids(hass) == {"sensor.alarm_2", "sensor.alarm_3"}
+    assert set(entry.runtime_data.alarm_entities) == {2, 3}
+
+    # Deleting the nearest alarm promotes the evicted one again
+    await _async_delete_alarm(hass, 3)
+    await hass.async_block_till_done()
+    assert _alarm_entity_ids(hass) == {"sensor.alarm_1", "sensor.alarm_2"}
+    assert set(entry.runtime_data.alarm_entities) == {1, 2}
+    assert len(get_manager(hass, entry).get_all_alarms_data()) == 2
+
+
+async def test_evict_then_promote_without_waiting(hass: HomeAssistant) -> None:
+    """An entity evicted and promoted again in one go is not duplicated."""
+    entry = await async_setup_entry(hass, {CONF_MAX_ALARM_ENTITIES: 2})
+    for hours in (3, 2):
+        await _async_add_alarm(hass, timedelta(hours=hours))
+    await hass.async_block_till_done()
+
+    manager = get_manager(hass, entry)
+    nearest = manager.create_alarm(dt_util.utcnow() + timedelta(hours=1))
+    assert nearest is not None
+    await manager.delete_alarm(nearest["number"])
+    await hass.async_block_till_done()
+
+    assert _alarm_entity_ids(hass) == {"sensor.alarm_1", "sensor.alarm_2"}
+    assert set(entry.runtime_data.alarm_entities) == {1, 2}
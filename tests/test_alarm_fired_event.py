@@ -0,0 +1,71 @@
+"""Tests for the alarm fired event entity."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.event import ATTR_EVENT_TYPE
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    CONF_COALESCE_WINDOW,
+    EVENT_TYPE_ALARM_FIRED,
+)
+
+from . import async_advance_to, async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+ENTITY_ID = "event.alarm_fired"
+
+
+async def test_event_written_on_fire(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Each fire writes the entity state once, describing the fired alarm."""
+    entry = await async_setup_entry(hass)
+    assert hass.states.get(ENTITY_ID).state == "unknown"
+    start = dt_util.utcnow().replace(microsecond=0)
+    alarm_time = start + timedelta(minutes=10)
+    alarm = get_manager(hass, entry).create_alarm(alarm_time)
+    assert alarm is not None
+
+    await async_advance_to(hass, freezer, alarm_time)
+
+    state = hass.states.get(ENTITY_ID)
+    assert state.state == alarm_time.isoformat(timespec="milliseconds")
+    assert state.attributes[ATTR_EVENT_TYPE] == EVENT_TYPE_ALARM_FIRED
+    assert state.attributes["alarm_number"] == alarm["number"]
+    assert state.attributes["alarm_numbers"] == [alarm["number"]]
+    assert state.attributes["alarm_datetime"] == alarm_time.isoformat()
+
+
+async def test_coalesced_alarms_fire_one_event(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Alarms coalesced into one fire are reported as a single event."""
+    entry = await async_setup_entry(hass, {CONF_COALESCE_WINDOW: 60})
+    start = dt_util.utcnow().replace(microsecond=0)
+    alarm_time = start + timedelta(minutes=10)
+    alarms = get_manager(hass, entry).create_alarms(
+        [alarm_time, alarm_time + timedelta(seconds=30)]
+    )
+    states = []
+    hass.bus.async_listen(
+        "state_changed",
+        lambda event: states.append(event.data["new_state"])
+        if event.data["entity_id"] == ENTITY_ID
+        else None,
+    )
+
+    await async_advance_to(hass, freezer, alarm_time)
+    await async_advance_to(hass, freezer, alarm_time + timedelta(minutes=1))
+
+    assert len(states) == 1
+    assert states[0].attributes["alarm_number"] == alarms[0]["number"]
+    assert states[0].attributes["alarm_numbers"] == [
+        alarm["number"] for alarm in alarms
+    ]
@@ -0,0 +1,75 @@
+"""Tests for the in-memory index of alarms by number and by time."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.wake_up_alarm.alarm_index import AlarmIndex
+
+START = datetime(2026, 1, 5, 7, 0, tzinfo=UTC)
+
+
+def _alarm(number: int, minutes: int) -> dict:
+    """Return an alarm `minutes` after START."""
+    return {"number": number, "datetime_obj": START + timedelta(minutes=minutes)}
+
+
+def _index(*alarms: dict) -> AlarmIndex:
+    """Return an index holding the given alarms."""
+    index = AlarmIndex()
+    for alarm in alarms:
+        assert index.add(alarm)
+    return index
+
+
+def test_time_order_and_lookup() -> None:
+    """Alarms come out by time, then number, and are found by number."""
+    index = _index(_alarm(3, 10), _alarm(1, 20), _alarm(2, 10))
+
+    assert [alarm["number"] for alarm in index.by_time()] == [2, 3, 1]
+    assert index.first() == _alarm(2, 10)
+    assert index.get(1) == _alarm(1, 20)
+    assert 3 in index
+    assert 4 not in index
+    assert index.iso_times() == [
+        (START + timedelta(minutes=minutes)).isoformat() for minutes in (10, 10, 20)
+    ]
+
+
+def test_add_and_remove() -> None:
+    """Duplicate numbers are refused, and every change bumps the version."""
+    index = _index(_alarm(1, 0))
+    version = index.version
+
+    assert not index.add(_alarm(1, 5))
+    assert index.version == version
+
+    assert index.remove(1) == _alarm(1, 0)
+    assert index.remove(1) is None
+    assert index.version == version + 1
+    assert index.first() is None
+    assert not index
+
+    index.add(_alarm(2, 0))
+    index.clear()
+    assert len(index) == 0
+    assert index.iso_times() == []
+
+
+def test_between_pages_through_a_range() -> None:
+    """A range includes its start, excludes its end, and resumes after a key."""
+    index = _index(
+        *(
+            _alarm(number, minutes)
+            for number, minutes in [(1, 0), (2, 10), (3, 10), (4, 20), (5, 30)]
+        )
+    )
+    start = START + timedelta(minutes=10)
+    end = START + timedelta(minutes=30)
+
+    assert index.count_between(start, end) == 3
+    assert [alarm["number"] for alarm in index.between(start, end)] == [2, 3, 4]
+    after = (START + timedelta(minutes=10), 2)
+    assert [alarm["number"] for alarm in index.between(start, end, after)] == [3, 4]
+    assert [alarm["number"] for alarm in index.between(None, None)] == [1, 2, 3, 4, 5]
+    assert index.count_between(end, start) == 0
@@ -0,0 +1,85 @@
+"""Tests for catching up on alarms that became due while Home Assistant was down."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.wake_up_alarm.const import (
+    CATCH_UP_FIRE_ALL,
+    CATCH_UP_FIRE_LATEST,
+    CATCH_UP_GRACE_PERIOD,
+    CONF_CATCH_UP_GRACE_PERIOD,
+    CONF_CATCH_UP_POLICY,
+    EVENT_ALARMS_CAUGHT_UP,
+    STORAGE_KEY_ALARMS_FORMAT,
+    STORAGE_VERSION,
+)
+
+from . import async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+ENTRY_ID = "catch_up_test"
+STORAGE_KEY = STORAGE_KEY_ALARMS_FORMAT.format(entry_id=ENTRY_ID)
+
+
+@pytest.mark.parametrize(
+    ("policy", "fired", "dropped"),
+    [
+        (CATCH_UP_FIRE_ALL, [1, 5, 2, 3], []),
+        (CATCH_UP_FIRE_LATEST, [3], [1, 5, 2]),
+        (CATCH_UP_GRACE_PERIOD, [2, 3], [1, 5]),
+    ],
+)
+async def test_catch_up_policies(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    policy: str,
+    fired: list[int],
+    dropped: list[int],
+) -> None:
+    """Past-due alarms fire or are dropped in one batch, as the policy says."""
+    # Away from DST changes, so the daily alarm moves on by exactly a day
+    freezer.move_to("2026-01-14 12:00:00+00:00")
+    now = dt_util.utcnow()
+    minutes = {1: -60, 5: -30, 2: -10, 3: -1, 4: 60}
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "numbers": list(minutes),
+            "timestamps": [
+                int((now + timedelta(minutes=offset)).timestamp())
+                for offset in minutes.values()
+            ],
+            "metadata": {"5": {"recurrence": {"repeat": "daily"}}},
+        },
+    }
+    caught_up = async_capture_events(hass, EVENT_ALARMS_CAUGHT_UP)
+
+    entry = await async_setup_entry(
+        hass,
+        {CONF_CATCH_UP_POLICY: policy, CONF_CATCH_UP_GRACE_PERIOD: 15},
+        entry_id=ENTRY_ID,
+    )
+
+    [event] = caught_up
+    assert event.data["policy"] == policy
+    assert event.data["fired_alarm_numbers"] == fired
+    assert event.data["dropped_alarm_numbers"] == dropped
+    # One-shot alarms are gone, the recurring one moved on to tomorrow
+    manager = get_manager(hass, entry)
+    remaining = {a["number"]: a["datetime_obj"] for a in manager.get_all_alarms_data()}
+    assert remaining == {
+        4: now + timedelta(minutes=60),
+        5: now + timedelta(days=1, minutes=-30),
+    }
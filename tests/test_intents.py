@@ -0,0 +1,34 @@
+"""Tests for the intent handlers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.helpers import intent
+
+from custom_components.wake_up_alarm import metrics
+from custom_components.wake_up_alarm.routing import (
+    async_get_alarm_manager_for_intent,
+)
+
+from . import async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_intent_routed_once_and_timed(hass: HomeAssistant) -> None:
+    """The handler gets the manager the intent was routed to for its metric."""
+    entry = await async_setup_entry(hass)
+    with patch.object(
+        metrics,
+        "async_get_alarm_manager_for_intent",
+        wraps=async_get_alarm_manager_for_intent,
+    ) as route:
+        response = await intent.async_handle(hass, "test", "HassGetAlarms", {})
+
+    assert route.call_count == 1
+    assert response.speech["plain"]["speech"] == "You have no active alarms."
+    latencies = get_manager(hass, entry).metrics.as_dict()["latencies"]
+    assert latencies["intent_HassGetAlarms"]["count"] == 1
@@ -0,0 +1,85 @@
+"""Tests for the paged list_alarms service."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import voluptuous as vol
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_CURSOR,
+    ATTR_END,
+    ATTR_LIMIT,
+    ATTR_START,
+    DOMAIN,
+    SERVICE_LIST_ALARMS,
+)
+
+from . import async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def _async_list(hass: HomeAssistant, **service_data: Any) -> dict[str, Any]:
+    """Call list_alarms and return its response."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LIST_ALARMS,
+        service_data,
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    return dict(response)
+
+
+async def test_pages_follow_the_cursor(hass: HomeAssistant) -> None:
+    """Pages continue after the cursor, also through alarms at the same time."""
+    entry = await async_setup_entry(hass)
+    start = dt_util.utcnow().replace(microsecond=0) + timedelta(hours=1)
+    # Alarms 2 and 3 share a time, so the cursor must tell them apart
+    get_manager(hass, entry).create_alarms(
+        [start + timedelta(minutes=minutes) for minutes in (0, 10, 10, 20, 30)]
+    )
+
+    numbers: list[int] = []
+    cursor = None
+    pages = 0
+    while True:
+        data: dict[str, Any] = {ATTR_LIMIT: 2}
+        if cursor:
+            data[ATTR_CURSOR] = cursor
+        response = await _async_list(hass, **data)
+        assert response["count"] == 5
+        numbers.extend(alarm["number"] for alarm in response["alarms"])
+        pages += 1
+        if (cursor := response["next_cursor"]) is None:
+            break
+    assert numbers == [1, 2, 3, 4, 5]
+    assert pages == 3
+
+    response = await _async_list(
+        hass,
+        **{
+            ATTR_START: start + timedelta(minutes=10),
+            ATTR_END: start + timedelta(minutes=30),
+            ATTR_LIMIT: 2,
+        },
+    )
+    assert [alarm["number"] for alarm in response["alarms"]] == [2, 3]
+    assert response["count"] == 3
+    assert (
+        response["alarms"][0]["datetime"] == (start + timedelta(minutes=10)).isoformat()
+    )
+    assert response["next_cursor"] is not None
+
+
+async def test_invalid_cursor(hass: HomeAssistant) -> None:
+    """A cursor that was not handed out by the service is rejected."""
+    await async_setup_entry(hass)
+    with pytest.raises(vol.Invalid):
+        await _async_list(hass, **{ATTR_CURSOR: "not a cursor"})
@@ -0,0 +1,49 @@
+"""Tests for handing out the lowest free alarm number."""
+
+from __future__ import annotations
+
+from custom_components.wake_up_alarm.number_allocator import AlarmNumberAllocator
+
+
+def test_lowest_free_number_first() -> None:
+    """Released numbers are handed out again, lowest first."""
+    allocator = AlarmNumberAllocator()
+    assert allocator.allocate_many(5) == [1, 2, 3, 4, 5]
+
+    allocator.release(4)
+    allocator.release(2)
+    assert allocator.peek() == 2
+    assert allocator.allocate() == 2
+    assert allocator.allocate() == 4
+    assert allocator.allocate() == 6
+
+
+def test_release_the_highest_numbers() -> None:
+    """Releasing the top numbers lowers the high-water mark past free gaps."""
+    allocator = AlarmNumberAllocator()
+    allocator.allocate_many(4)
+    allocator.release(3)
+    allocator.release(4)
+    assert allocator.allocate_many(3) == [3, 4, 5]
+
+    allocator.release(5)
+    allocator.release(5)
+    assert allocator.allocate() == 5
+
+
+def test_reserve_leaves_gaps_free() -> None:
+    """Reserving a number above the others frees the numbers it skips."""
+    allocator = AlarmNumberAllocator()
+    allocator.reserve(4)
+    allocator.reserve(2)
+    assert allocator.allocate_many(3) == [1, 3, 5]
+
+
+def test_rebuild_and_reset() -> None:
+    """The allocator can be rebuilt from the numbers in use, or emptied."""
+    allocator = AlarmNumberAllocator()
+    allocator.rebuild([5, 2, 3])
+    assert allocator.allocate_many(3) == [1, 4, 6]
+
+    allocator.reset()
+    assert allocator.allocate() == 1
@@ -0,0 +1,40 @@
+"""Tests for the pre-alarm events fired ahead of alarms."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.wake_up_alarm.const import (
+    CONF_PRE_ALARM_OFFSETS,
+    EVENT_ALARM_TRIGGERED,
+    EVENT_PRE_ALARM,
+)
+
+from . import async_advance_to, async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+
+async def test_pre_alarms_fire_before_the_alarm(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Each pre-alarm fires its offset before the alarm, which fires after."""
+    entry = await async_setup_entry(hass, {CONF_PRE_ALARM_OFFSETS: ["5", "2"]})
+    pre_alarms = async_capture_events(hass, EVENT_PRE_ALARM)
+    triggered = async_capture_events(hass, EVENT_ALARM_TRIGGERED)
+    start = dt_util.utcnow().replace(microsecond=0)
+    alarm = get_manager(hass, entry).create_alarm(start + timedelta(minutes=10))
+    assert alarm is not None
+
+    for minutes in (5, 8, 10):
+        await async_advance_to(hass, freezer, start + timedelta(minutes=minutes))
+
+    assert [event.data["offset"] for event in pre_alarms] == [5, 2]
+    assert {event.data["alarm_number"] for event in pre_alarms} == {alarm["number"]}
+    assert [event.data["alarm_number"] for event in triggered] == [alarm["number"]]
@@ -0,0 +1,90 @@
+"""Tests for the recurrence rules of repeating alarms."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    REPEAT_DAILY,
+    REPEAT_EVERY_N_DAYS,
+    REPEAT_WEEKDAYS,
+    REPEAT_WEEKLY,
+)
+from custom_components.wake_up_alarm.recurrence import RecurrenceRule
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def _utc(year: int, month: int, day: int, hour: int, minute: int = 0) -> datetime:
+    """Return a Berlin wall-clock time as UTC."""
+    return dt_util.as_utc(datetime(year, month, day, hour, minute, tzinfo=BERLIN))
+
+
+@pytest.fixture(autouse=True)
+async def berlin_time_zone(hass: HomeAssistant) -> None:
+    """Run every test in a time zone with DST changes."""
+    await hass.config.async_set_time_zone("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    ("previous", "expected", "hours_between"),
+    [
+        # Clocks go forward on March 29, so that day is 23 hours long
+        (_utc(2026, 3, 28, 6, 30), _utc(2026, 3, 29, 6, 30), 23),
+        # Clocks go back on October 25, so that day is 25 hours long
+        (_utc(2026, 10, 24, 6, 30), _utc(2026, 10, 25, 6, 30), 25),
+    ],
+)
+def test_daily_keeps_wall_clock_time_across_dst(
+    previous: datetime, expected: datetime, hours_between: int
+) -> None:
+    """A daily alarm rings at the same local time after a DST change."""
+    rule = RecurrenceRule.from_service_data(REPEAT_DAILY)
+    assert rule.next_occurrence(previous, previous) == expected
+    assert expected - previous == timedelta(hours=hours_between)
+
+
+def test_weekdays_roll_over_the_weekend() -> None:
+    """A workday alarm that rings on Friday rings next on Monday."""
+    rule = RecurrenceRule.from_service_data(REPEAT_WEEKDAYS)
+    friday = _utc(2026, 1, 9, 7)
+    assert rule.next_occurrence(friday, friday) == _utc(2026, 1, 12, 7)
+
+
+def test_weekly_rolls_over_to_next_week() -> None:
+    """A weekly alarm on Sunday and Wednesday wraps around the week."""
+    rule = RecurrenceRule.from_service_data(REPEAT_WEEKLY, ["wed", "sun"])
+    sunday = _utc(2026, 1, 11, 8)
+    assert rule.next_occurrence(sunday, sunday) == _utc(2026, 1, 14, 8)
+    wednesday = _utc(2026, 1, 14, 8)
+    assert rule.next_occurrence(wednesday, wednesday) == _utc(2026, 1, 18, 8)
+
+
+def test_every_n_days_skips_missed_periods() -> None:
+    """After a long gap, the next occurrence stays on the rule's period."""
+    rule = RecurrenceRule.from_service_data(REPEAT_EVERY_N_DAYS, interval_days=3)
+    previous = _utc(2026, 1, 1, 7)
+    # Jan 10 07:00 is on the period, but already passed at noon
+    assert rule.next_occurrence(previous, _utc(2026, 1, 10, 12)) == _utc(2026, 1, 13, 7)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        RecurrenceRule.from_service_data(REPEAT_DAILY),
+        RecurrenceRule.from_service_data(REPEAT_WEEKDAYS),
+        RecurrenceRule.from_service_data(REPEAT_WEEKLY, ["tue", "sat"]),
+        RecurrenceRule.from_service_data(REPEAT_EVERY_N_DAYS, interval_days=4),
+    ],
+)
+def test_stored_form_round_trips(rule: RecurrenceRule) -> None:
+    """A rule is stored and loaded back unchanged."""
+    assert RecurrenceRule.from_dict(rule.as_dict()) == rule
@@ -0,0 +1,91 @@
+"""Tests for the single-timer alarm scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.scheduler import JobTiming, async_get_scheduler
+
+from . import async_advance_to
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from datetime import datetime
+    from unittest.mock import MagicMock
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+_TRACK_POINT = "custom_components.wake_up_alarm.scheduler.async_track_point_in_utc_time"
+
+
+def _armed_point(track_point: MagicMock) -> object:
+    """Return the time the scheduler last armed Home Assistant's timer for."""
+    return track_point.call_args.args[2]
+
+
+async def test_early_margin_of_the_earliest_job(hass: HomeAssistant) -> None:
+    """The timer is armed with the margin of the job it is armed for."""
+    scheduler = async_get_scheduler(hass)
+    now = dt_util.utcnow()
+    due: list[Hashable] = []
+
+    with patch(_TRACK_POINT) as track_point:
+        scheduler.async_schedule(
+            "late",
+            now + timedelta(minutes=1),
+            due.extend,
+            timing=JobTiming(early_margin=timedelta(seconds=10)),
+        )
+        assert scheduler.armed_at == now + timedelta(minutes=1)
+        assert _armed_point(track_point) == now + timedelta(seconds=50)
+
+        # An earlier job without a margin is not armed early
+        scheduler.async_schedule("early", now + timedelta(seconds=30), due.extend)
+        assert scheduler.armed_at == now + timedelta(seconds=30)
+        assert _armed_point(track_point) == now + timedelta(seconds=30)
+
+        scheduler.async_cancel("early")
+        assert _armed_point(track_point) == now + timedelta(seconds=50)
+
+        scheduler.async_cancel("late")
+        assert scheduler.armed_at is None
+    assert not due
+
+
+async def test_coalesce_within_group_only(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Only later jobs of the same group, within its window, run together."""
+    scheduler = async_get_scheduler(hass)
+    start = dt_util.utcnow().replace(microsecond=0)
+    batches: list[list[Hashable]] = []
+    coalesced = JobTiming(coalesce_group="a", coalesce_window=timedelta(seconds=10))
+
+    def at(seconds: int) -> datetime:
+        return start + timedelta(seconds=seconds)
+
+    scheduler.async_schedule("a1", at(60), batches.append, coalesced)
+    scheduler.async_schedule("a2", at(65), batches.append, coalesced)
+    scheduler.async_schedule("a3", at(75), batches.append, coalesced)
+    scheduler.async_schedule(
+        "b1", at(62), batches.append, JobTiming(coalesce_group="b")
+    )
+    scheduler.async_schedule("ungrouped", at(63), batches.append)
+
+    await async_advance_to(hass, freezer, at(60))
+    assert batches == [["a1", "a2"]]
+    assert scheduler.armed_at == at(62)
+
+    await async_advance_to(hass, freezer, at(62))
+    await async_advance_to(hass, freezer, at(63))
+    assert batches[1:] == [["b1"], ["ungrouped"]]
+
+    # Outside the window of a1, so a3 waits for its own time
+    await async_advance_to(hass, freezer, at(75))
+    assert batches[3:] == [["a3"]]
+    assert len(scheduler) == 0
@@ -0,0 +1,159 @@
+"""Tests for snoozing ringing alarms."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import voluptuous as vol
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import intent
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_ALARM_DATETIME,
+    ATTR_ALARM_NUMBER,
+    ATTR_MINUTES,
+    ATTR_REPEAT,
+    CONF_SNOOZE_WINDOW,
+    DEFAULT_SNOOZE_WINDOW,
+    DOMAIN,
+    EVENT_ALARM_TRIGGERED,
+    REPEAT_DAILY,
+    SERVICE_ADD_ALARM,
+    SERVICE_SNOOZE,
+    STORAGE_KEY_ALARMS_FORMAT,
+)
+
+from . import async_advance_to, async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+
+async def _async_snooze(hass: HomeAssistant, minutes: int) -> None:
+    """Snooze every ringing alarm through the service."""
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SNOOZE, {ATTR_MINUTES: minutes}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+
+def _alarm_sensors(hass: HomeAssistant) -> list[str]:
+    """Return the entity ids of the alarm sensors."""
+    return [
+        state.entity_id
+        for state in hass.states.async_all("sensor")
+        if state.entity_id.startswith("sensor.alarm_")
+    ]
+
+
+@pytest.mark.parametrize("repeat", [None, REPEAT_DAILY])
+async def test_snooze_keeps_the_alarm_number(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, repeat: str | None
+) -> None:
+    """Snoozed alarms move in place and fire again under the same number."""
+    entry = await async_setup_entry(hass, {CONF_SNOOZE_WINDOW: 10})
+    manager = get_manager(hass, entry)
+    triggered = async_capture_events(hass, EVENT_ALARM_TRIGGERED)
+    start = dt_util.utcnow().replace(second=0, microsecond=0)
+    alarm_time = start + timedelta(minutes=1)
+    service_data: dict[str, object] = {ATTR_ALARM_DATETIME: alarm_time}
+    if repeat:
+        service_data[ATTR_REPEAT] = repeat
+    await hass.services.async_call(
+        DOMAIN, SERVICE_ADD_ALARM, service_data, blocking=True
+    )
+    await hass.async_block_till_done()
+    [alarm] = manager.get_all_alarms_data()
+    number = alarm["number"]
+
+    await async_advance_to(hass, freezer, alarm_time)
+    await _async_snooze(hass, 5)
+    assert [a["number"] for a in manager.get_all_alarms_data()] == [number]
+    assert manager.get_next_alarm_time() == alarm_time + timedelta(minutes=5)
+    assert _alarm_sensors(hass) == [f"sensor.alarm_{number}"]
+
+    await async_advance_to(hass, freezer, alarm_time + timedelta(minutes=5))
+    assert [event.data["alarm_number"] for event in triggered] == [number, number]
+    if repeat:
+        # Back on the day after, at the time it was set for
+        assert manager.get_next_alarm_time() == alarm_time + timedelta(days=1)
+        assert manager.get_alarm(number)["datetime_obj"] == (
+            alarm_time + timedelta(days=1)
+        )
+    assert _alarm_sensors(hass) == [f"sensor.alarm_{number}"]
+
+
+async def test_ringing_alarm_stays_stored(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """A ringing one-shot alarm keeps its record through other writes."""
+    entry = await async_setup_entry(hass, {CONF_SNOOZE_WINDOW: 10})
+    manager = get_manager(hass, entry)
+    storage_key = STORAGE_KEY_ALARMS_FORMAT.format(entry_id=entry.entry_id)
+    start = dt_util.utcnow().replace(microsecond=0)
+    ringing = manager.create_alarm(start + timedelta(minutes=1))
+    assert ringing is not None
+    await async_advance_to(hass, freezer, start + timedelta(minutes=1))
+
+    later = manager.create_alarm(start + timedelta(hours=1))
+    assert later is not None
+    await manager.async_save_alarms_to_store()
+    assert hass_storage[storage_key]["data"]["numbers"] == [
+        ringing["number"],
+        later["number"],
+    ]
+
+    # Once the window ends the alarm is deleted, with its record
+    await async_advance_to(hass, freezer, start + timedelta(minutes=11))
+    await manager.async_save_alarms_to_store()
+    assert hass_storage[storage_key]["data"]["numbers"] == [later["number"]]
+
+
+@pytest.mark.parametrize(
+    ("service_data", "not_ringing"),
+    [
+        ({}, "no alarm is ringing"),
+        ({ATTR_ALARM_NUMBER: 3}, "alarm 3 is not ringing"),
+    ],
+)
+async def test_snooze_warns_when_not_ringing(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    service_data: dict[str, int],
+    not_ringing: str,
+) -> None:
+    """The warning names the alarm that could not be snoozed."""
+    entry = await async_setup_entry(hass, {CONF_SNOOZE_WINDOW: 10})
+    await hass.services.async_call(DOMAIN, SERVICE_SNOOZE, service_data, blocking=True)
+    assert f"Cannot snooze for entry {entry.entry_id}: {not_ringing}." in caplog.text
+
+
+async def test_new_entries_can_snooze(hass: HomeAssistant) -> None:
+    """Entries made by the config flow get a snooze window."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NAME: "Bedroom"}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["options"] == {CONF_SNOOZE_WINDOW: DEFAULT_SNOOZE_WINDOW}
+    assert DEFAULT_SNOOZE_WINDOW > 0
+
+
+async def test_snooze_minutes_validated_alike(hass: HomeAssistant) -> None:
+    """The service and the intent accept the same snooze lengths."""
+    await async_setup_entry(hass, {CONF_SNOOZE_WINDOW: 10})
+    with pytest.raises(vol.Invalid):
+        await _async_snooze(hass, 721)
+    with pytest.raises(intent.InvalidSlotInfo):
+        await intent.async_handle(
+            hass, "test", "HassSnoozeAlarm", {ATTR_MINUTES: {"value": 721}}
+        )
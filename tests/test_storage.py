@@ -0,0 +1,114 @@
+"""Tests for loading and migrating stored alarms."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+
+from custom_components.wake_up_alarm.const import (
+    CONF_STORAGE_BACKEND,
+    STORAGE_BACKEND_SQLITE,
+    STORAGE_KEY_ALARMS_FORMAT,
+    STORAGE_VERSION,
+)
+
+from . import async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+ENTRY_ID = "storage_test"
+STORAGE_KEY = STORAGE_KEY_ALARMS_FORMAT.format(entry_id=ENTRY_ID)
+
+
+async def test_migrate_version_1_alarms(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Version 1 alarm lists load, and are saved back in the version 2 layout."""
+    first = dt_util.utcnow().replace(microsecond=0) + timedelta(hours=1)
+    second = first + timedelta(hours=1)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {"number": 4, "datetime": second.isoformat()},
+            {
+                "number": 2,
+                "datetime": first.replace(tzinfo=None).isoformat(),
+                "recurrence": {"repeat": "daily"},
+            },
+            {"number": 7},
+            {"number": 8, "datetime": "not a datetime"},
+        ],
+    }
+
+    entry = await async_setup_entry(hass, entry_id=ENTRY_ID)
+    manager = get_manager(hass, entry)
+    alarms = {alarm["number"]: alarm for alarm in manager.get_all_alarms_data()}
+    assert set(alarms) == {2, 4}
+    assert alarms[2]["datetime_obj"] == first
+    assert alarms[2]["recurrence"].as_dict() == {"repeat": "daily"}
+    assert alarms[4]["datetime_obj"] == second
+
+    await manager.async_close_store()
+    stored = hass_storage[STORAGE_KEY]
+    assert stored["version"] == STORAGE_VERSION
+    assert sorted(stored["data"]["numbers"]) == [2, 4]
+    assert stored["data"]["metadata"]["2"]["recurrence"] == {"repeat": "daily"}
+
+
+async def test_move_json_alarms_to_sqlite(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Switching to SQLite moves the alarms out of the JSON store."""
+    hass.config.config_dir = str(tmp_path)
+    when = dt_util.utcnow().replace(microsecond=0) + timedelta(hours=1)
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "numbers": [3],
+            "timestamps": [int(when.timestamp())],
+            "metadata": {"3": {"recurrence": {"repeat": "daily"}}},
+        },
+    }
+
+    entry = await async_setup_entry(
+        hass, {CONF_STORAGE_BACKEND: STORAGE_BACKEND_SQLITE}, entry_id=ENTRY_ID
+    )
+    manager = get_manager(hass, entry)
+    [alarm] = manager.get_all_alarms_data()
+    assert alarm["number"] == 3
+    assert alarm["datetime_obj"] == when
+    assert alarm["recurrence"].as_dict() == {"repeat": "daily"}
+    assert STORAGE_KEY not in hass_storage
+
+    await manager.async_close_store()
+    assert (tmp_path / ".storage" / f"{STORAGE_KEY}.db").exists()
+
+
+async def test_write_size_stats(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """The store reports the size in bytes of the alarm data it wrote."""
+    entry = await async_setup_entry(hass, entry_id=ENTRY_ID)
+    manager = get_manager(hass, entry)
+    start = dt_util.utcnow() + timedelta(hours=1)
+    manager.create_alarms([start, start + timedelta(hours=1)])
+    await manager.async_save_alarms_to_store()
+    first_write = len(json_bytes(hass_storage[STORAGE_KEY]["data"]))
+    assert manager.store_stats["last_write_bytes"] == first_write
+
+    manager.create_alarm(start + timedelta(hours=2))
+    await manager.async_save_alarms_to_store()
+    second_write = len(json_bytes(hass_storage[STORAGE_KEY]["data"]))
+    assert second_write > first_write
+    assert manager.store_stats["last_write_bytes"] == second_write
+    assert manager.store_stats["bytes_written"] == first_write + second_write
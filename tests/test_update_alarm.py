@@ -0,0 +1,73 @@
+"""Tests for moving an existing alarm with the update_alarm service."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.wake_up_alarm.const import (
+    ATTR_ALARM_DATETIME,
+    ATTR_ALARM_NUMBER,
+    DOMAIN,
+    EVENT_ALARM_TRIGGERED,
+    SERVICE_UPDATE_ALARM,
+)
+
+from . import async_advance_to, async_setup_entry, get_manager
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+
+async def test_update_alarm_in_place(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """The alarm keeps its number and entity, and fires at its new time."""
+    entry = await async_setup_entry(hass)
+    manager = get_manager(hass, entry)
+    triggered = async_capture_events(hass, EVENT_ALARM_TRIGGERED)
+    start = dt_util.utcnow().replace(microsecond=0)
+    first = manager.create_alarm(start + timedelta(hours=2))
+    second = manager.create_alarm(start + timedelta(hours=3))
+    assert first is not None
+    assert second is not None
+    await hass.async_block_till_done()
+    registry_entry = er.async_get(hass).async_get("sensor.alarm_2")
+    assert registry_entry is not None
+
+    new_time = start + timedelta(hours=1)
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_UPDATE_ALARM,
+        {ATTR_ALARM_NUMBER: second["number"], ATTR_ALARM_DATETIME: new_time},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert manager.get_next_alarm_time() == new_time
+    assert [alarm["number"] for alarm in manager.get_all_alarms_data()] == [2, 1]
+    assert er.async_get(hass).async_get("sensor.alarm_2") == registry_entry
+    state = hass.states.get("sensor.alarm_2")
+    assert state is not None
+    assert dt_util.parse_datetime(state.state) == new_time
+
+    await async_advance_to(hass, freezer, new_time)
+    assert [event.data["alarm_number"] for event in triggered] == [2]
+    assert manager.get_alarm(2) is None
+    assert manager.pending_timer_count == 1
+
+
+async def test_update_missing_alarm(hass: HomeAssistant) -> None:
+    """Updating an alarm that does not exist changes nothing."""
+    entry = await async_setup_entry(hass)
+    manager = get_manager(hass, entry)
+    when = dt_util.utcnow().replace(microsecond=0) + timedelta(hours=1)
+    manager.create_alarm(when)
+
+    assert manager.update_alarm(5, when + timedelta(hours=1)) is None
+    assert manager.get_next_alarm_time() == when